@@ -0,0 +1,140 @@
+"""Headless benchmark of one dashboard rerun per tab at several catalog sizes.
+
+Each (scale, tab) pair runs in a fresh subprocess under Streamlit's AppTest,
+so peak RSS is per measurement. Records the cold run and a warm rerun, the
+serialized Plotly payload, and the number of DataFrames constructed.
+Results are written as JSON and checked against ``thresholds.json``; the exit
+status is non-zero on any regression.
+
+    python -m benchmarks.bench_dashboard --scales 471 10000 --output bench.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'amazon_dashboard.py'
+THRESHOLDS = Path(__file__).resolve().parent / 'thresholds.json'
+SCALES = [471, 10_000, 100_000, 1_000_000]
+TABS = ['Overview', 'Predictive Power', 'Volatility Warning', 'Category Risk']
+
+
+def measure(tab):
+    """Run inside the subprocess: FEATURE_STORE already points at the synthetic store."""
+    import inspect
+    import resource
+    import time
+
+    import pandas as pd
+    from streamlit.testing.v1 import AppTest
+
+    # Count frames built through the public constructor and pandas' internal one
+    constructed = [0]
+    original_init = pd.DataFrame.__init__
+    original_from_mgr = inspect.getattr_static(pd.DataFrame, '_from_mgr', None)
+
+    def counting_init(self, *args, **kwargs):
+        constructed[0] += 1
+        original_init(self, *args, **kwargs)
+
+    pd.DataFrame.__init__ = counting_init
+    if original_from_mgr is not None:
+        def counting_from_mgr(cls, *args, **kwargs):
+            constructed[0] += 1
+            return original_from_mgr.__func__(cls, *args, **kwargs)
+
+        pd.DataFrame._from_mgr = classmethod(counting_from_mgr)
+
+    at = AppTest.from_file(str(APP), default_timeout=600)
+    at.session_state['active_tab'] = tab
+    started = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - started
+    cold_frames = constructed[0]
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    started = time.perf_counter()
+    at.run()
+    warm = time.perf_counter() - started
+
+    return {
+        'tab': tab,
+        'cold_seconds': round(cold, 3),
+        'warm_seconds': round(warm, 3),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'figure_bytes': sum(len(chart.proto.spec) for chart in at.get('plotly_chart')),
+        'dataframes': cold_frames,
+    }
+
+
+def run_scale(scale, workdir):
+    store = Path(workdir) / f"store-{scale}"
+    env = dict(os.environ, FEATURE_STORE=str(store), PYTHONPATH=str(ROOT))
+    env.pop('EARLY_STATS_STATE', None)
+    if not (store / 'manifest.json').exists():
+        # Build out of process: forked children inherit this process's peak RSS
+        subprocess.run([sys.executable, '-m', 'benchmarks.bench_dashboard', '--build', str(scale)],
+                       cwd=ROOT, env=env, check=True)
+    results = []
+    for tab in TABS:
+        out = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_dashboard', '--measure', tab],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        result['scale'] = scale
+        results.append(result)
+        print(f"{scale:>9,} {tab:<20} cold {result['cold_seconds']:7.2f}s  warm {result['warm_seconds']:6.2f}s  "
+              f"rss {result['peak_rss_mb']:7.1f}MB  figures {result['figure_bytes'] / 1024:8.1f}KB  "
+              f"frames {result['dataframes']}", file=sys.stderr)
+    return results
+
+
+def check(results, thresholds):
+    """Threshold violations, as messages. Thresholds are keyed by scale, then metric."""
+    failures = []
+    for result in results:
+        limits = thresholds.get(str(result['scale']), {})
+        for metric, limit in limits.items():
+            if result[metric] > limit:
+                failures.append(f"{result['scale']} / {result['tab']}: {metric} {result[metric]} > {limit}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dashboard reruns at synthetic scales.')
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES)
+    parser.add_argument('--output', default='bench_output.json')
+    parser.add_argument('--thresholds', default=str(THRESHOLDS))
+    parser.add_argument('--workdir', help='keep synthetic stores here between runs')
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--build', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(measure(args.measure)))
+        return 0
+    if args.build:
+        from benchmarks.synthetic import build_synthetic_store
+        build_synthetic_store(os.environ['FEATURE_STORE'], args.build)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        results = [r for scale in args.scales for r in run_scale(scale, workdir)]
+
+    thresholds = json.loads(Path(args.thresholds).read_text()) if Path(args.thresholds).exists() else {}
+    failures = check(results, thresholds)
+    Path(args.output).write_text(json.dumps({'results': results, 'failures': failures}, indent=2))
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Cold-start benchmark for new dashboard worker processes.
+
+Each sample is a fresh interpreter, so nothing is warm in ``sys.modules``
+or the shared cache. Two things are measured: importing the app module, and
+a first full page run in fixture mode. The median of ``--runs`` samples is
+checked against ``startup_budget.json``. The budget also lists modules that
+must not be imported before first use. The exit status is non-zero when the
+budget is exceeded.
+
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'amazon_dashboard.py'
+BUDGET = Path(__file__).resolve().parent / 'startup_budget.json'
+
+IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import product_success.app
+print(json.dumps({'seconds': time.perf_counter() - started, 'modules': sorted(sys.modules)}))
+"""
+
+RENDER_PROBE = f"""
+import json, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({str(APP)!r}, default_timeout=120).run()
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+print(json.dumps({{'seconds': time.perf_counter() - started}}))
+"""
+
+
+def sample(probe, env):
+    out = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def check(result, budget):
+    failures = []
+    for metric in ('import_seconds', 'first_render_seconds'):
+        if metric in budget and result[metric] > budget[metric]:
+            failures.append(f"{metric} {result[metric]} > {budget[metric]}")
+    for module in result['deferred_loaded']:
+        failures.append(f"{module} is imported at startup")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure dashboard cold-start time.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', default='bench_startup.json')
+    parser.add_argument('--budget', default=str(BUDGET))
+    args = parser.parse_args(argv)
+
+    budget = json.loads(Path(args.budget).read_text()) if Path(args.budget).exists() else {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fixture mode: no feature store, no live state
+        env = dict(os.environ, PYTHONPATH=str(ROOT), FEATURE_STORE=str(Path(tmp) / 'missing'),
+                   EARLY_STATS_STATE=str(Path(tmp) / 'missing.npz'), DRIFT_FEED=str(Path(tmp) / 'missing.jsonl'))
+        imports = [sample(IMPORT_PROBE, env) for _ in range(args.runs)]
+        renders = [sample(RENDER_PROBE, env) for _ in range(args.runs)]
+
+    loaded = set.union(*(set(run['modules']) for run in imports))
+    result = {
+        'runs': args.runs,
+        'import_seconds': round(statistics.median(run['seconds'] for run in imports), 3),
+        'first_render_seconds': round(statistics.median(run['seconds'] for run in renders), 3),
+        'deferred_loaded': [m for m in budget.get('deferred_modules', []) if m in loaded],
+    }
+    failures = check(result, budget)
+    Path(args.output).write_text(json.dumps({'result': result, 'failures': failures}, indent=2))
+    print(f"import {result['import_seconds']:.2f}s | first render {result['first_render_seconds']:.2f}s "
+          f"(median of {args.runs})", file=sys.stderr)
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Local HTTP load generator for the scoring service.
+
+Fires concurrent ``POST /score`` requests, each carrying a batch of synthetic
+products, and reports request and product throughput with latency
+percentiles. Start the service first, or pass ``--spawn`` to launch it with
+uvicorn.
+
+    python -m benchmarks.load_service --spawn --concurrency 8 --batch 2000 --requests 200
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_features
+
+
+def make_body(batch, seed, features):
+    products = synthetic_features(batch, seed).reset_index()
+    missing = [c for c in features if c not in products]
+    if missing:
+        raise SystemExit(f"error: synthetic products lack model features: {', '.join(missing)}")
+    columns = ['product_id'] + list(features)
+    return json.dumps({'products': products[columns].to_dict(orient='records')}).encode()
+
+
+def wait_ready(url, timeout=30):
+    """Block until ``/health`` answers 200 and return its payload."""
+    target = urlparse(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(target.hostname, target.port, timeout=2)
+            conn.request('GET', '/health')
+            response = conn.getresponse()
+            if response.status == 200:
+                return json.loads(response.read())
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"service at {url} not ready after {timeout}s")
+
+
+def run(url, bodies, requests, concurrency):
+    target = urlparse(url)
+
+    def worker(indices):
+        conn = http.client.HTTPConnection(target.hostname, target.port, timeout=120)
+        latencies = []
+        for i in indices:
+            started = time.perf_counter()
+            conn.request('POST', '/score', bodies[i % len(bodies)], {'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        parts = pool.map(worker, [range(w, requests, concurrency) for w in range(concurrency)])
+        latencies = np.concatenate([np.asarray(p) for p in parts])
+    return time.perf_counter() - started, latencies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load-test the scoring service.')
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch', type=int, default=1000, help='products per request')
+    parser.add_argument('--spawn', action='store_true', help='start the service with uvicorn')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='uvicorn workers with --spawn')
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.spawn:
+        port = str(urlparse(args.url).port)
+        server = subprocess.Popen([sys.executable, '-m', 'uvicorn', 'product_success.service:app',
+                                   '--port', port, '--workers', str(args.workers), '--log-level', 'warning'])
+    try:
+        health = wait_ready(args.url)
+        bodies = [make_body(args.batch, seed, health['features']) for seed in range(8)]
+        elapsed, latencies = run(args.url, bodies, args.requests, args.concurrency)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    print(f"{args.requests} requests x {args.batch} products, concurrency {args.concurrency}")
+    print(f"{args.requests / elapsed:,.1f} req/s | {args.requests * args.batch / elapsed:,.0f} products/s | "
+          f"latency p50 {p50:.1f}ms p95 {p95:.1f}ms p99 {p99:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Synthetic feature stores at arbitrary product counts for benchmarking."""
+import numpy as np
+import pandas as pd
+
+from product_success import clustering, cube
+from product_success.feature_store import build_store
+
+CATEGORIES = ['Beauty', 'Electronics', 'Pet_Supplies']
+
+
+def synthetic_features(n_products, seed=0):
+    """Per-product features shaped like ingest output, with a rating/volatility mix like the real catalog."""
+    rng = np.random.default_rng(seed)
+    category = rng.choice(CATEGORIES, n_products, p=[0.4, 0.35, 0.25])
+    risky = rng.random(n_products) < np.where(category == 'Beauty', 0.35, 0.15)
+    early = np.where(risky, rng.uniform(2.0, 4.2, n_products), rng.uniform(3.9, 5.0, n_products))
+    volatility = np.where(risky, rng.uniform(0.9, 1.8, n_products), rng.uniform(0.3, 1.1, n_products))
+    oneyear = np.clip(early + rng.normal(0, 0.15, n_products), 1.0, 5.0)
+    first_review = rng.integers(1_420_070_400, 1_703_980_800, n_products)
+    five = np.clip((early - 1) / 4 - volatility / 4 + rng.normal(0, 0.05, n_products), 0, 1)
+    one = np.clip((5 - early) / 8 + rng.normal(0, 0.03, n_products), 0, 1)
+    return pd.DataFrame({
+        'category': category,
+        'first_review': first_review,
+        'early_avg_rating': early.astype(np.float32),
+        'early_rating_std': volatility.astype(np.float32),
+        'early_1star_rate': one.astype(np.float32),
+        'early_5star_rate': five.astype(np.float32),
+        'n_reviews': rng.integers(100, 5000, n_products),
+        'oneyear_avg_rating': oneyear.astype(np.float32),
+        'early_avg_sentiment': np.clip((early - 3) / 2 + rng.normal(0, 0.2, n_products), -1, 1).astype(np.float32),
+    }, index=pd.Index([f"P{i:08d}" for i in range(n_products)], name='product_id'))
+
+
+def build_synthetic_store(root, n_products, seed=0):
+    """Feature store with products, the rollup cube and a fitted k-means model."""
+    store = build_store(root, synthetic_features(n_products, seed))
+    cube.save_cube(store, cube.build(store))
+    model = clustering.MiniBatchKMeans(2).fit_batches(clustering.store_batches(store), epochs=2)
+    clustering.save_model(store, model)
+    return store
@@ -0,0 +1 @@
+"""Data pipeline behind the Amazon Product Success Prediction dashboard."""
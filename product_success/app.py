@@ -0,0 +1,438 @@
+"""The Streamlit dashboard.
+
+``main()`` renders one run of the page. ``amazon_dashboard.py`` only imports
+and calls it, so a new worker process pays for imports once and loads data
+lazily on first use through the shared cache. The plotting libraries are
+imported by ``product_success.figures`` when the first figure is built.
+"""
+import os
+import time
+
+import streamlit as st
+
+from . import cards, data, figures, scoring, whatif
+from .cache import DEFAULT_MAXSIZE, LRUCache, make_key
+from .loader import DEFAULT_TIMEOUT, Loader, parse_timeouts
+from .metrics import Metrics
+from .theme import COLORS
+
+# Set DASHBOARD_LAZY_TABS=0 to run every tab on each rerun
+LAZY_TABS = os.environ.get('DASHBOARD_LAZY_TABS', '1') != '0'
+LIVE_REFRESH_SECONDS = float(os.environ.get('DASHBOARD_LIVE_REFRESH', 10))
+# Seconds each data source may take before its tab shows a pending notice;
+# DASHBOARD_LOAD_TIMEOUTS overrides single sources, e.g. "kmeans_data=30"
+LOAD_TIMEOUT = float(os.environ.get('DASHBOARD_LOAD_TIMEOUT', DEFAULT_TIMEOUT))
+LOAD_TIMEOUTS = parse_timeouts(os.environ.get('DASHBOARD_LOAD_TIMEOUTS'))
+# Set DASHBOARD_PREFETCH_TABS=1 to also load closed tabs' data in the background
+PREFETCH_TABS = os.environ.get('DASHBOARD_PREFETCH_TABS', '0') == '1'
+# Prometheus text file with section timings, bytes sent and cache counters
+METRICS_FILE = os.environ.get('DASHBOARD_METRICS_FILE')
+
+
+# Instrumentation shared by all sessions
+@st.cache_resource
+def shared_metrics():
+    return Metrics()
+
+
+# Loaded tables and built figures are memoized in one cache shared by all sessions
+@st.cache_resource
+def shared_cache():
+    return LRUCache(int(os.environ.get('DASHBOARD_CACHE_SIZE', DEFAULT_MAXSIZE)))
+
+
+@st.cache_resource
+def shared_loader():
+    return Loader(timeout=LOAD_TIMEOUT, timeouts=LOAD_TIMEOUTS)
+
+
+def refresh_every(version):
+    """Live fragments poll only while their source exists."""
+    return LIVE_REFRESH_SECONDS if version is not None else None
+
+
+def header_css():
+    return f"""
+        <style>
+        .main {{
+            background-color: {COLORS['light']};
+        }}
+        .stTabs [data-baseweb="tab-list"] {{
+            gap: 10px;
+        }}
+        .stTabs [data-baseweb="tab"] {{
+            background-color: white;
+            border: 2px solid {COLORS['primary']};
+            border-radius: 8px 8px 0 0;
+            padding: 12px 24px;
+            font-weight: bold;
+            color: {COLORS['dark']};
+        }}
+        .stTabs [aria-selected="true"] {{
+            background-color: {COLORS['primary']};
+            color: white !important;
+        }}
+        </style>
+    """
+
+
+class Dashboard:
+    """One run of the page: the store version it reads and the shared cache and metrics."""
+
+    def __init__(self, store, cache, perf):
+        self.store = store
+        self.version = data.data_version(store)
+        self.cache = cache
+        self.perf = perf
+
+    def markdown(self, body, **kwargs):
+        self.perf.add_bytes('html', len(body.encode()))
+        st.markdown(body, **kwargs)
+
+    def cached(self, name, build, **params):
+        return self.cache.get_or_build(make_key(name, self.version, params), build)
+
+    def load(self, name, **params):
+        return self.cached(name, lambda: data.load(name, self.store, **params), **params)
+
+    def chart(self, name, build=None, table=None, **params):
+        """Build (cached) and send one Plotly chart, timing it and counting its payload."""
+        if build is None:
+            builder = getattr(figures, name)
+            build = lambda: builder(self.load(table or name, **params))
+        with self.perf.section(f"chart:{name}"):
+            fig = self.cached(name + '_figure', build, **params)
+            self.perf.add_bytes('plotly', self.cached(name + '_payload', lambda: len(fig.to_json()), **params))
+            st.plotly_chart(fig, use_container_width=True)
+
+    def best_model(self):
+        return data.best_model(self.load('model_performance'))
+
+    # TAB 1: OVERVIEW
+    def overview(self, filters):
+        best = self.best_model()
+
+        # Metric Cards
+        with self.perf.section('cards:overview_metrics'):
+            for col, html in zip(st.columns(4), cards.overview_metrics(best)):
+                with col:
+                    self.markdown(html, unsafe_allow_html=True)
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Insights Cards
+        with self.perf.section('cards:overview_insights'):
+            for col, html in zip(st.columns(3), cards.overview_insights()):
+                with col:
+                    self.markdown(html, unsafe_allow_html=True)
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Model Performance Chart
+        self.markdown("### Model Performance Comparison")
+        self.chart('model_performance')
+
+    # TAB 2: PREDICTIVE POWER
+    def predictive_power(self, filters):
+        best = self.best_model()
+        trajectory = self.load('trajectory_summary')
+
+        self.markdown(cards.predictive_banner(best), unsafe_allow_html=True)
+
+        # Stats Grid
+        with self.perf.section('cards:predictive_stats'):
+            for col, html in zip(st.columns(3), cards.predictive_stats(best, trajectory)):
+                with col:
+                    self.markdown(html, unsafe_allow_html=True)
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Product Rating Trajectories
+        self.markdown("### Product Rating Trajectories: Early to 1-Year")
+        self.markdown("""
+        This visualization shows how products' ratings evolve from their first 100 reviews to one-year performance. 
+        The tight clustering along the diagonal demonstrates that early ratings are highly predictive of long-term success.
+        """)
+
+        self.chart('trajectories', table='trajectory_data')
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # K-Means Clustering
+        self.markdown("### K-Means Clustering Analysis")
+        self.markdown("""
+        Unsupervised clustering reveals two distinct product groups based on early review characteristics. 
+        Elite Performers show high ratings with low volatility, while High Risk products exhibit lower ratings and greater inconsistency.
+        """)
+
+        self.chart('clusters', lambda: figures.clusters(self.load('kmeans_data'), self.load('cluster_thresholds')))
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Model Performance Table
+        self.markdown("### Model Performance Metrics")
+
+        st.dataframe(self.cached('model_table', lambda: figures.model_table(self.load('model_performance'))),
+                     use_container_width=True, hide_index=True)
+
+    # Sidebar filters slice the precomputed rollup cube; only offered when one has been built
+    def sidebar_filters(self):
+        dims = self.load('cube_dimensions')
+        if dims is None:
+            return {}
+
+        with st.sidebar:
+            self.markdown("### Filters")
+            categories = st.multiselect("Category", dims['categories'], default=dims['categories'])
+            years = dims['years']
+            if years[0] < years[1]:
+                years = st.slider("First review year", years[0], years[1], value=years)
+            tiers = st.multiselect("Alert tier", ['RED', 'YELLOW', 'GREEN'], default=['RED', 'YELLOW', 'GREEN'])
+
+        filters = {}
+        if set(categories) != set(dims['categories']):
+            filters['categories'] = tuple(categories)
+        if tuple(years) != tuple(dims['years']):
+            filters['years'] = tuple(years)
+        if len(tiers) < 3:
+            filters['tiers'] = tuple(tiers)
+        return filters
+
+    # Without scored products in the store, alert counts follow the incremental early-stats state
+    def alert_chart(self, filters):
+        live = data.live_alert_version(self.store) if not filters else None
+        build = lambda: figures.alert_distribution(data.alert_distribution(self.store, **filters))
+        self.chart('alert_distribution', build, live=live, **filters)
+        if live is not None:
+            st.caption("Live counts from incremental early-review statistics: every product with two or more "
+                       "early reviews so far. This is a different population from the rule precision and recall, "
+                       "which need 1-year ratings.")
+
+    # Rolling-window drift alerts, tailed from the monitor's feed while it runs
+    def drift_feed(self):
+        if data.drift_version() is None:
+            return
+        alerts = data.drift_alerts()
+
+        self.markdown("<br>", unsafe_allow_html=True)
+        self.markdown("### Live Drift Alerts")
+        counts = alerts['alert'].value_counts()
+        st.caption(f"Latest {len(alerts)} alerts: {counts.get('volatility', 0)} volatility crossings above 1.0, "
+                   f"{counts.get('rating', 0)} rolling ratings below 4.0")
+        st.dataframe(
+            alerts,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'time': st.column_config.DatetimeColumn("Review time", format="YYYY-MM-DD HH:mm"),
+                'product_id': "Product",
+                'alert': "Alert",
+                'rolling_mean': st.column_config.NumberColumn("Rolling rating", format="%.2f"),
+                'rolling_std': st.column_config.NumberColumn("Rolling volatility", format="%.2f"),
+                'reviews': "Reviews",
+            }
+        )
+
+    # What-if explorer: every slider move is a few lookups in the precomputed threshold index
+    def what_if(self, index, filters):
+        self.markdown("<br>", unsafe_allow_html=True)
+        self.markdown("### What-If Threshold Explorer")
+        st.caption("Move the thresholds to see how many products the rule would flag and how precise it would be. "
+                   "Category and year filters apply; the alert tier filter does not.")
+
+        rating_first, rating_last, rating_step = whatif.RATING_STEPS
+        volatility_first, volatility_last, volatility_step = whatif.VOLATILITY_STEPS
+        slice_ = {'categories': filters.get('categories'), 'years': filters.get('years')}
+
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            rating = st.slider("Flag early rating below", rating_first, rating_last,
+                               value=scoring.RATING_THRESHOLD, step=rating_step, key='whatif_rating')
+            volatility = st.slider("...and volatility above", volatility_first, volatility_last,
+                                   value=scoring.VOLATILITY_THRESHOLD, step=volatility_step, key='whatif_volatility')
+            category_thresholds = None
+            if index.categories and st.toggle("Per-category rating cutoffs", key='whatif_per_category'):
+                category_thresholds = {
+                    category: round(st.slider(f"{category} rating below", rating_first, rating_last,
+                                              value=scoring.CATEGORY_THRESHOLDS.get(category, scoring.RATING_THRESHOLD),
+                                              step=rating_step, key=f"whatif_{category}"), 2)
+                    for category in index.categories
+                }
+
+            with self.perf.section('whatif:counts'):
+                per_tier, failed_per_tier = index.counts(round(rating, 2), round(volatility, 2),
+                                                         category_thresholds, **slice_)
+                rule = scoring.tier_metrics(per_tier, failed_per_tier)
+                base = index.rule_metrics(**slice_)
+
+            flagged, precision, recall = st.columns(3)
+            flagged.metric("Flagged", f"{rule['flagged']:,}", f"{rule['flagged'] - base['flagged']:+,}",
+                           delta_color='off')
+            precision.metric("Precision", f"{rule['precision']:.1f}%", f"{rule['precision'] - base['precision']:+.1f}")
+            recall.metric("Recall", f"{rule['recall']:.1f}%", f"{rule['recall'] - base['recall']:+.1f}")
+            st.caption(f"Change against the recommended rule (rating <{scoring.RATING_THRESHOLD}, "
+                       f"volatility >{scoring.VOLATILITY_THRESHOLD}) | {rule['flagged_share']:.1f}% of "
+                       f"{rule['products']:,} products flagged")
+
+        with col2:
+            with self.perf.section('chart:whatif_distribution'):
+                fig = figures.alert_distribution(scoring.tier_distribution(per_tier))
+                self.perf.add_bytes('plotly', len(fig.to_json()))
+                st.plotly_chart(fig, use_container_width=True, key='whatif_distribution')
+
+    # TAB 3: VOLATILITY WARNING
+    def volatility_warning(self, filters):
+        rule = self.load('rule_summary')
+
+        self.markdown(cards.volatility_banner(rule), unsafe_allow_html=True)
+
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            self.markdown("### Feature Importance Rankings")
+
+            self.chart('feature_importance')
+
+        with col2:
+            self.markdown("### Alert Distribution")
+
+            # Shortened explanation
+            self.markdown(f"""
+            **Risk Classification:**
+
+            - **RED**: Rating <4.0 AND volatility >1.0 → {rule['precision']:.1f}% precision when flagged
+            - **YELLOW**: Warning signs → {rule['yellow_fail']:.1f}% fail
+            - **GREEN**: Strong & stable → {rule['green_fail']:.1f}% fail
+            """)
+
+            st.fragment(self.alert_chart, run_every=refresh_every(data.live_alert_version(self.store)))(filters)
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Warning Rule
+        self.markdown(cards.rule_box(rule), unsafe_allow_html=True)
+
+        index = data.threshold_index(self.store)
+        if index is not None:
+            st.fragment(self.what_if)(index, filters)
+
+        st.fragment(self.drift_feed, run_every=refresh_every(data.drift_version()))()
+
+    # TAB 4: CATEGORY RISK
+    def category_risk(self, filters):
+        self.markdown(cards.category_banner(), unsafe_allow_html=True)
+
+        # Explanation of Failure Risk
+        self.markdown(cards.failure_explainer(), unsafe_allow_html=True)
+
+        # Failure Rate Chart
+        self.markdown("### Failure Rate by Category")
+
+        self.chart('category_failure', **filters)
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Top Complaint Patterns
+        self.markdown("### Top 15 Complaint Patterns in Failed Products")
+        self.markdown("""
+        Most frequent complaint phrases from negative reviews of 120 failed products.
+        """)
+
+        categories = self.load('complaint_categories')
+        category = None
+        if categories:
+            category = st.selectbox("Category", [None] + categories, format_func=lambda c: c or "All categories")
+
+        self.chart('complaint_patterns', category=category)
+
+        self.markdown("<br>", unsafe_allow_html=True)
+
+        # Category Cards
+        with self.perf.section('cards:category_risk'):
+            for col, html in zip(st.columns(3), cards.category_cards()):
+                with col:
+                    self.markdown(html, unsafe_allow_html=True)
+
+
+# Tables each tab reads before drawing; loaded concurrently into the shared cache
+def tab_sources(filters):
+    return {
+        'overview': [('model_performance', {})],
+        'predictive_power': [('model_performance', {}), ('trajectory_data', {}), ('trajectory_summary', {}),
+                             ('kmeans_data', {}), ('cluster_thresholds', {})],
+        'volatility_warning': [('rule_summary', {}), ('feature_importance', {})],
+        'category_risk': [('category_failure', filters), ('complaint_categories', {}),
+                          ('complaint_patterns', {'category': None})],
+    }
+
+
+def main():
+    rerun_started = time.perf_counter()
+
+    # Page config
+    st.set_page_config(
+        page_title="Amazon Product Success Prediction",
+        page_icon="🛍️",
+        layout="wide",
+        initial_sidebar_state="collapsed"
+    )
+
+    perf = shared_metrics()
+    perf.rerun()
+    # Data: feature store when one has been built, built-in tables otherwise
+    page = Dashboard(data.open_store(), shared_cache(), perf)
+    page.cache.retain_version(page.version)
+
+    with perf.section('header'):
+        # Custom CSS - Fixed tab visibility
+        page.markdown(header_css(), unsafe_allow_html=True)
+        # Header with Amazon logo
+        page.markdown(cards.header(), unsafe_allow_html=True)
+
+    page.markdown("<br>", unsafe_allow_html=True)
+
+    # Tabs: in lazy mode only the open tab runs; switching tabs reruns the script
+    # and the cached figures make revisits cheap
+    tabs = st.tabs(
+        ['Overview', 'Predictive Power', 'Volatility Warning', 'Category Risk'],
+        key='active_tab',
+        on_change='rerun' if LAZY_TABS else 'ignore'
+    )
+
+    filters = page.sidebar_filters()
+
+    # Open tabs show a placeholder and are drawn in the order their data arrives;
+    # closed tabs load nothing unless prefetching is switched on
+    renders = {}
+    for tab, render in zip(tabs, [page.overview, page.predictive_power, page.volatility_warning, page.category_risk]):
+        if tab.open is not False:
+            with tab:
+                renders[render.__name__] = (st.empty(), render)
+                renders[render.__name__][0].caption("Loading…")
+    sources = tab_sources(filters)
+    if not PREFETCH_TABS:
+        sources = {name: sources[name] for name in renders}
+    batch = shared_loader().fetch(sources, page.load)
+
+    # Footer
+    page.markdown(cards.footer(), unsafe_allow_html=True)
+
+    for name, pending in batch.ready(renders):
+        skeleton, render = renders[name]
+        with skeleton.container(), perf.section(f"tab:{name}"):
+            if pending:
+                st.info(f"Still loading {', '.join(pending)}. It keeps loading in the background.")
+                st.button("Retry", key=f"retry_{name}")
+            else:
+                render(filters)
+
+    # Debug panel (?debug=1) and metrics export
+    if st.query_params.get('debug') == '1':
+        with st.expander("Performance", expanded=True):
+            st.dataframe(perf.snapshot(), use_container_width=True, hide_index=True)
+            st.json({'cache': page.cache.stats(), 'bytes_sent': perf.bytes_sent, 'reruns': perf.reruns})
+
+    perf.observe('rerun', time.perf_counter() - rerun_started)
+    if METRICS_FILE:
+        perf.write_prometheus(METRICS_FILE, page.cache.stats())
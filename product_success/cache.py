@@ -0,0 +1,108 @@
+"""Bounded LRU cache shared by all dashboard sessions.
+
+Entries are keyed on ``(name, data_version, params)``: a new feature store
+version makes older entries unreachable, and ``retain_version`` drops them
+eagerly. Concurrent requests for the same missing key build it once; the other
+callers wait for that result instead of building their own copy.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 256
+
+
+def make_key(name, version, params=None):
+    return (name, version, tuple(sorted((params or {}).items())))
+
+
+class _Pending:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class LRUCache:
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get_or_build(self, key, build):
+        """Return the cached value for ``key``, calling ``build()`` on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = _Pending()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = build()
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        else:
+            self._store(key, pending.value)
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
+        return pending.value
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def retain_version(self, version):
+        """Drop every entry built from a data version other than ``version``."""
+        with self._lock:
+            stale = [key for key in self._entries if key[1] != version]
+            for key in stale:
+                del self._entries[key]
+            self.evictions += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,184 @@
+"""HTML for the dashboard's header, banners and cards.
+
+Plain functions returning HTML strings, shared by the Streamlit app and the
+static export, so both render the same markup.
+"""
+from .theme import COLORS
+
+
+def header():
+    return f"""
+        <div style="background: linear-gradient(135deg, {COLORS['dark']} 0%, {COLORS['secondary']} 100%);
+                    color: white; padding: 40px 30px; text-align: center; border-radius: 0;">
+            <div style="margin-bottom: 20px;">
+                <span style="background: white; padding: 8px 25px; border-radius: 8px; display: inline-block;">
+                    <span style="color: {COLORS['dark']}; font-size: 42px; font-weight: bold; font-family: Arial, sans-serif;">amazon</span><span style="color: {COLORS['primary']}; font-size: 28px; font-weight: bold;">.com</span>
+                </span>
+            </div>
+            <h1 style="font-size: 32px; margin-top: 15px; margin-bottom: 10px; font-weight: 600;">Product Success Prediction Dashboard</h1>
+            <p style="font-size: 16px; opacity: 0.9;">
+                Early Review Analytics for Third-Party Sellers | 1.5M Reviews | 471 Products | 2015-2023
+            </p>
+        </div>
+    """
+
+
+def footer():
+    return f"""
+        <div style="background: {COLORS['dark']}; color: white; padding: 20px;
+                    text-align: center; margin-top: 40px;">
+            <p style="font-size: 14px; opacity: 0.8;">
+                Amazon Product Success Prediction | Data: 2015-2023 |
+                Analysis: K-means Clustering, Random Forest, Gradient Boosting
+            </p>
+        </div>
+    """
+
+
+def banner(title, subtitle, color, shade, text_color='white', opacity=0.9):
+    fade = f" opacity: {opacity};" if opacity is not None else ''
+    return f"""
+        <div style="background: linear-gradient(135deg, {color} 0%, {shade} 100%);
+                    color: {text_color}; padding: 20px; border-radius: 12px; margin-bottom: 30px;">
+            <h2 style="font-size: 24px; margin-bottom: 10px;">{title}</h2>
+            <p style="font-size: 16px;{fade}">
+                {subtitle}
+            </p>
+        </div>
+    """
+
+
+# TAB 1: OVERVIEW
+def overview_metrics(best):
+    metrics = [
+        ('Total Reviews', '1.5M', COLORS['primary']),
+        ('Products Analyzed', '471', COLORS['secondary']),
+        ('Model Accuracy', f"{best['accuracy']:.1f}%", COLORS['success']),
+        ('Early-to-1Yr Predictive Strength', '0.976', COLORS['primary'])  # Changed label
+    ]
+    return [f"""
+        <div style="background: white; padding: 25px; border-radius: 12px;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1); border: 3px solid {color}; text-align: center;">
+            <div style="font-size: 14px; color: #666; margin-bottom: 8px;">{label}</div>
+            <div style="font-size: 32px; font-weight: bold; color: {color};">{value}</div>
+        </div>
+    """ for label, value, color in metrics]
+
+
+def overview_insights():
+    insights = [
+        ('Early Reviews Highly Predictive', 'r = 0.976',
+         'First 100 reviews predict 1-year ratings with 97.6% correlation. Models achieve 96-97% accuracy.',
+         COLORS['success']),
+        ('Volatility Critical Warning', '25.5%',
+         'Rating volatility contributes 25.5% to predictions - nearly as important as rating itself.',
+         COLORS['warning']),
+        ('Beauty = 3X Higher Risk', '31.7%',
+         'Beauty products fail at 31.7% vs 11-12% for Electronics/Pets.',
+         COLORS['danger'])
+    ]
+    return [f"""
+        <div style="background: white; border-left: 5px solid {color}; padding: 20px;
+                    border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+            <h3 style="font-size: 16px; margin-bottom: 10px; color: {COLORS['dark']};">{title}</h3>
+            <div style="font-size: 28px; font-weight: bold; color: {color}; margin: 10px 0;">{stat}</div>
+            <p style="font-size: 13px; color: #666; line-height: 1.6;">{desc}</p>
+        </div>
+    """ for title, stat, desc, color in insights]
+
+
+# TAB 2: PREDICTIVE POWER
+def predictive_banner(best):
+    return banner(
+        'Insight 1: Early Reviews Highly Predict 1-Year Success',
+        f"Correlation of 0.976 between early (100 reviews) and 1-year ratings | {best['accuracy']:.1f}% Classification Accuracy",
+        COLORS['success'], '#0d5a4a'
+    )
+
+
+def predictive_stats(best, trajectory):
+    stats = [
+        ('Correlation', '0.976', 'Extremely Strong'),
+        ('Products Stable', f"{trajectory['stable_share']:.1f}%", '±0.1 star change'),
+        ('Best Model', f"{best['accuracy']:.1f}%", best['model'])
+    ]
+    return [f"""
+        <div style="background: white; padding: 20px; border-radius: 8px; text-align: center;
+                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+            <div style="font-size: 14px; color: #666;">{label}</div>
+            <div style="font-size: 36px; font-weight: bold; color: {COLORS['success']};">{value}</div>
+            <div style="font-size: 12px; color: #999;">{sublabel}</div>
+        </div>
+    """ for label, value, sublabel in stats]
+
+
+# TAB 3: VOLATILITY WARNING
+def volatility_banner(rule):
+    return banner(
+        'Insight 2: Rating Volatility is Critical Warning Signal',
+        f"Volatility contributes 25.5% to predictions | Combined Rule: {rule['precision']:.1f}% Precision, {rule['recall']:.1f}% Recall",
+        COLORS['warning'], '#c99200', text_color=COLORS['dark'], opacity=None
+    )
+
+
+def rule_box(rule):
+    return f"""
+        <div style="background: #fff3cd; border: 3px solid {COLORS['warning']};
+                    border-radius: 8px; padding: 20px;">
+            <h3 style="font-size: 18px; margin-bottom: 15px; color: {COLORS['dark']};">Recommended Warning Rule</h3>
+            <p style="font-size: 16px; font-weight: bold; margin-bottom: 10px; color: {COLORS['dark']};">
+                IF early_avg_rating &lt; 4.0 AND volatility &gt; 1.0 → FLAG AS HIGH RISK
+            </p>
+            <div style="font-size: 14px; color: #666;">
+                <div>✓ Precision: <strong>{rule['precision']:.1f}%</strong> | Recall: <strong>{rule['recall']:.1f}%</strong> | Flags: <strong>{rule['flagged']:,} products ({rule['flagged_share']:.1f}%)</strong></div>
+            </div>
+        </div>
+    """
+
+
+# TAB 4: CATEGORY RISK
+def category_banner():
+    return banner(
+        'Insight 3: Beauty Products Have 3X Higher Failure Risk',
+        'Beauty: 31.7% Failure Rate vs Electronics/Pets: ~11%',
+        COLORS['danger'], '#8b1a04'
+    )
+
+
+def failure_explainer():
+    return f"""
+        <div style="background: white; padding: 20px; border-radius: 8px; border-left: 5px solid {COLORS['danger']}; margin-bottom: 20px;">
+            <h3 style="font-size: 18px; margin-bottom: 10px; color: {COLORS['dark']};">What is "Failure Risk"?</h3>
+            <p style="font-size: 14px; color: #666; line-height: 1.6;">
+                <strong>Product failure</strong> = ending with a rating below 4.0 stars after one year.
+                On Amazon, products rated below 4.0 struggle to compete as most customers filter for 4+ star products.
+                Beauty products face unique challenges including subjective preferences and skin compatibility, leading to 3X higher failure rates.
+            </p>
+        </div>
+    """
+
+
+def category_cards():
+    category_info = [
+        ('Beauty', '31.7%', '<3.86', 'HIGH', COLORS['danger']),
+        ('Electronics', '11.7%', '<3.84', 'MEDIUM', COLORS['warning']),
+        ('Pet Supplies', '11.4%', 'Monitor', 'LOW', COLORS['success'])
+    ]
+    return [f"""
+        <div style="background: white; border: 3px solid {color}; padding: 20px;
+                    border-radius: 12px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+            <h4 style="font-size: 16px; margin-bottom: 10px; color: {COLORS['dark']};">{cat}</h4>
+            <div style="font-size: 28px; font-weight: bold; color: {color}; margin-bottom: 10px;">
+                {rate}
+            </div>
+            <div style="font-size: 13px; color: #666;">
+                <div>Failure Rate</div>
+                <div style="margin-top: 10px; font-weight: bold; color: {color};">
+                    Risk: {risk}
+                </div>
+                <div style="margin-top: 5px;">
+                    Threshold: {threshold}
+                </div>
+            </div>
+        </div>
+    """ for cat, rate, threshold, risk, color in category_info]
@@ -0,0 +1,152 @@
+"""Mini-batch k-means on the (early rating, volatility) product features.
+
+The model streams over the products table in record batches. Each batch is
+assigned to its nearest centroid, and every centroid moves to the running mean
+of all points assigned to it so far: Sculley's per-centroid learning rate
+applied to a whole batch at once. Centroids and counts persist as JSON, so a
+later run can warm-start from them. Assigning a product costs O(k).
+Both features are in star units, so they are clustered unscaled.
+"""
+import argparse
+import json
+
+import numpy as np
+
+from .feature_store import FeatureStore
+
+CLUSTER_FEATURES = ['early_avg_rating', 'early_rating_std']
+CLUSTER_NAMES = ['Elite Performers', 'High Risk']
+MODEL_PATH = 'artifacts/kmeans.json'
+DEFAULT_BATCH_SIZE = 65_536
+
+
+class MiniBatchKMeans:
+
+    def __init__(self, k=2, centroids=None, counts=None, seed=42):
+        self.k = k
+        self.centroids = None if centroids is None else np.asarray(centroids, dtype=np.float64)
+        self.counts = np.zeros(k) if counts is None else np.asarray(counts, dtype=np.float64)
+        self._rng = np.random.default_rng(seed)
+
+    def _init_centroids(self, X):
+        # k-means++ seeding on the first batch
+        centroids = [X[self._rng.integers(len(X))]]
+        for _ in range(1, self.k):
+            d2 = self._distances(X, np.asarray(centroids)).min(axis=1)
+            total = d2.sum()
+            p = d2 / total if total > 0 else None
+            centroids.append(X[self._rng.choice(len(X), p=p)])
+        self.centroids = np.asarray(centroids)
+
+    @staticmethod
+    def _distances(X, centroids):
+        return ((X[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+
+    def predict(self, X):
+        """Index of the nearest centroid for every row of ``X``."""
+        return self._distances(np.asarray(X, dtype=np.float64), self.centroids).argmin(axis=1)
+
+    def partial_fit(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        X = X[np.isfinite(X).all(axis=1)]
+        if not len(X):
+            return self
+        if self.centroids is None:
+            self._init_centroids(X)
+        labels = self.predict(X)
+        n = np.bincount(labels, minlength=self.k).astype(np.float64)
+        sums = np.stack([np.bincount(labels, X[:, j], minlength=self.k) for j in range(X.shape[1])], axis=1)
+        counts = self.counts + n
+        moved = n > 0
+        self.centroids[moved] += (sums[moved] - n[moved, None] * self.centroids[moved]) / counts[moved, None]
+        self.counts = counts
+        return self
+
+    def fit_batches(self, batches, epochs=1):
+        """Fit over an iterable factory: ``batches()`` must return a fresh iterator per epoch."""
+        for _ in range(epochs):
+            for X in batches():
+                self.partial_fit(X)
+        return self
+
+    def order(self):
+        """Cluster indices from the highest-rated centroid down."""
+        return np.argsort(-self.centroids[:, 0], kind='stable')
+
+    def names(self):
+        """Display name per cluster index: best-rated centroid first."""
+        labels = CLUSTER_NAMES if self.k == len(CLUSTER_NAMES) else [f"Cluster {i + 1}" for i in range(self.k)]
+        names = np.empty(self.k, dtype=object)
+        names[self.order()] = labels
+        return names
+
+    def thresholds(self):
+        """Rating and volatility cut points halfway between the two best-rated centroids."""
+        top = self.centroids[self.order()[:2]]
+        rating, volatility = top.mean(axis=0)
+        return {'rating': float(rating), 'volatility': float(volatility)}
+
+    def to_dict(self):
+        return {
+            'k': self.k,
+            'features': CLUSTER_FEATURES,
+            'centroids': self.centroids.tolist(),
+            'counts': self.counts.tolist(),
+            'names': self.names().tolist(),
+            'thresholds': self.thresholds(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state['k'], state['centroids'], state['counts'])
+
+
+def store_batches(store, batch_size=DEFAULT_BATCH_SIZE):
+    def batches():
+        for batch in store.dataset('products').to_batches(columns=CLUSTER_FEATURES, batch_size=batch_size):
+            yield np.column_stack([batch.column(c).to_numpy(zero_copy_only=False) for c in CLUSTER_FEATURES])
+    return batches
+
+
+def load_model(store):
+    path = store.root / MODEL_PATH
+    if not path.exists():
+        return None
+    return MiniBatchKMeans.from_dict(json.loads(path.read_text()))
+
+
+def save_model(store, model):
+    path = store.root / MODEL_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(model.to_dict(), indent=2))
+    store.record_artifact('kmeans', MODEL_PATH)
+
+
+def assign(model, frame):
+    """Cluster display names for a frame with the clustering feature columns."""
+    X = frame[CLUSTER_FEATURES].to_numpy(dtype=np.float64)
+    return model.names()[model.predict(X)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fit mini-batch k-means on the products table.')
+    parser.add_argument('root', nargs='?', default='data/feature_store')
+    parser.add_argument('-k', type=int, default=2)
+    parser.add_argument('--epochs', type=int, default=3)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--cold', action='store_true', help='ignore the saved centroids')
+    args = parser.parse_args(argv)
+
+    store = FeatureStore(args.root)
+    model = None if args.cold else load_model(store)
+    if model is None or model.k != args.k:
+        model = MiniBatchKMeans(args.k)
+    model.fit_batches(store_batches(store, args.batch_size), args.epochs)
+    save_model(store, model)
+    for name, centroid, count in zip(model.names(), model.centroids, model.counts):
+        print(f"{name:<18} rating {centroid[0]:.2f}  volatility {centroid[1]:.2f}  ({count:,.0f} updates)")
+    print(f"thresholds: {model.thresholds()}")
+
+
+if __name__ == '__main__':
+    main()
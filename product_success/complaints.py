@@ -0,0 +1,198 @@
+"""Complaint-phrase extraction from negative reviews of failed products.
+
+Bigrams are counted in one streaming pass with Space-Saving summaries
+(Metwally et al.). Each summary tracks at most ``capacity`` phrases, and any
+count is over-estimated by at most N / capacity. Chunks are processed on a
+process pool, each returning its own summaries, which are merged as they
+arrive. That gives one summary overall and one per category, without ever
+holding an exact phrase counter for the whole corpus.
+"""
+import argparse
+import heapq
+import os
+import re
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pandas as pd
+
+from .feature_store import FeatureStore
+from .ingest import DEFAULT_CHUNK_SIZE, iter_review_chunks
+from .trajectories import SUCCESS_THRESHOLD
+
+NEGATIVE_RATING = 2
+DEFAULT_CAPACITY = 2_000
+TOP_N = 15
+
+TOKEN_RE = re.compile(r"[a-z]+")
+CLAUSE_RE = re.compile(r"[.!?;,:()\n]+")
+STOPWORDS = frozenset("""
+    a about after all also am an and any are as at be been before being but by can could did do
+    does for from get got had has have he her him his how i if in into is it its just me more most
+    my no not of off on once one only or other our out over own same she should so some such than
+    that the their them then there these they this those through to too until up us very was we
+    were what when where which while who why will with you your im ive id even still
+""".split())
+
+
+def tokenize(text):
+    text = text.lower().replace("'", '').replace('’', '')
+    return [t for t in TOKEN_RE.findall(text) if t not in STOPWORDS and len(t) > 1]
+
+
+def bigrams(text):
+    """Adjacent non-stopword pairs, not crossing clause punctuation."""
+    grams = []
+    for clause in CLAUSE_RE.split(text):
+        tokens = tokenize(clause)
+        grams.extend(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return grams
+
+
+class SpaceSaving:
+    """Approximate top-k counter with at most ``capacity`` tracked items."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        self._heap = []
+
+    def __len__(self):
+        return len(self.counts)
+
+    def _minimum(self):
+        # Lazy heap: skip entries whose count has changed since they were pushed
+        while True:
+            count, item = self._heap[0]
+            if self.counts.get(item) == count:
+                return count, item
+            heapq.heappop(self._heap)
+
+    def update(self, item, weight=1):
+        self.total += weight
+        if item in self.counts:
+            self.counts[item] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = weight
+            self.errors[item] = 0
+        else:
+            floor, evicted = self._minimum()
+            heapq.heappop(self._heap)
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[item] = floor + weight
+            self.errors[item] = floor
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i) for i, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def update_counts(self, counts):
+        # Largest first, so heavy phrases from a chunk are not evicted by its tail
+        for item, weight in sorted(counts.items(), key=lambda kv: -kv[1]):
+            self.update(item, weight)
+
+    def floor(self):
+        """Upper bound on the count of any item that is not tracked."""
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def merge(self, other):
+        """Combine two summaries of disjoint streams (Agarwal et al. mergeable summaries)."""
+        floor_a, floor_b = self.floor(), other.floor()
+        merged = SpaceSaving(max(self.capacity, other.capacity))
+        items = set(self.counts) | set(other.counts)
+        combined = {i: self.counts.get(i, floor_a) + other.counts.get(i, floor_b) for i in items}
+        for item in heapq.nlargest(merged.capacity, combined, key=combined.get):
+            merged.counts[item] = combined[item]
+            merged.errors[item] = (self.errors.get(item, floor_a) + other.errors.get(item, floor_b))
+        merged.total = self.total + other.total
+        merged._heap = [(c, i) for i, c in merged.counts.items()]
+        heapq.heapify(merged._heap)
+        return merged
+
+    def top(self, n=TOP_N):
+        return heapq.nlargest(n, self.counts.items(), key=lambda kv: kv[1])
+
+
+def _chunk_sketches(texts, categories, capacity):
+    overall = Counter()
+    per_category = {}
+    for text, category in zip(texts, categories):
+        grams = bigrams(text) if isinstance(text, str) else []
+        overall.update(grams)
+        per_category.setdefault(category, Counter()).update(grams)
+    sketches = {None: SpaceSaving(capacity)}
+    sketches[None].update_counts(overall)
+    for category, counts in per_category.items():
+        sketches[category] = SpaceSaving(capacity)
+        sketches[category].update_counts(counts)
+    return sketches
+
+
+def _merge_into(total, sketches):
+    for key, sketch in sketches.items():
+        total[key] = total[key].merge(sketch) if key in total else sketch
+
+
+def failed_products(store, threshold=SUCCESS_THRESHOLD):
+    products = store.read('products', ['product_id', 'oneyear_avg_rating'])
+    return set(products.loc[products['oneyear_avg_rating'] < threshold, 'product_id'])
+
+
+def extract(paths, failed, capacity=DEFAULT_CAPACITY, chunk_size=DEFAULT_CHUNK_SIZE,
+            max_workers=None, negative_rating=NEGATIVE_RATING):
+    """Space-Saving summaries keyed by category (``None`` for all categories)."""
+    max_workers = max_workers or os.cpu_count()
+    total = {}
+    columns = ('product_id', 'category', 'rating', 'text')
+    with ProcessPoolExecutor(max_workers) as pool:
+        pending = set()
+        for chunk in iter_review_chunks(paths, columns, chunk_size):
+            chunk = chunk[(chunk['rating'] <= negative_rating) & chunk['product_id'].isin(failed)]
+            if chunk.empty:
+                continue
+            # Bound the chunks in flight so memory stays flat on large inputs
+            if len(pending) >= 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    _merge_into(total, task.result())
+            pending.add(pool.submit(_chunk_sketches, chunk['text'].tolist(),
+                                    chunk['category'].tolist(), capacity))
+        for task in pending:
+            _merge_into(total, task.result())
+    return total
+
+
+def complaint_tables(sketches, n=TOP_N):
+    overall = sketches.get(None, SpaceSaving())
+    patterns = pd.DataFrame(overall.top(n), columns=['pattern', 'frequency'])
+    by_category = pd.DataFrame(
+        [(category, pattern, count)
+         for category, sketch in sketches.items() if category is not None
+         for pattern, count in sketch.top(n)],
+        columns=['category', 'pattern', 'frequency']
+    )
+    return patterns, by_category
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract top complaint bigrams from failed products.')
+    parser.add_argument('paths', nargs='+', help='review files (.jsonl, .csv, optionally .gz)')
+    parser.add_argument('--store', default='data/feature_store')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    store = FeatureStore(args.store)
+    sketches = extract(args.paths, failed_products(store), args.capacity, args.chunk_size, args.workers)
+    patterns, by_category = complaint_tables(sketches)
+    store.write('complaint_patterns', patterns)
+    store.write('complaint_patterns_by_category', by_category)
+    print(patterns.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""Precomputed category x year x alert-tier rollup of the products table.
+
+Each cell holds additive partial sums (products, failures, early and 1-year
+rating sums), so cubes built from disjoint product sets merge by addition.
+A cube can also be updated in place with ``add(new)`` and ``add(old, sign=-1)``.
+The saved cube records the version of the ``products`` table it matches; a
+reader that finds the table rewritten since then rebuilds it and saves it back.
+Sums are also kept as prefix sums along the year axis, so any
+(categories, year range, tiers) slice costs O(categories x tiers) lookups,
+independent of the number of products.
+"""
+import argparse
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import scoring
+from .feature_store import FeatureStore
+
+MEASURES = ['products', 'failed', 'early_rating_sum', 'oneyear_rating_sum']
+CUBE_COLUMNS = ['category', 'year', 'early_avg_rating', 'early_rating_std', 'oneyear_avg_rating']
+CUBE_PATH = 'artifacts/cube.npz'
+TIER_CODES = {'RED': scoring.RED, 'YELLOW': scoring.YELLOW, 'GREEN': scoring.GREEN}
+
+
+class Cube:
+
+    def __init__(self, categories=(), first_year=None, last_year=None, sums=None, source=None):
+        self.categories = list(categories)
+        # Version of the products table these sums were built from
+        self.source = source
+        self.first_year = first_year
+        self.last_year = last_year
+        n_years = 0 if first_year is None else last_year - first_year + 1
+        shape = (len(self.categories), n_years, len(scoring.ALERT_TIERS), len(MEASURES))
+        self.sums = np.zeros(shape) if sums is None else sums
+        self._refresh()
+
+    def _refresh(self):
+        prefix = np.zeros((self.sums.shape[0], self.sums.shape[1] + 1) + self.sums.shape[2:])
+        np.cumsum(self.sums, axis=1, out=prefix[:, 1:])
+        self._prefix = prefix
+
+    @property
+    def years(self):
+        return (self.first_year, self.last_year)
+
+    def _grow(self, categories, first_year, last_year):
+        new_categories = self.categories + sorted(set(categories) - set(self.categories))
+        lo = first_year if self.first_year is None else min(first_year, self.first_year)
+        hi = last_year if self.last_year is None else max(last_year, self.last_year)
+        if new_categories == self.categories and (lo, hi) == self.years:
+            return
+        sums = np.zeros((len(new_categories), hi - lo + 1) + self.sums.shape[2:])
+        if self.first_year is not None:
+            offset = self.first_year - lo
+            sums[:len(self.categories), offset:offset + self.sums.shape[1]] = self.sums
+        self.categories, self.first_year, self.last_year, self.sums = new_categories, lo, hi, sums
+
+    def add(self, products, sign=1):
+        """Add (or with ``sign=-1`` remove) the contribution of a products frame."""
+        if products.empty:
+            return self
+        categories = products['category'].astype(str).to_numpy()
+        years = products['year'].to_numpy(dtype=np.int64)
+        self._grow(np.unique(categories), int(years.min()), int(years.max()))
+
+        lookup = {c: i for i, c in enumerate(self.categories)}
+        c = np.fromiter((lookup[x] for x in categories), dtype=np.int64, count=len(categories))
+        y = years - self.first_year
+        t = scoring.score_products(products).astype(np.int64)
+        early = products['early_avg_rating'].to_numpy(dtype=np.float64)
+        oneyear = products['oneyear_avg_rating'].to_numpy(dtype=np.float64)
+        values = np.column_stack([np.ones_like(early), scoring.failed(oneyear), early, oneyear])
+
+        n_cells = int(np.prod(self.sums.shape[:3]))
+        cell = np.ravel_multi_index((c, y, t), self.sums.shape[:3])
+        for m in range(len(MEASURES)):
+            self.sums[..., m] += sign * np.bincount(cell, values[:, m], minlength=n_cells).reshape(self.sums.shape[:3])
+        self._refresh()
+        return self
+
+    def merge(self, other):
+        merged = Cube(self.categories, self.first_year, self.last_year, self.sums.copy(), self.source)
+        if other.first_year is None:
+            return merged
+        merged._grow(other.categories, other.first_year, other.last_year)
+        rows = [merged.categories.index(c) for c in other.categories]
+        offset = other.first_year - merged.first_year
+        merged.sums[rows, offset:offset + other.sums.shape[1]] += other.sums
+        merged._refresh()
+        return merged
+
+    def slice(self, categories=None, years=None, tiers=None):
+        """Summed measures per (category, tier) cell of the selection, shape (C, T, M)."""
+        rows = [i for i, c in enumerate(self.categories) if categories is None or c in categories]
+        if self.first_year is None:
+            return np.zeros((len(rows),) + self.sums.shape[2:])
+        lo, hi = years if years is not None else self.years
+        lo = max(lo, self.first_year) - self.first_year
+        hi = min(hi, self.last_year) - self.first_year
+        if hi < lo:
+            return np.zeros((len(rows),) + self.sums.shape[2:])
+        window = self._prefix[rows, hi + 1] - self._prefix[rows, lo]
+        if tiers is not None:
+            keep = np.zeros(len(scoring.ALERT_TIERS), dtype=bool)
+            keep[[TIER_CODES[t] for t in tiers]] = True
+            window = window * keep[None, :, None]
+        return window
+
+    def category_failure(self, categories=None, years=None, tiers=None):
+        sums = self.slice(categories, years, tiers).sum(axis=1)
+        products, failed = sums[:, 0], sums[:, 1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rate = np.where(products > 0, 100 * failed / products, np.nan)
+            early = sums[:, 2] / products
+            oneyear = sums[:, 3] / products
+        names = [c for c in self.categories if categories is None or c in categories]
+        return pd.DataFrame({
+            'category': names,
+            'rate': np.round(rate, 1),
+            'products': products.astype(np.int64),
+            'early_avg_rating': early,
+            'oneyear_avg_rating': oneyear,
+        })
+
+    def alert_distribution(self, categories=None, years=None, tiers=None):
+        counts = self.slice(categories, years, tiers).sum(axis=0)[:, 0]
+        return pd.DataFrame({'name': scoring.ALERT_TIERS, 'value': counts.astype(np.int64)})
+
+    def to_bytes(self):
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, sums=self.sums, categories=np.asarray(self.categories, dtype=str),
+                            years=np.asarray([self.first_year or 0, self.last_year or -1]),
+                            source=np.asarray(self.source or ''))
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, raw):
+        with np.load(io.BytesIO(raw)) as state:
+            source = (str(state['source']) or None) if 'source' in state.files else None
+            first, last = (int(y) for y in state['years'])
+            if last < first:
+                return cls(source=source)
+            return cls(state['categories'].tolist(), first, last, state['sums'], source)
+
+
+def build(store, batch_size=262_144):
+    """Build the cube by streaming the products table."""
+    cube = Cube(source=store.table_version('products'))
+    for batch in store.dataset('products').to_batches(columns=CUBE_COLUMNS, batch_size=batch_size):
+        cube.add(batch.to_pandas())
+    return cube
+
+
+def read_cube(store):
+    """The saved cube as it is on disk, or None."""
+    path = store.root / CUBE_PATH
+    return Cube.from_bytes(path.read_bytes()) if path.exists() else None
+
+
+def load_cube(store):
+    """The saved cube, rebuilt and saved again when the products table changed after it was saved."""
+    cube = read_cube(store)
+    if cube is not None and cube.source != store.table_version('products'):
+        cube = build(store)
+        try:
+            # Already registered, so the store version need not change
+            _write_cube(store, cube)
+        except OSError:
+            pass  # read-only store: every cold start rebuilds until the CLI runs
+    return cube
+
+
+def _write_cube(store, cube):
+    path = store.root / CUBE_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(cube.to_bytes())
+    tmp.replace(path)
+
+
+def save_cube(store, cube):
+    _write_cube(store, cube)
+    store.record_artifact('cube', CUBE_PATH)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build or update the category x year x tier rollup cube.')
+    parser.add_argument('root', nargs='?', default='data/feature_store')
+    parser.add_argument('--add', metavar='PRODUCTS', help='fold new products (.parquet/.csv) into the saved cube')
+    parser.add_argument('--remove', metavar='PRODUCTS', help='remove superseded product rows from the saved cube')
+    args = parser.parse_args(argv)
+
+    store = FeatureStore(args.root)
+    if args.add or args.remove:
+        cube = read_cube(store) or Cube()
+        for path, sign in ((args.remove, -1), (args.add, 1)):
+            if path:
+                frame = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+                cube.add(frame, sign)
+        # The deltas bring the cube up to the products table as it is now
+        cube.source = store.table_version('products')
+    else:
+        cube = build(store)
+    save_cube(store, cube)
+    print(cube.category_failure().to_string(index=False))
+    print(cube.alert_distribution().to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""Table access for the dashboard: feature store first, built-in fixtures otherwise."""
+import os
+
+import pandas as pd
+
+from . import clustering, cube, drift, fixtures, products, scoring, whatif
+from .cache import LRUCache, make_key
+from .feature_store import FeatureStore
+from .incremental import EarlyStatsAggregator
+from .trajectories import stable_share
+
+STORE_ENV = 'FEATURE_STORE'
+DEFAULT_STORE = 'data/feature_store'
+LIVE_STATE_ENV = 'EARLY_STATS_STATE'
+DEFAULT_LIVE_STATE = 'data/early_stats.npz'
+DRIFT_FEED_ENV = 'DRIFT_FEED'
+DEFAULT_DRIFT_FEED = 'data/drift_alerts.jsonl'
+
+TRAJECTORY_COLUMNS = ['early_avg_rating', 'oneyear_avg_rating', 'trajectory']
+CLUSTER_COLUMNS = ['early_avg_rating', 'early_rating_std', 'cluster']
+SCORING_COLUMNS = ['early_avg_rating', 'early_rating_std', 'oneyear_avg_rating']
+
+# Whole-catalog structures, built once per store version even when tab
+# sources ask for them on several loader threads at the same time
+_catalog = LRUCache(maxsize=6)
+
+
+def open_store(root=None):
+    store = FeatureStore(root or os.environ.get(STORE_ENV, DEFAULT_STORE))
+    return store if store.exists else None
+
+
+def load_table(name, store=None, columns=None):
+    if store is not None and store.has(name):
+        return store.read(name, columns)
+    frame = fixtures.TABLES[name]()
+    return frame if columns is None else frame[columns]
+
+
+def has_products(store, columns):
+    return store is not None and store.has('products') and set(columns) <= set(store.columns('products'))
+
+
+def _catalog_entry(name, store, build):
+    return _catalog.get_or_build(make_key(name, store.version, {'root': str(store.root)}), build)
+
+
+def product_table(store):
+    """Compact read-only product table for the store version, built once per process."""
+    if store is None or not store.has('products'):
+        return None
+    return _catalog_entry('product_table', store, lambda: products.build(store))
+
+
+def _product_view(store, name, columns, categories, years):
+    table = product_table(store)
+    if table is not None and set(columns) <= set(table.columns):
+        return table.frame(columns, categories, years)
+    return fixtures.TABLES[name]()
+
+
+def trajectory_data(store=None, categories=None, years=None):
+    return _product_view(store, 'trajectory_data', TRAJECTORY_COLUMNS, categories, years)
+
+
+def trajectory_summary(store=None):
+    table = product_table(store)
+    if table is None or not {'early_avg_rating', 'oneyear_avg_rating'} <= set(table.columns):
+        return fixtures.trajectory_summary()
+    early, oneyear = table.arrays['early_avg_rating'], table.arrays['oneyear_avg_rating']
+    return {'products': len(table), 'stable_share': stable_share(early, oneyear)}
+
+
+def kmeans_data(store=None, categories=None, years=None):
+    return _product_view(store, 'kmeans_data', CLUSTER_COLUMNS, categories, years)
+
+
+def cluster_thresholds(store=None):
+    model = clustering.load_model(store) if store is not None else None
+    if model is None:
+        return {'rating': scoring.RATING_THRESHOLD, 'volatility': scoring.VOLATILITY_THRESHOLD}
+    return model.thresholds()
+
+
+def best_model(model_performance):
+    """Row of the most accurate model."""
+    return model_performance.loc[model_performance['accuracy'].idxmax()]
+
+
+def data_version(store):
+    return store.version if store is not None else 'fixtures'
+
+
+def _score(store):
+    table = product_table(store)
+    return table.codes('alert_tier'), scoring.failed(table.arrays['oneyear_avg_rating'])
+
+
+def threshold_index(store):
+    """What-if threshold counts for the store version, or None without scored products."""
+    if not has_products(store, SCORING_COLUMNS):
+        return None
+    return _catalog_entry('threshold_index', store, lambda: whatif.ThresholdIndex.from_table(product_table(store)))
+
+
+def live_state_path():
+    return os.environ.get(LIVE_STATE_ENV, DEFAULT_LIVE_STATE)
+
+
+def live_version():
+    """Modification time of the incremental early-stats state, or None when there is none."""
+    try:
+        return os.stat(live_state_path()).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def live_alert_version(store):
+    """Version of the live state behind the unfiltered alert pie, or None when the pie comes from the store.
+
+    The live state counts every product with early reviews so far and has no
+    1-year ratings. When the store has scored products, the rule metrics come
+    from them, so the pie does too; otherwise the two would disagree.
+    """
+    if has_products(store, SCORING_COLUMNS):
+        return None
+    return live_version()
+
+
+def drift_feed_path():
+    return os.environ.get(DRIFT_FEED_ENV, DEFAULT_DRIFT_FEED)
+
+
+def drift_version():
+    """Modification time of the drift alert feed, or None when there is none."""
+    try:
+        return os.stat(drift_feed_path()).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def drift_alerts(limit=50):
+    """Newest drift alerts first, with review times as datetimes."""
+    alerts = drift.read_feed(drift_feed_path(), limit)
+    alerts['time'] = pd.to_datetime(alerts['time'], unit='s')
+    return alerts
+
+
+def load_cube(store):
+    return _catalog_entry('cube', store, lambda: cube.load_cube(store)) if store is not None else None
+
+
+def cube_dimensions(store=None):
+    rollup = load_cube(store)
+    if rollup is None or rollup.first_year is None:
+        return None
+    return {'categories': rollup.categories, 'years': rollup.years}
+
+
+def category_failure(store=None, categories=None, years=None, tiers=None):
+    rollup = load_cube(store)
+    if rollup is None:
+        return load_table('category_failure', store)
+    return rollup.category_failure(categories, years, tiers)[['category', 'rate']]
+
+
+def alert_distribution(store=None, categories=None, years=None, tiers=None):
+    filtered = categories is not None or years is not None or tiers is not None
+    if live_alert_version(store) is not None and not filtered:
+        # Need two early reviews for a volatility estimate
+        return EarlyStatsAggregator.load(live_state_path()).alert_distribution(min_reviews=2)
+    rollup = load_cube(store)
+    if rollup is not None:
+        return rollup.alert_distribution(categories, years, tiers)
+    if not has_products(store, SCORING_COLUMNS):
+        return load_table('alert_distribution', store)
+    return scoring.alert_distribution(_score(store)[0])
+
+
+def rule_summary(store=None):
+    if not has_products(store, SCORING_COLUMNS):
+        return fixtures.rule_summary()
+    return scoring.rule_metrics(*_score(store))
+
+
+def complaint_patterns(store=None, category=None):
+    if category is not None and store is not None and store.has('complaint_patterns_by_category'):
+        frame = store.read('complaint_patterns_by_category')
+        return frame.loc[frame['category'] == category, ['pattern', 'frequency']].reset_index(drop=True)
+    return load_table('complaint_patterns', store)
+
+
+def complaint_categories(store=None):
+    if store is None or not store.has('complaint_patterns_by_category'):
+        return []
+    return sorted(store.read('complaint_patterns_by_category', ['category'])['category'].unique())
+
+
+VIEWS = {
+    'trajectory_data': trajectory_data,
+    'trajectory_summary': trajectory_summary,
+    'kmeans_data': kmeans_data,
+    'cluster_thresholds': cluster_thresholds,
+    'alert_distribution': alert_distribution,
+    'rule_summary': rule_summary,
+    'complaint_patterns': complaint_patterns,
+    'complaint_categories': complaint_categories,
+    'cube_dimensions': cube_dimensions,
+    'category_failure': category_failure,
+}
+
+
+def load(name, store=None, **params):
+    if name in VIEWS:
+        return VIEWS[name](store, **params)
+    return load_table(name, store)
@@ -0,0 +1,204 @@
+"""Rolling-window drift monitor for per-product ratings.
+
+``DriftMonitor`` keeps the last ``window`` ratings of every product in a ring
+buffer, with running sums of ratings and squared ratings. Each review
+overwrites one slot and adjusts both sums, so an update costs O(1) whatever
+the window or history length. A product raises an alert when its rolling
+volatility crosses ``VOLATILITY_THRESHOLD`` or its rolling mean drops below
+``RATING_THRESHOLD``. It can alert on the same condition again only after
+clearing it.
+
+Each product's reviews must be applied in time order. A batch may arrive in
+any order, but a review older than the newest review already applied to its
+product would land in the wrong ring slot; it is skipped and counted in
+``late_reviews`` instead.
+
+The CLI appends alerts to a JSON-lines feed, which the Volatility Warning
+tab tails.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .ingest import iter_review_chunks
+from .scoring import RATING_THRESHOLD, VOLATILITY_THRESHOLD
+from .state import ProductState
+
+DEFAULT_WINDOW = 50
+MIN_REVIEWS = 10
+ALERTS = ['volatility', 'rating']
+FEED_COLUMNS = ['time', 'product_id', 'alert', 'rolling_mean', 'rolling_std', 'reviews']
+
+
+class DriftMonitor(ProductState):
+
+    STATE = ('ring', 'count', 'head', 'total', 'total_sq', 'volatile', 'low', 'last_review')
+    SETTINGS = ('window', 'min_reviews')
+
+    def __init__(self, window=DEFAULT_WINDOW, min_reviews=MIN_REVIEWS, capacity=1024):
+        super().__init__()
+        self.window = window
+        self.min_reviews = min_reviews
+        self.ring = np.zeros((capacity, window), dtype=np.float32)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.head = np.zeros(capacity, dtype=np.int32)
+        self.total = np.zeros(capacity, dtype=np.float64)
+        self.total_sq = np.zeros(capacity, dtype=np.float64)
+        self.volatile = np.zeros(capacity, dtype=bool)
+        self.low = np.zeros(capacity, dtype=bool)
+        self.last_review = np.zeros(capacity, dtype=np.int64)
+        # Reviews skipped for arriving after newer reviews of the same product
+        self.late_reviews = 0
+
+    def _stats(self, codes):
+        n = np.minimum(self.count[codes], self.window)
+        mean = self.total[codes] / n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = (self.total_sq[codes] - self.total[codes] * mean) / (n - 1)
+        return mean, np.sqrt(np.clip(np.nan_to_num(var), 0, None))
+
+    def _push(self, codes, ratings, timestamps):
+        # ``codes`` are distinct, so plain fancy indexing is safe
+        head = self.head[codes]
+        evicted = np.where(self.count[codes] >= self.window, self.ring[codes, head], 0.0).astype(np.float64)
+        self.total[codes] += ratings - evicted
+        self.total_sq[codes] += ratings ** 2 - evicted ** 2
+        self.ring[codes, head] = ratings
+        self.head[codes] = (head + 1) % self.window
+        self.count[codes] += 1
+
+        mean, std = self._stats(codes)
+        ready = self.count[codes] >= self.min_reviews
+        volatile = ready & (std > VOLATILITY_THRESHOLD)
+        low = ready & (mean < RATING_THRESHOLD)
+        raised = [volatile & ~self.volatile[codes], low & ~self.low[codes]]
+        self.volatile[codes] = volatile
+        self.low[codes] = low
+
+        alerts = []
+        for alert, mask in zip(ALERTS, raised):
+            if mask.any():
+                alerts.append(pd.DataFrame({
+                    'time': timestamps[mask],
+                    'product_id': self.ids(codes[mask]),
+                    'alert': alert,
+                    'rolling_mean': mean[mask].round(3),
+                    'rolling_std': std[mask].round(3),
+                    'reviews': self.count[codes[mask]],
+                }))
+        return alerts
+
+    def update(self, product_ids, timestamps, ratings):
+        """Apply a batch of reviews, in any order, and return the alerts it raised.
+
+        Reviews older than the newest one already applied to their product
+        are skipped and counted in ``late_reviews``.
+        """
+        codes = self.codes(product_ids)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=np.float64)
+        order = np.lexsort((timestamps, codes))
+        codes, timestamps, ratings = codes[order], timestamps[order], ratings[order]
+        late = (self.count[codes] > 0) & (timestamps < self.last_review[codes])
+        if late.any():
+            self.late_reviews += int(late.sum())
+            codes, timestamps, ratings = codes[~late], timestamps[~late], ratings[~late]
+        if not len(codes):
+            return pd.DataFrame(columns=FEED_COLUMNS)
+
+        # Round k applies every product's k-th review of the batch at once
+        unique, starts, sizes = np.unique(codes, return_index=True, return_counts=True)
+        self.last_review[unique] = timestamps[starts + sizes - 1]
+        rank = np.arange(len(codes)) - np.repeat(starts, sizes)
+        by_rank = np.argsort(rank, kind='stable')
+        bounds = np.searchsorted(rank[by_rank], np.arange(sizes.max() + 1))
+        alerts = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            rows = by_rank[lo:hi]
+            alerts.extend(self._push(codes[rows], ratings[rows], timestamps[rows]))
+        if not alerts:
+            return pd.DataFrame(columns=FEED_COLUMNS)
+        return pd.concat(alerts, ignore_index=True).sort_values('time', kind='stable', ignore_index=True)
+
+    def flagged(self):
+        """Products currently over either threshold, with their rolling statistics."""
+        codes = np.flatnonzero(self.volatile[:len(self)] | self.low[:len(self)])
+        mean, std = self._stats(codes)
+        return pd.DataFrame({
+            'rolling_mean': mean.astype(np.float32),
+            'rolling_std': std.astype(np.float32),
+            'volatile': self.volatile[codes],
+            'low_rating': self.low[codes],
+        }, index=pd.Index(self.ids(codes), name='product_id'))
+
+
+def append_feed(path, alerts):
+    """Append alerts to the JSON-lines feed."""
+    if not len(alerts):
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = alerts.to_json(orient='records', lines=True)
+    with open(path, 'a') as f:
+        f.write(text if text.endswith('\n') else text + '\n')
+
+
+def read_feed(path, limit=50, block_size=64 * 1024):
+    """The last ``limit`` alerts of the feed, newest first, reading only the tail of the file."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        tail = b''
+        while end > 0 and tail.count(b'\n') <= limit:
+            start = max(0, end - block_size)
+            f.seek(start)
+            tail = f.read(end - start) + tail
+            end = start
+    lines = [line for line in tail.splitlines() if line.strip()]
+    if end > 0:
+        lines = lines[1:]  # first line may be cut mid-record
+    records = [json.loads(line) for line in lines[-limit:]]
+    return pd.DataFrame.from_records(records[::-1], columns=FEED_COLUMNS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Feed new reviews through the rolling drift monitor.')
+    parser.add_argument('state', help='monitor state (.npz), created if missing')
+    parser.add_argument('paths', nargs='+', help='review files with the new reviews')
+    parser.add_argument('--feed', default='data/drift_alerts.jsonl', help='alert feed (JSON lines)')
+    parser.add_argument('--window', type=int,
+                        help=f'ratings per rolling window for a new state (default {DEFAULT_WINDOW}); an existing '
+                             'state keeps its own')
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    if Path(args.state).exists():
+        monitor = DriftMonitor.load(args.state)
+        if args.window is not None and args.window != monitor.window:
+            parser.error(f"{args.state} was built with --window {monitor.window}; "
+                         f"delete it to start over with --window {args.window}")
+    else:
+        monitor = DriftMonitor(args.window or DEFAULT_WINDOW)
+    raised = 0
+    for chunk in iter_review_chunks(args.paths, ('product_id', 'timestamp', 'rating'), args.chunk_size):
+        alerts = monitor.update(chunk['product_id'].to_numpy(), chunk['timestamp'].to_numpy(),
+                                chunk['rating'].to_numpy())
+        append_feed(args.feed, alerts)
+        raised += len(alerts)
+    monitor.save(args.state)
+    flagged = monitor.flagged()
+    print(f"{len(monitor):,} products | {raised:,} alerts -> {args.feed} | "
+          f"{int(flagged['volatile'].sum()):,} volatile, {int(flagged['low_rating'].sum()):,} below "
+          f"{RATING_THRESHOLD} now")
+    if monitor.late_reviews:
+        print(f"warning: skipped {monitor.late_reviews:,} reviews older than their product's newest applied review; "
+              f"feed each product's reviews in time order", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+"""Static snapshot of the dashboard for read-only viewers.
+
+Renders every tab from the current data version into a directory that any
+static file server or CDN can serve:
+
+    index.html              header, tabs, cards and tables
+    charts/<name>.json.gz   one gzipped Plotly figure per chart
+    plotly.min.js           the Plotly.js build matching the figures
+    manifest.json           data version, export time and chart sizes
+
+Charts are fetched and drawn when their tab is first opened. The live
+Streamlit app is still the place for filters and live updates.
+"""
+import argparse
+import gzip
+import html
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from string import Template
+
+from . import cards, data, figures
+from .theme import COLORS
+
+TABS = [
+    ('overview', 'Overview'),
+    ('predictive_power', 'Predictive Power'),
+    ('volatility_warning', 'Volatility Warning'),
+    ('category_risk', 'Category Risk'),
+]
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="data-version" content="$version">
+<title>Amazon Product Success Prediction</title>
+<style>
+body { margin: 0; font-family: "Source Sans Pro", Arial, sans-serif; background: $light; color: $dark; }
+main { max-width: 1400px; margin: 0 auto; padding: 0 24px; }
+nav { display: flex; gap: 10px; margin: 24px 0; }
+nav button { background: white; border: 2px solid $primary; border-radius: 8px 8px 0 0; padding: 12px 24px;
+             font-weight: bold; font-size: 15px; color: $dark; cursor: pointer; }
+nav button.active { background: $primary; color: white; }
+.grid { display: grid; gap: 16px; margin: 16px 0; }
+.cols-2 { grid-template-columns: repeat(2, 1fr); }
+.cols-3 { grid-template-columns: repeat(3, 1fr); }
+.cols-4 { grid-template-columns: repeat(4, 1fr); }
+.chart { min-height: 420px; }
+.stamp { color: #666; font-size: 12px; text-align: right; }
+table { border-collapse: collapse; width: 100%; background: white; }
+th, td { padding: 8px 12px; border-bottom: 1px solid #ddd; text-align: left; }
+</style>
+<script src="plotly.min.js" defer></script>
+</head>
+<body>
+$header
+<main>
+<nav>$nav</nav>
+$sections
+<p class="stamp">Snapshot of data version $version, exported $exported</p>
+</main>
+$footer
+<script>
+const drawn = new Set();
+async function draw(el) {
+  const bytes = new Uint8Array(await (await fetch(el.dataset.src)).arrayBuffer());
+  // Servers that add Content-Encoding: gzip hand us plain JSON already
+  const gzipped = bytes[0] === 0x1f && bytes[1] === 0x8b;
+  const text = gzipped
+    ? await new Response(new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'))).text()
+    : new TextDecoder().decode(bytes);
+  const fig = JSON.parse(text);
+  Plotly.newPlot(el, fig.data, fig.layout, {responsive: true, displaylogo: false});
+}
+function show(tab) {
+  document.querySelectorAll('nav button').forEach(b => b.classList.toggle('active', b.dataset.tab === tab));
+  document.querySelectorAll('main > section').forEach(s => { s.hidden = s.id !== tab; });
+  document.querySelectorAll('#' + tab + ' .chart').forEach(el => {
+    if (!drawn.has(el)) { drawn.add(el); draw(el); }
+  });
+}
+document.querySelectorAll('nav button').forEach(b => b.addEventListener('click', () => show(b.dataset.tab)));
+window.addEventListener('load', () => show('$first'));
+</script>
+</body>
+</html>
+""")
+
+
+def _grid(items, columns):
+    return f'<div class="grid cols-{columns}">' + ''.join(f'<div>{item}</div>' for item in items) + '</div>'
+
+
+def _chart(name):
+    return f'<div class="chart" id="chart-{name}" data-src="charts/{name}.json.gz"></div>'
+
+
+def build_charts(store):
+    """Every dashboard figure for the unfiltered views, keyed by chart name."""
+    load = lambda name, **params: data.load(name, store, **params)
+    return {
+        'model_performance': figures.model_performance(load('model_performance')),
+        'trajectories': figures.trajectories(load('trajectory_data')),
+        'clusters': figures.clusters(load('kmeans_data'), load('cluster_thresholds')),
+        'feature_importance': figures.feature_importance(load('feature_importance')),
+        'alert_distribution': figures.alert_distribution(load('alert_distribution')),
+        'category_failure': figures.category_failure(load('category_failure')),
+        'complaint_patterns': figures.complaint_patterns(load('complaint_patterns')),
+    }
+
+
+def build_sections(store):
+    """HTML body of each tab, keyed by tab id."""
+    model_performance = data.load('model_performance', store)
+    best = data.best_model(model_performance)
+    rule = data.load('rule_summary', store)
+    trajectory = data.load('trajectory_summary', store)
+    model_table = figures.model_table(model_performance).hide(axis='index').to_html()
+
+    return {
+        'overview': ''.join([
+            _grid(cards.overview_metrics(best), 4),
+            _grid(cards.overview_insights(), 3),
+            '<h3>Model Performance Comparison</h3>',
+            _chart('model_performance'),
+        ]),
+        'predictive_power': ''.join([
+            cards.predictive_banner(best),
+            _grid(cards.predictive_stats(best, trajectory), 3),
+            '<h3>Product Rating Trajectories: Early to 1-Year</h3>',
+            "<p>This visualization shows how products' ratings evolve from their first 100 reviews to one-year "
+            'performance. The tight clustering along the diagonal demonstrates that early ratings are highly '
+            'predictive of long-term success.</p>',
+            _chart('trajectories'),
+            '<h3>K-Means Clustering Analysis</h3>',
+            '<p>Unsupervised clustering reveals two distinct product groups based on early review characteristics. '
+            'Elite Performers show high ratings with low volatility, while High Risk products exhibit lower '
+            'ratings and greater inconsistency.</p>',
+            _chart('clusters'),
+            '<h3>Model Performance Metrics</h3>',
+            model_table,
+        ]),
+        'volatility_warning': ''.join([
+            cards.volatility_banner(rule),
+            _grid([
+                '<h3>Feature Importance Rankings</h3>' + _chart('feature_importance'),
+                '<h3>Alert Distribution</h3><p><strong>Risk Classification:</strong></p><ul>'
+                f"<li><strong>RED</strong>: Rating &lt;4.0 AND volatility &gt;1.0 → {rule['precision']:.1f}% "
+                'precision when flagged</li>'
+                f"<li><strong>YELLOW</strong>: Warning signs → {rule['yellow_fail']:.1f}% fail</li>"
+                f"<li><strong>GREEN</strong>: Strong &amp; stable → {rule['green_fail']:.1f}% fail</li></ul>"
+                + _chart('alert_distribution'),
+            ], 2),
+            cards.rule_box(rule),
+        ]),
+        'category_risk': ''.join([
+            cards.category_banner(),
+            cards.failure_explainer(),
+            '<h3>Failure Rate by Category</h3>',
+            _chart('category_failure'),
+            '<h3>Top 15 Complaint Patterns in Failed Products</h3>',
+            '<p>Most frequent complaint phrases from negative reviews of 120 failed products.</p>',
+            _chart('complaint_patterns'),
+            _grid(cards.category_cards(), 3),
+        ]),
+    }
+
+
+def export(store, out, plotlyjs='bundle'):
+    """Write the snapshot of ``store``'s current data version into ``out``; returns the manifest."""
+    out = Path(out)
+    staging = out.with_name(out.name + '.staging')
+    shutil.rmtree(staging, ignore_errors=True)
+    (staging / 'charts').mkdir(parents=True)
+
+    version = data.data_version(store)
+    charts = {}
+    for name, fig in build_charts(store).items():
+        raw = fig.to_json().encode()
+        packed = gzip.compress(raw, compresslevel=9, mtime=0)
+        (staging / 'charts' / f'{name}.json.gz').write_bytes(packed)
+        charts[name] = {'bytes': len(raw), 'gzip_bytes': len(packed)}
+
+    sections = build_sections(store)
+    exported = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+    page = PAGE.substitute(
+        version=html.escape(str(version)),
+        exported=exported,
+        header=cards.header(),
+        footer=cards.footer(),
+        nav=''.join(f'<button data-tab="{tab}">{label}</button>' for tab, label in TABS),
+        sections='\n'.join(f'<section id="{tab}" hidden>{sections[tab]}</section>' for tab, _ in TABS),
+        first=TABS[0][0],
+        **COLORS,
+    )
+    if plotlyjs == 'cdn':
+        from plotly.offline import get_plotlyjs_version
+        page = page.replace('src="plotly.min.js"', f'src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"')
+    else:
+        from plotly.offline import get_plotlyjs
+        (staging / 'plotly.min.js').write_text(get_plotlyjs())
+    (staging / 'index.html').write_text(page)
+    # Pre-compressed copy for servers that serve .gz siblings (nginx gzip_static)
+    (staging / 'index.html.gz').write_bytes(gzip.compress(page.encode(), compresslevel=9, mtime=0))
+
+    manifest = {'version': version, 'exported': exported, 'charts': charts}
+    (staging / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+    shutil.rmtree(out, ignore_errors=True)
+    os.replace(staging, out)
+    return manifest
+
+
+def exported_version(out):
+    try:
+        return json.loads((Path(out) / 'manifest.json').read_text())['version']
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export a static snapshot of the dashboard.')
+    parser.add_argument('out', nargs='?', default='data/snapshot')
+    parser.add_argument('--store', default=None, help='feature store (default: $FEATURE_STORE or data/feature_store)')
+    parser.add_argument('--plotlyjs', choices=['bundle', 'cdn'], default='bundle',
+                        help='ship plotly.min.js in the bundle or load it from the Plotly CDN')
+    parser.add_argument('--force', action='store_true', help='export even if the snapshot is current')
+    args = parser.parse_args(argv)
+
+    store = data.open_store(args.store)
+    version = data.data_version(store)
+    if not args.force and exported_version(args.out) == version:
+        print(f"{args.out} is already at data version {version}")
+        return
+    started = time.perf_counter()
+    manifest = export(store, args.out, args.plotlyjs)
+    packed = sum(c['gzip_bytes'] for c in manifest['charts'].values())
+    print(f"{args.out}: data version {version} | {len(manifest['charts'])} charts, {packed / 1024:,.0f} KiB gzipped "
+          f"| {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""Partitioned columnar feature store read by the dashboard.
+
+Every table is a directory of uncompressed Arrow IPC files under the store root.
+The per-product ``products`` table is hive-partitioned by ``category`` and
+``year`` (year of the product's first review). Readers only touch the columns
+they ask for; the dashboard reads the products it needs once per store version
+into ``product_success.products.ProductTable`` and filters that in memory.
+Files are opened through a memory-mapped filesystem and Arrow IPC needs no
+decoding, so reads are zero-copy until pandas conversion.
+"""
+import argparse
+import json
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from . import fixtures
+from .lazy import LazyModule
+from .trajectories import label_trajectories
+
+# The dataset and filesystem modules load when a table is first read; fixture-only
+# runs never import them (pandas may still import pyarrow's core on its own)
+pa = LazyModule('pyarrow')
+ds = LazyModule('pyarrow.dataset')
+pafs = LazyModule('pyarrow.fs')
+
+MANIFEST = 'manifest.json'
+PRODUCT_PARTITIONING = ['category', 'year']
+FORMAT = 'ipc'
+
+
+def new_version():
+    return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+
+
+class FeatureStore:
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._filesystem = None
+        self._datasets = {}
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        path = self.root / MANIFEST
+        if not path.exists():
+            return {'version': None, 'tables': {}}
+        return json.loads(path.read_text())
+
+    def _write_manifest(self):
+        self.manifest['version'] = new_version()
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / (MANIFEST + '.tmp')
+        tmp.write_text(json.dumps(self.manifest, indent=2))
+        tmp.replace(self.root / MANIFEST)
+
+    @property
+    def version(self):
+        return self.manifest['version']
+
+    @property
+    def exists(self):
+        return self.version is not None
+
+    def has(self, name):
+        return name in self.manifest['tables']
+
+    def columns(self, name):
+        return self.manifest['tables'][name]['columns']
+
+    def table_version(self, name):
+        """Version stamped on the last write of table ``name`` (None for older stores)."""
+        return self.manifest['tables'].get(name, {}).get('version')
+
+    def dataset(self, name):
+        if name not in self._datasets:
+            if self._filesystem is None:
+                self._filesystem = pafs.LocalFileSystem(use_mmap=True)
+            info = self.manifest['tables'][name]
+            self._datasets[name] = ds.dataset(
+                str(self.root / name), format=FORMAT, filesystem=self._filesystem,
+                partitioning='hive' if info['partitioning'] else None,
+            )
+        return self._datasets[name]
+
+    def read_table(self, name, columns=None):
+        return self.dataset(name).to_table(columns=columns)
+
+    def read(self, name, columns=None):
+        return self.read_table(name, columns).to_pandas(split_blocks=True)
+
+    def write(self, name, frame, partitioning=None):
+        """Replace table ``name`` with ``frame`` and bump the store version."""
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        target = self.root / name
+        staging = self.root / (name + '.staging')
+        shutil.rmtree(staging, ignore_errors=True)
+        if table.num_rows:
+            ds.write_dataset(
+                table, str(staging), format=FORMAT,
+                partitioning=partitioning, partitioning_flavor='hive' if partitioning else None,
+                existing_data_behavior='overwrite_or_ignore',
+            )
+        else:
+            # write_dataset writes no file at all for an empty table; keep one so the schema can be read
+            staging.mkdir(parents=True)
+            with pa.ipc.new_file(str(staging / 'part-0.arrow'), table.schema) as writer:
+                writer.write_table(table)
+        shutil.rmtree(target, ignore_errors=True)
+        staging.rename(target)
+        self._datasets.pop(name, None)
+        self.manifest['tables'][name] = {
+            'columns': table.column_names,
+            'rows': table.num_rows,
+            'partitioning': partitioning or [],
+            'version': new_version(),
+        }
+        self._write_manifest()
+
+    def record_artifact(self, name, path):
+        """Register a derived artifact (model, index) and bump the version so readers reload it."""
+        self.manifest.setdefault('artifacts', {})[name] = str(path)
+        self._write_manifest()
+
+
+def products_from_features(features):
+    """Shape ingest output into the partitioned ``products`` table."""
+    products = features.reset_index()
+    products['year'] = pd.to_datetime(products['first_review'], unit='s').dt.year.astype('int16')
+    if 'trajectory' not in products:
+        products['trajectory'] = label_trajectories(products['early_avg_rating'], products['oneyear_avg_rating'])
+    return products
+
+
+def build_store(root, features=None):
+    """Write the fixture tables, plus the ``products`` table when ``features`` are given."""
+    store = FeatureStore(root)
+    for name, build in fixtures.TABLES.items():
+        if name not in ('trajectory_data', 'kmeans_data') and not store.has(name):
+            store.write(name, build())
+    if features is not None:
+        store.write('products', products_from_features(features), PRODUCT_PARTITIONING)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the dashboard feature store.')
+    parser.add_argument('root', nargs='?', default='data/feature_store')
+    parser.add_argument('--features', help='output of product_success.ingest (.parquet or .csv)')
+    args = parser.parse_args(argv)
+
+    features = None
+    if args.features:
+        reader = pd.read_parquet if args.features.endswith('.parquet') else pd.read_csv
+        features = reader(args.features)
+        if 'product_id' in features:
+            features = features.set_index('product_id')
+    store = build_store(args.root, features)
+    for name, info in store.manifest['tables'].items():
+        print(f"{name}: {info['rows']:,} rows")
+    print(f"version {store.version} -> {store.root}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""Plotly figure builders for the dashboard charts.
+
+Built figures are cached and shared between sessions, so callers must treat
+them as read-only.
+
+Per-product scatter plots switch rendering path with the number of products:
+SVG up to ``WEBGL_THRESHOLD`` points, WebGL up to ``BINNED_THRESHOLD``, and
+above that the points are aggregated server-side into a fixed 2-D grid per
+colour group, so the payload is bounded by ``SCATTER_BINS`` squared per group
+whatever the catalog size.
+"""
+import numpy as np
+import pandas as pd
+
+from .lazy import LazyModule
+from .theme import COLORS, PRODUCT_LABELS
+
+# Plotly is imported when the first figure is built, not at app startup
+px = LazyModule('plotly.express')
+go = LazyModule('plotly.graph_objects')
+
+WEBGL_THRESHOLD = 5_000
+BINNED_THRESHOLD = 100_000
+SCATTER_BINS = 120
+
+
+def model_performance(model_performance):
+    fig = go.Figure()
+
+    metrics_to_plot = ['accuracy', 'precision', 'recall', 'f1']
+    colors_bar = [COLORS['primary'], COLORS['secondary'], COLORS['success'], COLORS['warning']]
+
+    for metric, color in zip(metrics_to_plot, colors_bar):
+        fig.add_trace(go.Bar(
+            name=metric.capitalize() + ' (%)',
+            x=model_performance['model'],
+            y=model_performance[metric],
+            marker_color=color
+        ))
+
+    fig.update_layout(
+        barmode='group',
+        yaxis=dict(range=[90, 101]),
+        height=400,
+        template='plotly_white'
+    )
+    return fig
+
+
+def model_table(model_performance):
+    return model_performance.style.highlight_max(
+        subset=['accuracy', 'precision', 'recall', 'f1', 'auc'],
+        color='lightgreen'
+    ).format({
+        'accuracy': '{:.1f}%',
+        'precision': '{:.1f}%',
+        'recall': '{:.1f}%',
+        'f1': '{:.1f}%',
+        'auc': '{:.1f}%'
+    })
+
+
+def _binned_scatter(frame, x, y, color, color_discrete_map, labels, opacity, height, bins):
+    codes, groups = pd.factorize(frame[color], sort=False)
+    xs = frame[x].to_numpy(dtype=np.float64)
+    ys = frame[y].to_numpy(dtype=np.float64)
+    valid = (codes >= 0) & np.isfinite(xs) & np.isfinite(ys)
+    codes, xs, ys = codes[valid], xs[valid], ys[valid]
+
+    # With nothing plottable every group gets an empty trace, keeping the legend
+    x_edges = np.linspace(xs.min(), xs.max(), bins + 1) if len(xs) else np.zeros(bins + 1)
+    y_edges = np.linspace(ys.min(), ys.max(), bins + 1) if len(ys) else np.zeros(bins + 1)
+    ix = np.clip(np.searchsorted(x_edges, xs, side='right') - 1, 0, bins - 1)
+    iy = np.clip(np.searchsorted(y_edges, ys, side='right') - 1, 0, bins - 1)
+    counts = np.bincount((codes * bins + ix) * bins + iy, minlength=len(groups) * bins * bins)
+    counts = counts.reshape(len(groups), bins, bins)
+
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    largest = counts.max()
+
+    fig = go.Figure()
+    for code, group in enumerate(groups):
+        cx, cy = np.nonzero(counts[code])
+        n = counts[code, cx, cy]
+        fig.add_trace(go.Scattergl(
+            x=x_centers[cx],
+            y=y_centers[cy],
+            mode='markers',
+            name=group,
+            legendgroup=group,
+            marker=dict(
+                color=color_discrete_map.get(group),
+                size=4 + 16 * np.sqrt(n / largest),
+                opacity=opacity
+            ),
+            customdata=n,
+            hovertemplate=(f"{labels.get(x, x)}=%{{x:.2f}}<br>{labels.get(y, y)}=%{{y:.2f}}"
+                           "<br>Products=%{customdata:,}<extra>" + str(group) + "</extra>")
+        ))
+    fig.update_layout(
+        height=height,
+        legend_title_text=labels.get(color, color),
+        xaxis_title=labels.get(x, x),
+        yaxis_title=labels.get(y, y)
+    )
+    return fig
+
+
+def product_scatter(frame, x, y, color, color_discrete_map, opacity=0.6, height=500,
+                    webgl_threshold=WEBGL_THRESHOLD, binned_threshold=BINNED_THRESHOLD,
+                    bins=SCATTER_BINS):
+    """One point per product for small catalogs, WebGL or 2-D bins for large ones."""
+    if len(frame) > binned_threshold:
+        return _binned_scatter(frame, x, y, color, color_discrete_map, PRODUCT_LABELS,
+                               opacity, height, bins)
+    return px.scatter(
+        frame,
+        x=x,
+        y=y,
+        color=color,
+        color_discrete_map=color_discrete_map,
+        labels=PRODUCT_LABELS,
+        opacity=opacity,
+        height=height,
+        render_mode='webgl' if len(frame) > webgl_threshold else 'auto'
+    )
+
+
+def trajectories(trajectory_data):
+    fig = product_scatter(
+        trajectory_data,
+        x='early_avg_rating',
+        y='oneyear_avg_rating',
+        color='trajectory',
+        color_discrete_map={
+            'Stable High': COLORS['success'],
+            'Stable Low': COLORS['danger'],
+            'Recovered': COLORS['secondary'],
+            'Declined': COLORS['warning']
+        }
+    )
+
+    # Add diagonal line
+    fig.add_trace(go.Scatter(
+        x=[2, 5],
+        y=[2, 5],
+        mode='lines',
+        line=dict(dash='dash', color='gray', width=2),
+        name='No Change Line',
+        showlegend=True
+    ))
+
+    # Add success threshold line
+    fig.add_hline(y=4.0, line_dash="dot", line_color="red",
+                  annotation_text="Success Threshold (4.0)",
+                  annotation_position="right")
+
+    fig.update_layout(
+        xaxis_title="Early Average Rating (First 100 Reviews)",
+        yaxis_title="1-Year Average Rating",
+        template='plotly_white',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def clusters(kmeans_data, thresholds=None):
+    thresholds = thresholds or {'rating': 4.0, 'volatility': 1.0}
+
+    fig = product_scatter(
+        kmeans_data,
+        x='early_avg_rating',
+        y='early_rating_std',
+        color='cluster',
+        color_discrete_map={
+            'Elite Performers': COLORS['success'],
+            'High Risk': COLORS['secondary']
+        }
+    )
+
+    # Add threshold lines
+    fig.add_vline(x=thresholds['rating'], line_dash="dot", line_color="red",
+                  annotation_text=f"Rating Threshold: {round(thresholds['rating'], 2)}")
+    fig.add_hline(y=thresholds['volatility'], line_dash="dot", line_color=COLORS['warning'],
+                  annotation_text=f"Volatility Threshold: {round(thresholds['volatility'], 2)}")
+
+    fig.update_layout(
+        xaxis_title="Early Average Rating",
+        yaxis_title="Rating Volatility (Std Dev)",
+        template='plotly_white',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def feature_importance(feature_importance):
+    fig = px.bar(
+        feature_importance,
+        y='feature',
+        x='importance',
+        orientation='h',
+        color='importance',
+        color_continuous_scale=['#146EB4', '#F0C14B'],
+        labels={'importance': 'Importance', 'feature': 'Feature'}
+    )
+
+    fig.update_layout(
+        height=300,
+        showlegend=False,
+        template='plotly_white'
+    )
+    return fig
+
+
+def alert_distribution(alert_distribution):
+    fig = px.pie(
+        alert_distribution,
+        values='value',
+        names='name',
+        color='name',
+        color_discrete_map={
+            'RED - High Risk': COLORS['danger'],
+            'YELLOW - Monitor': COLORS['warning'],
+            'GREEN - Safe': COLORS['success']
+        }
+    )
+
+    fig.update_layout(height=300)
+    return fig
+
+
+def category_failure(category_failure):
+    fig = px.bar(
+        category_failure,
+        x='category',
+        y='rate',
+        color='category',
+        color_discrete_map={
+            'Beauty': COLORS['danger'],
+            'Electronics': COLORS['warning'],
+            'Pet_Supplies': COLORS['success']
+        },
+        labels={'rate': '% Products Ending <4.0', 'category': 'Category'}
+    )
+
+    fig.update_layout(
+        showlegend=False,
+        height=400,
+        template='plotly_white'
+    )
+    return fig
+
+
+def complaint_patterns(complaint_patterns):
+    fig = px.bar(
+        complaint_patterns,
+        y='pattern',
+        x='frequency',
+        orientation='h',
+        color='frequency',
+        color_continuous_scale=['#8b1a04', '#B12704'],
+        labels={'frequency': 'Frequency', 'pattern': 'Complaint Pattern'}
+    )
+
+    fig.update_layout(
+        height=500,
+        showlegend=False,
+        template='plotly_white'
+    )
+    return fig
@@ -0,0 +1,136 @@
+"""Built-in dashboard data, used for any table the feature store does not provide."""
+import numpy as np
+import pandas as pd
+
+from .trajectories import TRAJECTORIES
+
+
+def model_performance():
+    return pd.DataFrame({
+        'model': ['Logistic Regression', 'Random Forest', 'Gradient Boosting'],
+        'accuracy': [95.8, 96.8, 95.8],
+        'precision': [95.9, 100.0, 98.6],
+        'recall': [98.6, 95.8, 95.8],
+        'f1': [97.2, 97.8, 97.1],
+        'auc': [99.2, 99.3, 99.5]
+    })
+
+
+def feature_importance():
+    return pd.DataFrame({
+        'feature': ['early_avg_rating', 'early_rating_std', 'early_1star_rate',
+                    'early_5star_rate', 'early_avg_sentiment'],
+        'importance': [0.327, 0.255, 0.133, 0.125, 0.046]
+    })
+
+
+def category_failure():
+    return pd.DataFrame({
+        'category': ['Beauty', 'Electronics', 'Pet_Supplies'],
+        'rate': [31.7, 11.7, 11.4]
+    })
+
+
+def alert_distribution():
+    return pd.DataFrame({
+        'name': ['RED - High Risk', 'YELLOW - Monitor', 'GREEN - Safe'],
+        'value': [125, 39, 307]
+    })
+
+
+def rule_summary():
+    return {
+        'products': 471,
+        'flagged': 125,
+        'flagged_share': 26.5,
+        'precision': 91.2,
+        'recall': 95.0,
+        'yellow_fail': 5.1,
+        'green_fail': 1.3,
+    }
+
+
+def trajectory_summary():
+    return {'products': 471, 'stable_share': 73.2}
+
+
+def complaint_patterns():
+    return pd.DataFrame({
+        'pattern': ['waste money', 'dont waste', 'doesnt work', 'poor quality', 'stopped working',
+                    'didnt work', 'disappointed product', 'would recommend', 'work well', 'thick hair',
+                    'waste time', 'nothing like', 'nail polish', 'dont know', 'works well'],
+        'frequency': [259, 125, 72, 67, 55, 51, 40, 38, 38, 33, 30, 30, 29, 28, 28]
+    })
+
+
+def _sample_views():
+    # Same draws as the original notebook export: seed 42, trajectories first
+    rng = np.random.RandomState(42)
+
+    # Product Rating Trajectories data
+    n_stable_high = 340
+    n_stable_low = 114
+    n_recovered = 11
+    n_declined = 6
+
+    early_stable_high = rng.uniform(4.2, 5.0, n_stable_high)
+    oneyear_stable_high = early_stable_high + rng.normal(0, 0.15, n_stable_high)
+    oneyear_stable_high = np.clip(oneyear_stable_high, 4.0, 5.0)
+
+    early_stable_low = rng.uniform(2.0, 3.9, n_stable_low)
+    oneyear_stable_low = early_stable_low + rng.normal(0, 0.2, n_stable_low)
+    oneyear_stable_low = np.clip(oneyear_stable_low, 1.5, 3.99)
+
+    early_recovered = rng.uniform(3.5, 3.9, n_recovered)
+    oneyear_recovered = rng.uniform(4.0, 4.5, n_recovered)
+
+    early_declined = rng.uniform(4.3, 4.7, n_declined)
+    oneyear_declined = rng.uniform(3.5, 3.99, n_declined)
+
+    trajectory_data = pd.DataFrame({
+        'early_avg_rating': np.concatenate([early_stable_high, early_stable_low, early_recovered, early_declined]),
+        'oneyear_avg_rating': np.concatenate([oneyear_stable_high, oneyear_stable_low, oneyear_recovered, oneyear_declined]),
+        'trajectory': pd.Categorical.from_codes(
+            np.repeat(np.arange(4, dtype=np.int8), [n_stable_high, n_stable_low, n_recovered, n_declined]),
+            categories=TRAJECTORIES
+        )
+    })
+
+    # K-Means Clustering data
+    n_elite = 312
+    n_risk = 159
+
+    elite_rating = rng.uniform(4.2, 5.0, n_elite)
+    elite_volatility = rng.uniform(0.3, 1.0, n_elite)
+
+    risk_rating = rng.uniform(2.0, 4.2, n_risk)
+    risk_volatility = rng.uniform(1.0, 1.8, n_risk)
+
+    kmeans_data = pd.DataFrame({
+        'early_avg_rating': np.concatenate([elite_rating, risk_rating]),
+        'early_rating_std': np.concatenate([elite_volatility, risk_volatility]),
+        'cluster': pd.Categorical.from_codes(
+            np.repeat(np.arange(2, dtype=np.int8), [n_elite, n_risk]),
+            categories=['Elite Performers', 'High Risk']
+        )
+    })
+    return trajectory_data, kmeans_data
+
+
+def trajectory_data():
+    return _sample_views()[0]
+
+
+def kmeans_data():
+    return _sample_views()[1]
+
+
+TABLES = {
+    'model_performance': model_performance,
+    'feature_importance': feature_importance,
+    'category_failure': category_failure,
+    'alert_distribution': alert_distribution,
+    'complaint_patterns': complaint_patterns,
+    'trajectory_data': trajectory_data,
+    'kmeans_data': kmeans_data,
+}
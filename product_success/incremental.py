@@ -0,0 +1,145 @@
+"""Incremental early-review statistics, updated as new reviews arrive.
+
+``EarlyStatsAggregator`` keeps per-product running state for the first
+``EARLY_WINDOW`` reviews (count, Welford mean and M2, star-bucket counts) in
+flat NumPy arrays. A batch of new reviews is folded in with the parallel
+(Chan et al.) form of Welford's update. Sorting the batch by product and
+time dominates, so a batch costs O(batch log batch) regardless of how many
+reviews were seen before.
+
+A batch may arrive in any order, but it may only append to a product's
+history. A product that receives a review older than the newest review in
+its early window is marked stale: its early statistics are no longer those
+of its first reviews, so it is left out of the alert counts until the state
+is rebuilt. The CLI reads its files with ``update_files``, so unordered
+files within one run are fine.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import scoring
+from .ingest import EARLY_WINDOW
+from .state import DEFAULT_PARTITIONS, ProductState
+
+
+class EarlyStatsAggregator(ProductState):
+
+    STATE = ('count', 'reviews', 'mean', 'm2', 'stars', 'early_last', 'stale')
+    SETTINGS = ('window',)
+    SAVE_DTYPES = {'stars': np.uint8}
+
+    def __init__(self, window=EARLY_WINDOW, capacity=1024):
+        super().__init__()
+        self.window = window
+        self.count = np.zeros(capacity, dtype=np.int32)
+        self.reviews = np.zeros(capacity, dtype=np.int64)
+        self.mean = np.zeros(capacity, dtype=np.float64)
+        self.m2 = np.zeros(capacity, dtype=np.float64)
+        self.stars = np.zeros((capacity, 5), dtype=np.int32)
+        self.early_last = np.zeros(capacity, dtype=np.int64)
+        self.stale = np.zeros(capacity, dtype=bool)
+
+    def update(self, product_ids, timestamps, ratings):
+        """Fold a batch of reviews, in any order, into the running state."""
+        self.apply(self.codes(product_ids), timestamps, ratings)
+
+    def apply(self, codes, timestamps, ratings):
+        """``update`` for reviews already mapped to state rows with ``codes``."""
+        codes = np.asarray(codes, dtype=np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=np.float64)
+        if not len(codes):
+            return
+
+        order = np.lexsort((timestamps, codes))
+        codes, timestamps, ratings = codes[order], timestamps[order], ratings[order]
+        unique, starts, sizes = np.unique(codes, return_index=True, return_counts=True)
+
+        # Until the window is full every review is in it, so ``early_last`` is
+        # the newest review seen; an older one would change the window
+        late = self.stale[unique] | ((self.reviews[unique] > 0) & (timestamps[starts] < self.early_last[unique]))
+        if late.any():
+            self.stale[unique[late]] = True
+            keep = ~np.repeat(late, sizes)
+            codes, timestamps, ratings = codes[keep], timestamps[keep], ratings[keep]
+            unique, sizes = unique[~late], sizes[~late]
+            starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+        if not len(codes):
+            return
+        self.reviews[unique] += sizes
+
+        # Only the reviews that still fit in each product's early window count
+        rank = np.arange(len(codes)) - np.repeat(starts, sizes)
+        keep = rank < (self.window - self.count[codes])
+        codes, timestamps, ratings = codes[keep], timestamps[keep], ratings[keep]
+        if not len(codes):
+            return
+
+        unique, inverse = np.unique(codes, return_inverse=True)
+        n_b = np.bincount(inverse).astype(np.float64)
+        mean_b = np.bincount(inverse, ratings) / n_b
+        m2_b = np.bincount(inverse, (ratings - mean_b[inverse]) ** 2)
+
+        n_a = self.count[unique].astype(np.float64)
+        mean_a = self.mean[unique]
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self.mean[unique] = mean_a + delta * n_b / n
+        self.m2[unique] += m2_b + delta ** 2 * n_a * n_b / n
+        self.count[unique] = n.astype(np.int32)
+        self.early_last[unique] = np.maximum.reduceat(timestamps, np.searchsorted(codes, unique))
+
+        buckets = np.clip(np.rint(ratings), 1, 5).astype(np.int64) - 1
+        np.add.at(self.stars, (codes, buckets), 1)
+
+    def features(self, min_reviews=1):
+        n = len(self.product_ids)
+        count = self.count[:n]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self.m2[:n] / (count - 1))
+            rates = self.stars[:n] / count[:, None]
+        frame = pd.DataFrame({
+            'early_reviews': count,
+            'n_reviews': self.reviews[:n],
+            'early_avg_rating': self.mean[:n].astype(np.float32),
+            'early_rating_std': np.nan_to_num(std).astype(np.float32),
+            'early_1star_rate': rates[:, 0].astype(np.float32),
+            'early_5star_rate': rates[:, 4].astype(np.float32),
+            'stale': self.stale[:n],
+        }, index=pd.Index(self.product_ids, name='product_id'))
+        return frame[frame['early_reviews'] >= min_reviews]
+
+    def alert_distribution(self, min_reviews=1):
+        features = self.features(min_reviews)
+        features = features[~features['stale']]
+        return scoring.alert_distribution(scoring.score_products(features))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fold new review files into the incremental early-review state.')
+    parser.add_argument('state', help='state file (.npz), created if missing')
+    parser.add_argument('paths', nargs='+', help='review files with the new reviews')
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--partitions', type=int, default=DEFAULT_PARTITIONS,
+                        help='spill files the new reviews are split into by product; memory is about 1/partitions '
+                             'of the new reviews')
+    parser.add_argument('--spill-dir', help='directory for the spill files (default: system temp)')
+    args = parser.parse_args(argv)
+
+    agg = EarlyStatsAggregator.load(args.state) if Path(args.state).exists() else EarlyStatsAggregator()
+    agg.update_files(args.paths, args.chunk_size, args.partitions, args.spill_dir)
+    agg.save(args.state)
+    print(f"{len(agg):,} products in {args.state}")
+    stale = int(agg.stale[:len(agg)].sum())
+    if stale:
+        print(f"warning: {stale:,} products received reviews older than their early window and are left out "
+              f"of the alert counts; rebuild {args.state} from all review files", file=sys.stderr)
+    print(agg.alert_distribution().to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""Streaming ingestion of raw review files into per-product early-review features.
+
+Review files (JSONL or CSV, optionally gzip-compressed) are read in fixed-size
+chunks. Only a bounded per-product state is kept between chunks: the earliest
+``EARLY_WINDOW`` reviews of every product and running sums for the 1-year
+window, so memory depends on the number of products, never on the number of
+reviews in the corpus.
+"""
+import argparse
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+EARLY_WINDOW = 100
+ONE_YEAR_SECONDS = 365 * 24 * 3600
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Canonical column -> accepted source names, in order of preference.
+# Covers the 2018 and 2023 releases of the Amazon review corpus.
+SOURCE_COLUMNS = {
+    'product_id': ['parent_asin', 'asin', 'product_id'],
+    'rating': ['rating', 'overall', 'star_rating'],
+    'timestamp': ['timestamp', 'unixReviewTime', 'review_date'],
+    'text': ['text', 'reviewText', 'review_body'],
+    'category': ['category', 'main_category', 'product_category'],
+}
+
+FEATURE_COLUMNS = ['early_avg_rating', 'early_rating_std', 'early_1star_rate', 'early_5star_rate']
+
+
+@dataclass
+class IngestStats:
+    rows: int = 0
+    chunks: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def tick(self, rows):
+        self.rows += rows
+        self.chunks += 1
+        self.elapsed = time.perf_counter() - self.started
+
+    def __str__(self):
+        return f"{self.rows:,} rows in {self.elapsed:.1f}s ({self.rows_per_sec:,.0f} rows/sec)"
+
+
+def _category_from_path(path):
+    return Path(path).name.split('.')[0]
+
+
+def _to_epoch_seconds(values):
+    if pd.api.types.is_numeric_dtype(values):
+        seconds = values.astype('int64')
+        # The 2023 corpus stores milliseconds, the 2018 corpus seconds.
+        return seconds.where(seconds < 10**11, seconds // 1000)
+    return pd.to_datetime(values, utc=True).astype('int64') // 10**9
+
+
+def normalize_chunk(chunk, path, columns):
+    """Map a raw chunk onto the canonical review columns."""
+    out = pd.DataFrame(index=chunk.index)
+    for name in columns:
+        source = next((c for c in SOURCE_COLUMNS[name] if c in chunk.columns), None)
+        if source is not None:
+            out[name] = chunk[source]
+        elif name == 'category':
+            out[name] = _category_from_path(path)
+        else:
+            raise ValueError(f"{path}: no column for '{name}' (tried {SOURCE_COLUMNS[name]})")
+    if 'rating' in out:
+        out['rating'] = out['rating'].astype('float32')
+    if 'timestamp' in out:
+        out['timestamp'] = _to_epoch_seconds(out['timestamp'])
+    if 'product_id' in out:
+        out['product_id'] = out['product_id'].astype(str)
+    return out
+
+
+def iter_review_chunks(paths, columns=('product_id', 'category', 'timestamp', 'rating'),
+                       chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """Yield normalized review chunks of at most ``chunk_size`` rows from every file."""
+    columns = list(columns)
+    for path in paths:
+        path = str(path)
+        if '.csv' in Path(path).suffixes:
+            wanted = {c for name in columns for c in SOURCE_COLUMNS[name]}
+            reader = pd.read_csv(path, chunksize=chunk_size, compression='infer',
+                                 usecols=lambda c: c in wanted)
+        else:
+            reader = pd.read_json(path, lines=True, chunksize=chunk_size, compression='infer',
+                                  dtype=False, convert_dates=False)
+        with reader:
+            for chunk in reader:
+                chunk = normalize_chunk(chunk, path, columns)
+                if stats is not None:
+                    stats.tick(len(chunk))
+                yield chunk
+
+
+def keep_earliest(state, chunk, window):
+    """Merge ``chunk`` into ``state`` (or start from it) keeping each product's earliest ``window`` reviews."""
+    merged = chunk if state is None else pd.concat([state, chunk], ignore_index=True)
+    merged = merged.sort_values(['product_id', 'timestamp'], kind='stable')
+    return merged.groupby('product_id', sort=False).head(window).reset_index(drop=True)
+
+
+def _add_counts(total, counts):
+    return counts if total is None else total.add(counts, fill_value=0)
+
+
+def early_window(paths, window=EARLY_WINDOW, chunk_size=DEFAULT_CHUNK_SIZE, stats=None,
+                 progress=None, columns=('product_id', 'category', 'timestamp', 'rating')):
+    """First pass: the earliest ``window`` reviews per product and total review counts."""
+    state = None
+    counts = None
+    for chunk in iter_review_chunks(paths, columns, chunk_size, stats):
+        counts = _add_counts(counts, chunk['product_id'].value_counts())
+        state = keep_earliest(state, chunk, window)
+        if progress is not None:
+            progress(stats)
+    if state is None:
+        raise ValueError('no reviews found')
+    return state, counts.astype('int64')
+
+
+def one_year_ratings(paths, first_review, chunk_size=DEFAULT_CHUNK_SIZE, stats=None, progress=None):
+    """Second pass: mean rating of the reviews posted within a year of each product's first review."""
+    sums = None
+    counts = None
+    for chunk in iter_review_chunks(paths, ('product_id', 'timestamp', 'rating'), chunk_size, stats):
+        start = chunk['product_id'].map(first_review)
+        chunk = chunk[start.notna() & (chunk['timestamp'] <= start + ONE_YEAR_SECONDS)]
+        grouped = chunk.groupby('product_id')['rating']
+        sums = _add_counts(sums, grouped.sum())
+        counts = _add_counts(counts, grouped.count())
+        if progress is not None:
+            progress(stats)
+    return sums / counts
+
+
+def summarize_early(early):
+    """Per-product early-review features from the early-window reviews."""
+    rating = early['rating']
+    grouped = rating.groupby(early['product_id'])
+    return pd.DataFrame({
+        'category': early.groupby('product_id')['category'].first(),
+        'first_review': early.groupby('product_id')['timestamp'].min(),
+        'early_avg_rating': grouped.mean(),
+        'early_rating_std': grouped.std().fillna(0.0),
+        'early_1star_rate': (rating == 1).groupby(early['product_id']).mean(),
+        'early_5star_rate': (rating == 5).groupby(early['product_id']).mean(),
+    })
+
+
+def compute_early_features(paths, window=EARLY_WINDOW, min_reviews=EARLY_WINDOW,
+                           chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Compute early-review features and the 1-year rating for every product.
+
+    Returns ``(features, stats)``; ``features`` is indexed by ``product_id``
+    and ``stats`` holds one ``IngestStats`` per pass over the files.
+    Products with fewer than ``min_reviews`` reviews are dropped.
+    """
+    paths = [str(p) for p in paths]
+    first_pass = IngestStats()
+    early, counts = early_window(paths, window, chunk_size, first_pass, progress)
+    keep = counts[counts >= min_reviews].index
+    early = early[early['product_id'].isin(keep)]
+
+    features = summarize_early(early)
+    features['n_reviews'] = counts.reindex(features.index)
+    second_pass = IngestStats()
+    features['oneyear_avg_rating'] = one_year_ratings(
+        paths, features['first_review'], chunk_size, second_pass, progress
+    ).reindex(features.index)
+    features.index.name = 'product_id'
+    features[FEATURE_COLUMNS + ['oneyear_avg_rating']] = (
+        features[FEATURE_COLUMNS + ['oneyear_avg_rating']].astype(np.float32)
+    )
+    return features, (first_pass, second_pass)
+
+
+def write_frame(frame, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.parquet':
+        frame.to_parquet(path)
+    else:
+        frame.to_csv(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compute early-review features from raw review files.')
+    parser.add_argument('paths', nargs='+', help='review files (.jsonl, .csv, optionally .gz)')
+    parser.add_argument('-o', '--output', default='data/features.parquet')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--window', type=int, default=EARLY_WINDOW)
+    parser.add_argument('--min-reviews', type=int, default=EARLY_WINDOW)
+    args = parser.parse_args(argv)
+
+    def progress(stats):
+        print(f"\r{stats}", end='', file=sys.stderr)
+
+    features, stats = compute_early_features(
+        args.paths, args.window, args.min_reviews, args.chunk_size, progress
+    )
+    print(file=sys.stderr)
+    write_frame(features, args.output)
+    print(f"{len(features):,} products -> {args.output} | early window pass: {stats[0]} | 1-year pass: {stats[1]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Concurrent loading of the dashboard's independent data artifacts.
+
+Every table the open tabs need is submitted to one shared thread pool at the
+start of a rerun. Each tab waits only for its own sources, in the order they become
+ready. A source that misses its deadline is reported as pending; its load keeps
+running in the background, and a later rerun picks up the result.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def parse_timeouts(spec):
+    """``'kmeans_data=30,trajectory_data=30'`` -> ``{'kmeans_data': 30.0, ...}``."""
+    timeouts = {}
+    for item in filter(None, (part.strip() for part in (spec or '').split(','))):
+        name, _, seconds = item.partition('=')
+        timeouts[name.strip()] = float(seconds)
+    return timeouts
+
+
+class Loader:
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT, timeouts=None):
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix='dashboard-loader')
+
+    def fetch(self, groups, load):
+        """Start loading every source of every group.
+
+        ``groups`` maps a group name (a tab) to ``[(source, params), ...]``;
+        ``load(source, **params)`` is called once per distinct source.
+        Returns a ``Batch`` to wait on.
+        """
+        started = time.monotonic()
+        futures = {}
+        for sources in groups.values():
+            for source, params in sources:
+                key = (source, tuple(sorted(params.items())))
+                if key not in futures:
+                    futures[key] = self._pool.submit(load, source, **params)
+        deadlines = {key: started + self.timeouts.get(key[0], self.timeout) for key in futures}
+        members = {
+            group: {(source, tuple(sorted(params.items()))) for source, params in sources}
+            for group, sources in groups.items()
+        }
+        return Batch(futures, deadlines, members)
+
+
+class Batch:
+
+    def __init__(self, futures, deadlines, members):
+        self.futures = futures
+        self.deadlines = deadlines
+        self.members = members
+
+    def ready(self, groups=None):
+        """Yield ``(group, timed_out_sources)`` as each group's sources finish or expire.
+
+        Groups whose sources all finished come first, as soon as they do.
+        A group with a source past its deadline is yielded with that source's
+        name in ``timed_out_sources``.
+        """
+        remaining = {g: self.members[g] for g in (groups if groups is not None else self.members)}
+        while remaining:
+            now = time.monotonic()
+            for group, keys in list(remaining.items()):
+                if all(self.futures[k].done() for k in keys):
+                    del remaining[group]
+                    yield group, []
+                    continue
+                expired = sorted(k[0] for k in keys
+                                 if not self.futures[k].done() and self.deadlines[k] <= now)
+                if expired:
+                    del remaining[group]
+                    yield group, expired
+            if not remaining:
+                return
+
+            waiting = {k for keys in remaining.values() for k in keys if not self.futures[k].done()}
+            if not waiting:
+                continue  # the last sources finished after the check above
+            next_deadline = min(self.deadlines[k] for k in waiting)
+            wait([self.futures[k] for k in waiting], timeout=max(0.0, next_deadline - time.monotonic()),
+                 return_when=FIRST_COMPLETED)
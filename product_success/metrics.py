@@ -0,0 +1,120 @@
+"""Per-section timings and payload counters for the dashboard, exported as Prometheus text.
+
+One ``Metrics`` instance is shared by every session. Sections are timed into
+histograms, bytes handed to the browser are counted by kind, and
+``write_prometheus`` renders everything (plus cache statistics) in the text
+exposition format for a local scraper's textfile collector.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Histogram:
+
+    def __init__(self):
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def observe(self, seconds):
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+
+    def __init__(self):
+        self.sections = {}
+        self.bytes_sent = {}
+        self.reruns = 0
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    def observe(self, name, seconds):
+        with self._lock:
+            self.sections.setdefault(name, _Histogram()).observe(seconds)
+
+    @contextmanager
+    def section(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def add_bytes(self, kind, n):
+        with self._lock:
+            self.bytes_sent[kind] = self.bytes_sent.get(kind, 0) + n
+
+    def rerun(self):
+        with self._lock:
+            self.reruns += 1
+
+    def snapshot(self):
+        """Rows for the debug panel: one per section, slowest total first."""
+        with self._lock:
+            rows = [{
+                'section': name,
+                'calls': h.count,
+                'last_ms': round(1000 * h.last, 2),
+                'mean_ms': round(1000 * h.sum / h.count, 2),
+                'max_ms': round(1000 * h.max, 2),
+                'total_s': round(h.sum, 3),
+            } for name, h in self.sections.items()]
+        return sorted(rows, key=lambda r: -r['total_s'])
+
+    def render_prometheus(self, cache_stats=None):
+        lines = [
+            '# HELP dashboard_reruns_total Script reruns served.',
+            '# TYPE dashboard_reruns_total counter',
+            f'dashboard_reruns_total {self.reruns}',
+            '# HELP dashboard_section_seconds Time spent in each named dashboard section.',
+            '# TYPE dashboard_section_seconds histogram',
+        ]
+        with self._lock:
+            for name, h in sorted(self.sections.items()):
+                label = f'section="{_label(name)}"'
+                for bound, count in zip(BUCKETS, h.buckets):
+                    lines.append(f'dashboard_section_seconds_bucket{{{label},le="{bound}"}} {count}')
+                lines.append(f'dashboard_section_seconds_bucket{{{label},le="+Inf"}} {h.count}')
+                lines.append(f'dashboard_section_seconds_sum{{{label}}} {h.sum:.6f}')
+                lines.append(f'dashboard_section_seconds_count{{{label}}} {h.count}')
+            lines += [
+                '# HELP dashboard_bytes_sent_total Bytes of HTML and chart JSON sent to browsers.',
+                '# TYPE dashboard_bytes_sent_total counter',
+            ]
+            lines += [f'dashboard_bytes_sent_total{{kind="{_label(kind)}"}} {n}'
+                      for kind, n in sorted(self.bytes_sent.items())]
+        if cache_stats:
+            for key, kind in (('hits', 'counter'), ('misses', 'counter'), ('evictions', 'counter')):
+                lines += [f'# TYPE dashboard_cache_{key}_total {kind}',
+                          f"dashboard_cache_{key}_total {cache_stats[key]}"]
+            lines += ['# TYPE dashboard_cache_entries gauge', f"dashboard_cache_entries {cache_stats['entries']}"]
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path, cache_stats=None, min_interval=5.0):
+        """Atomically rewrite ``path``, at most once every ``min_interval`` seconds."""
+        now = time.monotonic()
+        if now - self._last_write < min_interval:
+            return False
+        self._last_write = now
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(self.render_prometheus(cache_stats))
+        os.replace(tmp, path)
+        return True
@@ -0,0 +1,113 @@
+"""Compact per-product table shared read-only by all dashboard sessions.
+
+Label columns (category, trajectory, cluster, alert tier) are held as small
+integer codes into a label list and ratings as float32, so a million products
+take about 20 MB instead of the ~200 MB of object strings and float64 columns.
+The arrays are marked read-only; frames handed out for the whole catalog wrap
+them without copying.
+"""
+import numpy as np
+import pandas as pd
+
+from . import clustering, scoring
+from .trajectories import TRAJECTORIES, label_trajectories
+
+PRODUCT_COLUMNS = ['category', 'year', 'early_avg_rating', 'early_rating_std', 'oneyear_avg_rating', 'trajectory']
+LABELS = {
+    'trajectory': TRAJECTORIES,
+    'cluster': clustering.CLUSTER_NAMES,
+    'alert_tier': scoring.ALERT_TIERS,
+}
+
+
+def _code_dtype(n_labels):
+    return np.int8 if n_labels < 2 ** 7 else np.int16 if n_labels < 2 ** 15 else np.int32
+
+
+def _readonly(array):
+    array = np.ascontiguousarray(array)
+    array.flags.writeable = False
+    return array
+
+
+class ProductTable:
+
+    def __init__(self, arrays, labels):
+        self.arrays = {name: _readonly(array) for name, array in arrays.items()}
+        self.labels = {name: list(values) for name, values in labels.items()}
+
+    @classmethod
+    def from_frame(cls, frame, labels=None):
+        """Encode ``frame``: string/categorical columns to codes, floats to float32."""
+        labels = dict(LABELS, **(labels or {}))
+        arrays, used = {}, {}
+        for name in frame.columns:
+            column = frame[name]
+            if isinstance(column.dtype, pd.CategoricalDtype) or not pd.api.types.is_numeric_dtype(column):
+                values = pd.Categorical(column, categories=labels.get(name))
+                used[name] = list(values.categories)
+                arrays[name] = values.codes.astype(_code_dtype(len(used[name])))
+            elif pd.api.types.is_float_dtype(column):
+                arrays[name] = column.to_numpy(dtype=np.float32)
+            else:
+                arrays[name] = column.to_numpy()
+        return cls(arrays, used)
+
+    def __len__(self):
+        return len(next(iter(self.arrays.values()))) if self.arrays else 0
+
+    @property
+    def columns(self):
+        return list(self.arrays)
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self.arrays.values())
+
+    def codes(self, name):
+        return self.arrays[name]
+
+    def mask(self, categories=None, years=None):
+        """Boolean row mask for a category list and a ``(first, last)`` year range, or None for all rows."""
+        mask = None
+        if categories is not None:
+            wanted = [i for i, c in enumerate(self.labels['category']) if c in set(categories)]
+            mask = np.isin(self.arrays['category'], wanted)
+        if years is not None:
+            year = self.arrays['year']
+            in_range = (year >= years[0]) & (year <= years[1])
+            mask = in_range if mask is None else mask & in_range
+        return mask
+
+    def frame(self, columns=None, categories=None, years=None):
+        """DataFrame view: categorical label columns and float32 ratings, zero-copy when unfiltered."""
+        mask = self.mask(categories, years)
+        data = {}
+        for name in columns or self.columns:
+            array = self.arrays[name] if mask is None else self.arrays[name][mask]
+            if name in self.labels:
+                array = pd.Categorical.from_codes(array, categories=self.labels[name], validate=False)
+            data[name] = array
+        return pd.DataFrame(data, copy=False)
+
+
+def build(store):
+    """Product table from the store: features plus trajectory, alert tier and (with a k-means model) cluster."""
+    available = store.columns('products')
+    columns = [c for c in PRODUCT_COLUMNS + clustering.CLUSTER_FEATURES + ['cluster'] if c in available]
+    frame = store.read('products', list(dict.fromkeys(columns)))
+    if 'trajectory' not in frame and {'early_avg_rating', 'oneyear_avg_rating'} <= set(frame):
+        frame['trajectory'] = label_trajectories(frame['early_avg_rating'], frame['oneyear_avg_rating'])
+
+    labels = {}
+    if {'early_avg_rating', 'early_rating_std'} <= set(frame):
+        frame['alert_tier'] = pd.Categorical.from_codes(scoring.score_products(frame), categories=scoring.ALERT_TIERS)
+    if 'cluster' not in frame and set(clustering.CLUSTER_FEATURES) <= set(frame):
+        model = clustering.load_model(store)
+        if model is not None:
+            names = model.names()
+            labels['cluster'] = list(names[model.order()])
+            frame['cluster'] = clustering.assign(model, frame)
+    if 'cluster' in frame and 'cluster' not in labels:
+        labels['cluster'] = None  # names come from the stored column
+    return ProductTable.from_frame(frame, labels)
@@ -0,0 +1,91 @@
+"""Vectorized volatility warning rule and RED/YELLOW/GREEN alert tiers.
+
+Everything here works on whole NumPy arrays of products in one pass:
+
+- RED: early rating below the rating threshold AND volatility above 1.0
+- YELLOW: exactly one of the two warning signs
+- GREEN: neither
+
+A product has failed when its 1-year rating ends below 4.0.
+"""
+import numpy as np
+import pandas as pd
+
+from .trajectories import SUCCESS_THRESHOLD
+
+RATING_THRESHOLD = 4.0
+VOLATILITY_THRESHOLD = 1.0
+CATEGORY_THRESHOLDS = {'Beauty': 3.86, 'Electronics': 3.84}
+
+RED, YELLOW, GREEN = 0, 1, 2
+ALERT_TIERS = ['RED - High Risk', 'YELLOW - Monitor', 'GREEN - Safe']
+
+
+def rating_thresholds(categories, category_thresholds=CATEGORY_THRESHOLDS, default=RATING_THRESHOLD):
+    """Per-product rating threshold: the category cutoff where one exists, ``default`` otherwise."""
+    categories = pd.Categorical(categories)
+    lookup = np.array([category_thresholds.get(c, default) for c in categories.categories] + [default],
+                      dtype=np.float32)
+    return lookup[categories.codes]
+
+
+def classify_alerts(rating, volatility, rating_threshold=RATING_THRESHOLD,
+                    volatility_threshold=VOLATILITY_THRESHOLD):
+    """Alert tier codes (``RED``/``YELLOW``/``GREEN``) as an int8 array.
+
+    ``rating_threshold`` may be a scalar or a per-product array from
+    :func:`rating_thresholds`.
+    """
+    low = np.asarray(rating) < rating_threshold
+    volatile = np.asarray(volatility) > volatility_threshold
+    return (GREEN - low.astype(np.int8)) - volatile.astype(np.int8)
+
+
+def failed(oneyear_rating, threshold=SUCCESS_THRESHOLD):
+    return np.asarray(oneyear_rating) < threshold
+
+
+def rule_metrics(tiers, is_failed):
+    """Precision/recall of flagging RED products, plus the failure rate per tier (percentages)."""
+    tiers = np.asarray(tiers)
+    is_failed = np.asarray(is_failed, dtype=bool)
+    return tier_metrics(np.bincount(tiers, minlength=3), np.bincount(tiers[is_failed], minlength=3))
+
+
+def tier_metrics(per_tier, failed_per_tier):
+    """:func:`rule_metrics` from product and failure counts per tier."""
+    n = int(per_tier.sum())
+    total_failed = int(failed_per_tier.sum())
+
+    def pct(num, den):
+        return float(100.0 * num / den) if den else 0.0
+
+    return {
+        'products': n,
+        'flagged': int(per_tier[RED]),
+        'flagged_share': pct(per_tier[RED], n),
+        'precision': pct(failed_per_tier[RED], per_tier[RED]),
+        'recall': pct(failed_per_tier[RED], total_failed),
+        'yellow_fail': pct(failed_per_tier[YELLOW], per_tier[YELLOW]),
+        'green_fail': pct(failed_per_tier[GREEN], per_tier[GREEN]),
+    }
+
+
+def alert_distribution(tiers):
+    return tier_distribution(np.bincount(np.asarray(tiers), minlength=3))
+
+
+def tier_distribution(per_tier):
+    return pd.DataFrame({
+        'name': ALERT_TIERS,
+        'value': per_tier
+    })
+
+
+def score_products(products, category_thresholds=None):
+    """Alert tiers for a products frame; ``category_thresholds`` switches on per-category cutoffs."""
+    rating = products['early_avg_rating'].to_numpy()
+    threshold = RATING_THRESHOLD
+    if category_thresholds:
+        threshold = rating_thresholds(products['category'], category_thresholds)
+    return classify_alerts(rating, products['early_rating_std'].to_numpy(), threshold)
@@ -0,0 +1,240 @@
+"""Lexicon-based review sentiment and the per-product ``early_avg_sentiment`` feature.
+
+A batch of texts is scored as one sparse matrix-vector product: a fixed-
+vocabulary ``CountVectorizer`` counts lexicon words and negated bigrams
+("not good"), and the counts are weighted and squashed into [-1, 1] the way
+VADER normalizes its sums. Batches run on a process pool. Scores are cached
+in SQLite, keyed by a hash of the review text, so a rerun scores only text it
+has not seen.
+
+Only reviews that can still be in a product's early window are scored. Each
+chunk is merged into the running earliest-``EARLY_WINDOW`` state (as in
+``product_success.ingest``) first, and just the newcomers are sent for scoring.
+"""
+import argparse
+import functools
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .ingest import DEFAULT_CHUNK_SIZE, EARLY_WINDOW, iter_review_chunks, keep_earliest, write_frame
+
+LEXICON_VERSION = 1
+DEFAULT_CACHE = 'data/sentiment_cache.sqlite'
+BATCH_SIZE = 5_000
+NORMALIZE_ALPHA = 15.0
+
+POSITIVE = {
+    'amazing': 3.0, 'awesome': 3.0, 'excellent': 3.0, 'perfect': 3.0, 'love': 3.0, 'loved': 3.0,
+    'fantastic': 3.0, 'wonderful': 3.0, 'best': 2.5, 'great': 2.5, 'beautiful': 2.5, 'recommend': 2.0,
+    'recommended': 2.0, 'happy': 2.0, 'pleased': 2.0, 'impressed': 2.0, 'favorite': 2.0, 'glad': 1.5,
+    'good': 1.5, 'nice': 1.5, 'works': 1.0, 'worked': 1.0, 'sturdy': 1.5, 'durable': 1.5, 'soft': 1.0,
+    'comfortable': 1.5, 'easy': 1.0, 'quality': 1.0, 'reliable': 1.5, 'fast': 1.0, 'smooth': 1.0,
+    'gentle': 1.0, 'worth': 1.5, 'value': 1.0, 'satisfied': 1.5, 'fits': 1.0, 'fine': 0.5, 'solid': 1.0,
+    'effective': 1.5, 'helpful': 1.0, 'clean': 0.5, 'bright': 0.5, 'fresh': 0.5, 'loves': 2.5,
+}
+NEGATIVE = {
+    'terrible': -3.0, 'horrible': -3.0, 'awful': -3.0, 'worst': -3.0, 'garbage': -3.0, 'junk': -3.0,
+    'useless': -2.5, 'hate': -2.5, 'hated': -2.5, 'waste': -2.5, 'disappointed': -2.0,
+    'disappointing': -2.0, 'poor': -2.0, 'bad': -2.0, 'broke': -2.0, 'broken': -2.0, 'defective': -2.5,
+    'cheap': -1.5, 'flimsy': -1.5, 'return': -1.0, 'returned': -1.5, 'returning': -1.5, 'refund': -1.5,
+    'stopped': -1.5, 'fail': -2.0, 'failed': -2.0, 'fails': -2.0, 'rash': -2.0, 'itchy': -1.5,
+    'irritation': -2.0, 'burning': -1.5, 'leaked': -1.5, 'leaking': -1.5, 'smells': -1.0,
+    'sticky': -1.0, 'fake': -2.5, 'misleading': -2.0, 'overpriced': -1.5, 'difficult': -1.0,
+    'problem': -1.0, 'problems': -1.0, 'issue': -1.0, 'issues': -1.0, 'wrong': -1.5, 'damaged': -2.0,
+    'unhappy': -2.0, 'annoying': -1.5, 'sick': -1.5, 'dead': -2.0, 'weak': -1.0, 'worse': -2.0,
+}
+NEGATORS = ['not', 'no', 'never', 'dont', 'doesnt', 'didnt', 'isnt', 'wasnt', 'cant', 'wont', 'hardly']
+
+
+@dataclass
+class SentimentStats:
+    reviews: int = 0
+    cached: int = 0
+    scored: int = 0
+    scoring_seconds: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def reviews_per_sec(self):
+        return self.scored / self.scoring_seconds if self.scoring_seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.reviews:,} early reviews | {self.cached:,} cached | {self.scored:,} scored "
+                f"({self.reviews_per_sec:,.0f} reviews/sec) | {time.perf_counter() - self.started:.1f}s total")
+
+
+def _normalize(text):
+    return text.lower().replace("'", '').replace('’', '')
+
+
+@functools.lru_cache(maxsize=1)
+def _model():
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    lexicon = {**POSITIVE, **NEGATIVE}
+    terms = dict(lexicon)
+    # A negated word cancels its own unigram hit and flips the sign
+    for negator in NEGATORS:
+        for word, weight in lexicon.items():
+            terms[f"{negator} {word}"] = -2.0 * weight
+    vectorizer = CountVectorizer(vocabulary=list(terms), ngram_range=(1, 2), preprocessor=_normalize,
+                                 token_pattern=r"[a-z]+", dtype=np.float32)
+    return vectorizer, np.fromiter(terms.values(), dtype=np.float64, count=len(terms))
+
+
+def score_batch(texts):
+    """Sentiment in [-1, 1] for each text."""
+    vectorizer, weights = _model()
+    raw = vectorizer.transform(texts) @ weights
+    return raw / np.sqrt(raw * raw + NORMALIZE_ALPHA)
+
+
+def text_keys(texts):
+    return [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+
+
+class SentimentCache:
+    """Scores on disk, keyed by the hash of the review text."""
+
+    def __init__(self, path=DEFAULT_CACHE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self.db.execute('CREATE TABLE IF NOT EXISTS scores (hash BLOB PRIMARY KEY, score REAL) WITHOUT ROWID')
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'lexicon_version'").fetchone()
+        if row is None or int(row[0]) != LEXICON_VERSION:
+            # Scores from another lexicon are not comparable
+            self.db.execute('DELETE FROM scores')
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('lexicon_version', ?)", (str(LEXICON_VERSION),))
+        self.db.commit()
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    def get(self, keys):
+        """Cached score per key, NaN where there is none."""
+        found = {}
+        for start in range(0, len(keys), 900):
+            part = keys[start:start + 900]
+            rows = self.db.execute(f"SELECT hash, score FROM scores WHERE hash IN ({','.join('?' * len(part))})",
+                                   part)
+            found.update(rows)
+        return np.array([found.get(key, np.nan) for key in keys], dtype=np.float64)
+
+    def put(self, keys, scores):
+        self.db.executemany('INSERT OR REPLACE INTO scores VALUES (?, ?)', zip(keys, map(float, scores)))
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+
+def score_texts(texts, cache=None, pool=None, batch_size=BATCH_SIZE, stats=None):
+    """Score ``texts``, reading and filling ``cache``, with batches spread over ``pool``."""
+    keys = text_keys(texts)
+    scores = cache.get(keys) if cache is not None else np.full(len(texts), np.nan)
+    missing = np.flatnonzero(np.isnan(scores))
+    # Identical texts are scored once
+    todo = {}
+    for i in missing:
+        todo.setdefault(keys[i], texts[i])
+    if stats is not None:
+        stats.reviews += len(texts)
+        stats.cached += len(texts) - len(missing)
+    if todo:
+        started = time.perf_counter()
+        unique = list(todo.values())
+        batches = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+        results = pool.map(score_batch, batches) if pool is not None else map(score_batch, batches)
+        fresh = dict(zip(todo, np.concatenate(list(results))))
+        if stats is not None:
+            stats.scored += len(unique)
+            stats.scoring_seconds += time.perf_counter() - started
+        if cache is not None:
+            cache.put(list(fresh), list(fresh.values()))
+        scores[missing] = [fresh[keys[i]] for i in missing]
+    return scores
+
+
+def early_sentiment(paths, cache_path=DEFAULT_CACHE, window=EARLY_WINDOW, chunk_size=DEFAULT_CHUNK_SIZE,
+                    max_workers=None, progress=None):
+    """Mean sentiment of each product's first ``window`` reviews.
+
+    Returns ``(early_avg_sentiment, stats)``; the series is indexed by ``product_id``.
+    """
+    stats = SentimentStats()
+    cache = SentimentCache(cache_path) if cache_path else None
+    state = None
+    columns = ('product_id', 'timestamp', 'text')
+    try:
+        with ProcessPoolExecutor(max_workers) as pool:
+            for chunk in iter_review_chunks(paths, columns, chunk_size):
+                chunk = chunk.assign(text=chunk['text'].fillna('').astype(str), sentiment=np.nan)
+                state = keep_earliest(state, chunk, window)
+                new = state['sentiment'].isna().to_numpy()
+                if new.any():
+                    state.loc[new, 'sentiment'] = score_texts(state.loc[new, 'text'].tolist(), cache, pool,
+                                                              stats=stats)
+                state = state[['product_id', 'timestamp', 'sentiment']]
+                if progress is not None:
+                    progress(stats)
+    finally:
+        if cache is not None:
+            cache.close()
+    if state is None:
+        raise ValueError('no reviews found')
+    sentiment = state.groupby('product_id')['sentiment'].mean().astype(np.float32)
+    return sentiment.rename('early_avg_sentiment'), stats
+
+
+def update_store(store, sentiment):
+    """Add ``early_avg_sentiment`` to the products table."""
+    from .feature_store import PRODUCT_PARTITIONING
+
+    products = store.read('products')
+    products['early_avg_sentiment'] = sentiment.reindex(products['product_id']).to_numpy()
+    store.write('products', products, PRODUCT_PARTITIONING)
+    return int(products['early_avg_sentiment'].notna().sum())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Score early-review sentiment per product.')
+    parser.add_argument('paths', nargs='+', help='review files (.jsonl, .csv, optionally .gz)')
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help='SQLite score cache ("" to disable)')
+    parser.add_argument('--features', help='ingest output (.parquet or .csv) to add early_avg_sentiment to')
+    parser.add_argument('--store', help='feature store whose products table gets early_avg_sentiment')
+    parser.add_argument('--window', type=int, default=EARLY_WINDOW)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    def progress(stats):
+        print(f"\r{stats}", end='', file=sys.stderr)
+
+    sentiment, stats = early_sentiment(args.paths, args.cache, args.window, args.chunk_size, args.workers, progress)
+    print(file=sys.stderr)
+    if args.features:
+        if args.features.endswith('.parquet'):
+            features = pd.read_parquet(args.features)
+        else:
+            features = pd.read_csv(args.features, index_col='product_id')
+        features['early_avg_sentiment'] = sentiment.reindex(features.index.astype(str)).to_numpy()
+        write_frame(features, args.features)
+    if args.store:
+        from .feature_store import FeatureStore
+        print(f"{update_store(FeatureStore(args.store), sentiment):,} products updated in {args.store}")
+    print(f"{len(sentiment):,} products | {stats}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""Batch success scoring outside Streamlit: a CLI and a plain ASGI app.
+
+Both entry points share one predictor per process: the best model from the
+latest training run (see ``product_success.training``), loaded on first use.
+Products are scored in fixed-size batches. Each gets a success probability
+from the model and an alert tier from the volatility rule in
+``product_success.scoring``.
+
+    python -m product_success.service score products.csv -o scored.csv
+    uvicorn product_success.service:app --workers 4
+"""
+import argparse
+import functools
+import io
+import json
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from . import scoring
+from .data import DEFAULT_STORE, STORE_ENV
+from .feature_store import FeatureStore
+from .training import latest_metrics
+
+BATCH_SIZE = 10_000
+MAX_BODY_BYTES = 64 * 1024 * 1024
+TIER_LABELS = np.array(['RED', 'YELLOW', 'GREEN'])
+
+
+class ScoringError(ValueError):
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def load_predictor(root=None, model=None):
+    """``(model, features, name)`` for ``model`` (default: the run's best model), loaded once per process."""
+    store = FeatureStore(root or os.environ.get(STORE_ENV, DEFAULT_STORE))
+    metrics = latest_metrics(store)
+    if metrics is None:
+        raise ScoringError(f"no trained model in {store.root}; run python -m product_success.training")
+    name = model or metrics['best_model']
+    path = store.root / metrics['model_dir'] / (name.lower().replace(' ', '_') + '.pkl')
+    with open(path, 'rb') as f:
+        saved = pickle.load(f)
+    return saved['model'], saved['features'], name
+
+
+def score(products, predictor, batch_size=BATCH_SIZE):
+    """Success probability and alert tier for every row of ``products``."""
+    model, features, _ = predictor
+    if not len(products):
+        return pd.DataFrame({'success_probability': np.empty(0), 'alert_tier': np.empty(0, dtype=object)})
+    missing = [c for c in features if c not in products]
+    if missing:
+        raise ScoringError(f"missing feature columns: {', '.join(missing)}")
+
+    X = products[features].to_numpy(dtype=np.float64)
+    if not np.isfinite(X).all():
+        raise ScoringError('feature values must be finite numbers')
+    proba = np.empty(len(X))
+    for start in range(0, len(X), batch_size):
+        proba[start:start + batch_size] = model.predict_proba(X[start:start + batch_size])[:, 1]
+
+    tiers = scoring.classify_alerts(products['early_avg_rating'].to_numpy(),
+                                    products['early_rating_std'].to_numpy())
+    result = pd.DataFrame({
+        'success_probability': proba.round(4),
+        'alert_tier': TIER_LABELS[tiers],
+    })
+    if 'product_id' in products:
+        result.insert(0, 'product_id', products['product_id'].to_numpy())
+    return result
+
+
+def _read_products(body, content_type):
+    if content_type.startswith('text/csv'):
+        return pd.read_csv(io.BytesIO(body))
+    payload = json.loads(body)
+    rows = payload.get('products') if isinstance(payload, dict) else payload
+    if not isinstance(rows, list):
+        raise ScoringError("expected a JSON list of products or {\"products\": [...]}")
+    if not all(isinstance(row, dict) for row in rows):
+        raise ScoringError('each product must be a JSON object of feature values')
+    return pd.DataFrame.from_records(rows)
+
+
+async def _read_body(receive):
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise ScoringError('request body too large')
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def _respond(send, status, payload):
+    body = json.dumps(payload).encode()
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', b'application/json'),
+                            (b'content-length', str(len(body)).encode())]})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def app(scope, receive, send):
+    """ASGI app: ``POST /score`` (JSON or CSV body) and ``GET /health``."""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    load_predictor()
+                except (ScoringError, OSError):
+                    pass  # /health reports it; scoring returns 503 until a model exists
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    path, method = scope['path'], scope['method']
+    if path == '/health' and method == 'GET':
+        try:
+            _, features, name = load_predictor()
+        except (ScoringError, OSError) as exc:
+            return await _respond(send, 503, {'status': 'unavailable', 'error': str(exc)})
+        return await _respond(send, 200, {'status': 'ok', 'model': name, 'features': features})
+    if path != '/score':
+        return await _respond(send, 404, {'error': 'not found'})
+    if method != 'POST':
+        return await _respond(send, 405, {'error': 'use POST'})
+
+    headers = dict(scope.get('headers', []))
+    content_type = headers.get(b'content-type', b'application/json').decode()
+    try:
+        predictor = load_predictor()
+    except (ScoringError, OSError) as exc:
+        return await _respond(send, 503, {'error': str(exc)})
+    try:
+        products = _read_products(await _read_body(receive), content_type)
+        started = time.perf_counter()
+        result = score(products, predictor)
+    except (ScoringError, ValueError, KeyError, TypeError) as exc:
+        return await _respond(send, 422, {'error': str(exc)})
+    await _respond(send, 200, {
+        'model': predictor[2],
+        'products': len(result),
+        'seconds': round(time.perf_counter() - started, 4),
+        'results': result.to_dict(orient='records'),
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Score products with the trained success model.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    score_cmd = sub.add_parser('score', help='score a CSV/Parquet file of early-review features')
+    score_cmd.add_argument('input')
+    score_cmd.add_argument('-o', '--output', help='output CSV (default: stdout)')
+    score_cmd.add_argument('--store', default=None)
+    score_cmd.add_argument('--model', default=None, help='model name (default: best model of the latest run)')
+    score_cmd.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    serve_cmd = sub.add_parser('serve', help='serve the ASGI app with uvicorn')
+    serve_cmd.add_argument('--host', default='127.0.0.1')
+    serve_cmd.add_argument('--port', type=int, default=8000)
+    serve_cmd.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        import uvicorn
+        uvicorn.run('product_success.service:app', host=args.host, port=args.port, workers=args.workers)
+        return
+
+    reader = pd.read_parquet if args.input.endswith('.parquet') else pd.read_csv
+    products = reader(args.input)
+    try:
+        predictor = load_predictor(args.store, args.model)
+        started = time.perf_counter()
+        result = score(products, predictor, args.batch_size)
+    except ScoringError as exc:
+        sys.exit(f"error: {exc}")
+    elapsed = time.perf_counter() - started
+    result.to_csv(args.output or sys.stdout, index=False)
+    print(f"{len(result):,} products scored with {predictor[2]} in {elapsed:.2f}s "
+          f"({len(result) / max(elapsed, 1e-9):,.0f} products/sec)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
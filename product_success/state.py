@@ -0,0 +1,122 @@
+"""Per-product NumPy state shared by the incremental review engines.
+
+``ProductState`` maps product ids to rows of growable arrays and saves them
+as a compressed ``.npz``. Each engine subclasses it, names its per-product
+arrays in ``STATE`` and the constructor arguments to save with them in
+``SETTINGS``, and allocates the arrays in ``__init__``. Engines that fold
+timestamped reviews with ``apply(codes, timestamps, ratings)`` also get
+``update_files``, which reads review files in any order in bounded memory.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from .ingest import iter_review_chunks
+
+DEFAULT_PARTITIONS = 16
+SPILL_DTYPE = np.dtype([('code', np.int64), ('timestamp', np.int64), ('rating', np.float32)])
+
+
+class ProductState:
+
+    STATE = ()
+    SETTINGS = ()
+    # Narrower dtypes for arrays whose saved values are known to fit
+    SAVE_DTYPES = {}
+
+    def __init__(self):
+        self.product_ids = []
+        self._index = {}
+
+    def __len__(self):
+        return len(self.product_ids)
+
+    def _grow(self, size):
+        capacity = len(getattr(self, self.STATE[0]))
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for name in self.STATE:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def codes(self, product_ids):
+        """State row per product id, registering unseen products."""
+        unique, inverse = np.unique(np.asarray(product_ids, dtype=str), return_inverse=True)
+        codes = np.empty(len(unique), dtype=np.int64)
+        for i, product_id in enumerate(unique):
+            code = self._index.get(product_id)
+            if code is None:
+                code = self._index[product_id] = len(self.product_ids)
+                self.product_ids.append(product_id)
+            codes[i] = code
+        self._grow(len(self.product_ids))
+        return codes[inverse]
+
+    def ids(self, codes):
+        """Product ids of the given state rows; costs O(len(codes)), not O(products)."""
+        return np.array([self.product_ids[code] for code in codes], dtype=object)
+
+    def update_files(self, paths, chunk_size=100_000, partitions=DEFAULT_PARTITIONS, spill_dir=None):
+        """Fold review files, in any order, into the state in bounded memory.
+
+        Reviews are spilled to ``partitions`` temporary files by product, and
+        each file is then applied as one batch. Every product still sees all
+        of its new reviews at once, while memory holds roughly
+        1/``partitions`` of them.
+        """
+        with tempfile.TemporaryDirectory(dir=spill_dir) as tmp:
+            spills = [Path(tmp) / f"part-{i}.bin" for i in range(partitions)]
+            files = [open(path, 'wb') for path in spills]
+            try:
+                for chunk in iter_review_chunks(paths, ('product_id', 'timestamp', 'rating'), chunk_size):
+                    rows = np.empty(len(chunk), dtype=SPILL_DTYPE)
+                    rows['code'] = self.codes(chunk['product_id'].to_numpy())
+                    rows['timestamp'] = chunk['timestamp'].to_numpy()
+                    rows['rating'] = chunk['rating'].to_numpy()
+                    part = rows['code'] % partitions
+                    order = np.argsort(part, kind='stable')
+                    bounds = np.searchsorted(part[order], np.arange(partitions + 1))
+                    rows = rows[order]
+                    for f, lo, hi in zip(files, bounds[:-1], bounds[1:]):
+                        rows[lo:hi].tofile(f)
+            finally:
+                for f in files:
+                    f.close()
+            for path in spills:
+                rows = np.fromfile(path, dtype=SPILL_DTYPE)
+                if len(rows):
+                    self.apply(rows['code'], rows['timestamp'], rows['rating'])
+                path.unlink()
+
+    def save(self, path):
+        """Write the state atomically as a compressed ``.npz``."""
+        n = len(self.product_ids)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        arrays = {name: getattr(self, name)[:n] for name in self.STATE}
+        for name, dtype in self.SAVE_DTYPES.items():
+            arrays[name] = arrays[name].astype(dtype)
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, product_ids=np.asarray(self.product_ids, dtype=str),
+                                **{name: getattr(self, name) for name in self.SETTINGS}, **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as state:
+            settings = {name: state[name].item() for name in cls.SETTINGS}
+            loaded = cls(**settings, capacity=max(len(state['product_ids']), 1))
+            loaded.product_ids = state['product_ids'].tolist()
+            loaded._index = {p: i for i, p in enumerate(loaded.product_ids)}
+            n = len(loaded.product_ids)
+            for name in cls.STATE:
+                # Arrays added after a file was written keep their initial values
+                if name in state.files:
+                    getattr(loaded, name)[:n] = state[name]
+        return loaded
@@ -0,0 +1,21 @@
+"""Dashboard colours and display names."""
+
+# Amazon color palette
+COLORS = {
+    'primary': '#FF9900',
+    'secondary': '#146EB4',
+    'dark': '#232F3E',
+    'success': '#067D62',
+    'warning': '#F0C14B',
+    'danger': '#B12704',
+    'light': '#EAEDED'
+}
+
+# Display names for per-product columns
+PRODUCT_LABELS = {
+    'early_avg_rating': 'Early Rating',
+    'oneyear_avg_rating': '1-Year Rating',
+    'early_rating_std': 'Volatility',
+    'trajectory': 'Trajectory',
+    'cluster': 'Cluster'
+}
@@ -0,0 +1,222 @@
+"""Train and evaluate the success models from the feature store.
+
+Every (model, cross-validation fold) pair and the final full-data fit of each
+model is an independent task on a process pool; the feature matrix is shipped
+to each worker once through the pool initializer. Per-fold timings are
+reported as tasks finish. A run writes a versioned metrics artifact and the
+fitted models under ``<store>/artifacts``, and refreshes the
+``model_performance`` and ``feature_importance`` tables the dashboard reads.
+"""
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from .feature_store import FeatureStore, new_version
+from .trajectories import SUCCESS_THRESHOLD
+
+FEATURES = ['early_avg_rating', 'early_rating_std', 'early_1star_rate',
+            'early_5star_rate', 'early_avg_sentiment']
+METRICS = ['accuracy', 'precision', 'recall', 'f1', 'auc']
+N_FOLDS = 5
+RANDOM_STATE = 42
+
+
+def make_model(name):
+    if name == 'Logistic Regression':
+        return make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000))
+    if name == 'Random Forest':
+        return RandomForestClassifier(n_estimators=300, random_state=RANDOM_STATE, n_jobs=1)
+    if name == 'Gradient Boosting':
+        return GradientBoostingClassifier(random_state=RANDOM_STATE)
+    raise ValueError(f"unknown model '{name}'")
+
+
+MODELS = ['Logistic Regression', 'Random Forest', 'Gradient Boosting']
+
+
+class TrainingError(ValueError):
+    pass
+
+_X = None
+_y = None
+
+
+def _init_worker(X, y):
+    global _X, _y
+    _X, _y = X, y
+
+
+def _fit_fold(name, fold, train_idx, test_idx):
+    model = make_model(name)
+    started = time.perf_counter()
+    model.fit(_X[train_idx], _y[train_idx])
+    fit_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    proba = model.predict_proba(_X[test_idx])[:, 1]
+    score_seconds = time.perf_counter() - started
+    pred = (proba >= 0.5).astype(int)
+    y_true = _y[test_idx]
+    return {
+        'model': name,
+        'fold': fold,
+        'fit_seconds': fit_seconds,
+        'score_seconds': score_seconds,
+        'accuracy': accuracy_score(y_true, pred),
+        'precision': precision_score(y_true, pred, zero_division=0),
+        'recall': recall_score(y_true, pred, zero_division=0),
+        'f1': f1_score(y_true, pred, zero_division=0),
+        'auc': roc_auc_score(y_true, proba) if len(np.unique(y_true)) > 1 else float('nan'),
+    }
+
+
+def _fit_full(name):
+    model = make_model(name)
+    started = time.perf_counter()
+    model.fit(_X, _y)
+    return name, model, time.perf_counter() - started
+
+
+def training_data(store, features=FEATURES):
+    available = [f for f in features if f in store.columns('products')]
+    products = store.read('products', available + ['oneyear_avg_rating']).dropna()
+    X = products[available].to_numpy(dtype=np.float64)
+    y = (products['oneyear_avg_rating'].to_numpy() >= SUCCESS_THRESHOLD).astype(int)
+    return X, y, available
+
+
+def check_labels(y, n_folds=N_FOLDS):
+    """Raise ``TrainingError`` unless ``y`` has enough successes and failures for ``n_folds`` folds."""
+    classes, counts = np.unique(y, return_counts=True)
+    if not len(y):
+        raise TrainingError('no products with both early features and a 1-year rating to train on')
+    if len(classes) < 2:
+        outcome = 'succeeded' if classes[0] else 'failed'
+        raise TrainingError(f"all {len(y):,} products {outcome}; training needs products on both sides "
+                            f"of the {SUCCESS_THRESHOLD} 1-year rating threshold")
+    if counts.min() < n_folds:
+        outcome = 'successes' if classes[counts.argmin()] else 'failures'
+        raise TrainingError(f"only {counts.min()} {outcome} among {len(y):,} products; "
+                            f"{n_folds}-fold cross-validation needs at least {n_folds}")
+
+
+def evaluate(X, y, models=MODELS, n_folds=N_FOLDS, max_workers=None, on_fold=None):
+    """Cross-validate and fit every model concurrently.
+
+    Returns ``(folds, fitted, fit_seconds)``: one metrics dict per (model, fold),
+    the models refitted on all of ``X`` and how long each full fit took.
+    """
+    check_labels(y, n_folds)
+    splits = list(StratifiedKFold(n_folds, shuffle=True, random_state=RANDOM_STATE).split(X, y))
+    folds = []
+    fitted = {}
+    fit_seconds = {}
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(X, y)) as pool:
+        tasks = [pool.submit(_fit_fold, name, fold, train_idx, test_idx)
+                 for name in models for fold, (train_idx, test_idx) in enumerate(splits)]
+        tasks += [pool.submit(_fit_full, name) for name in models]
+        for task in as_completed(tasks):
+            result = task.result()
+            if isinstance(result, dict):
+                folds.append(result)
+                if on_fold is not None:
+                    on_fold(result)
+            else:
+                name, model, seconds = result
+                fitted[name] = model
+                fit_seconds[name] = seconds
+    return folds, fitted, fit_seconds
+
+
+def summarize(folds, models=MODELS):
+    """Mean fold metrics per model, as percentages, in dashboard table order."""
+    frame = pd.DataFrame(folds).groupby('model')[METRICS].mean() * 100
+    return frame.reindex(list(models)).round(1).reset_index()
+
+
+def feature_importance(model, features):
+    return pd.DataFrame({
+        'feature': features,
+        'importance': np.round(model.feature_importances_, 3)
+    }).sort_values('importance', ascending=False, ignore_index=True)
+
+
+def latest_metrics(store):
+    """The most recent metrics artifact, or None when no training run has been recorded."""
+    directory = store.root / 'artifacts' / 'metrics'
+    runs = sorted(directory.glob('*.json')) if directory.exists() else []
+    return json.loads(runs[-1].read_text()) if runs else None
+
+
+def train(store, models=MODELS, n_folds=N_FOLDS, max_workers=None, on_fold=None):
+    X, y, features = training_data(store)
+    started = time.perf_counter()
+    folds, fitted, fit_seconds = evaluate(X, y, models, n_folds, max_workers, on_fold)
+    performance = summarize(folds, models)
+    best = performance.loc[performance['accuracy'].idxmax(), 'model']
+
+    version = new_version()
+    artifacts = store.root / 'artifacts'
+    model_dir = artifacts / 'models' / version
+    model_dir.mkdir(parents=True, exist_ok=True)
+    for name, model in fitted.items():
+        with open(model_dir / (name.lower().replace(' ', '_') + '.pkl'), 'wb') as f:
+            pickle.dump({'model': model, 'features': features}, f)
+
+    metrics = {
+        'version': version,
+        'products': int(len(y)),
+        'features': features,
+        'n_folds': n_folds,
+        'wall_seconds': time.perf_counter() - started,
+        'best_model': best,
+        'full_fit_seconds': fit_seconds,
+        'model_dir': str(model_dir.relative_to(store.root)),
+        'summary': performance.to_dict(orient='records'),
+        'folds': sorted(folds, key=lambda r: (r['model'], r['fold'])),
+    }
+    metrics_dir = artifacts / 'metrics'
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    (metrics_dir / f"{version}.json").write_text(json.dumps(metrics, indent=2))
+    store.record_artifact('metrics', metrics_dir.relative_to(store.root) / f"{version}.json")
+
+    store.write('model_performance', performance)
+    if 'Random Forest' in fitted:
+        store.write('feature_importance', feature_importance(fitted['Random Forest'], features))
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train and evaluate the success models.')
+    parser.add_argument('root', nargs='?', default='data/feature_store')
+    parser.add_argument('--folds', type=int, default=N_FOLDS)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    def on_fold(result):
+        print(f"{result['model']:<20} fold {result['fold']}  fit {result['fit_seconds']:6.2f}s  "
+              f"score {result['score_seconds']:5.2f}s  accuracy {100 * result['accuracy']:.1f}%")
+
+    try:
+        metrics = train(FeatureStore(args.root), n_folds=args.folds, max_workers=args.workers, on_fold=on_fold)
+    except TrainingError as exc:
+        sys.exit(f"error: {exc}")
+    print(pd.DataFrame(metrics['summary']).to_string(index=False))
+    print(f"best: {metrics['best_model']} | {metrics['wall_seconds']:.1f}s | version {metrics['version']}")
+
+
+if __name__ == '__main__':
+    main()
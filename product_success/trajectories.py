@@ -0,0 +1,182 @@
+"""Early-to-1-year rating trajectories.
+
+``TrajectoryEngine`` derives each product's early window (first
+``EARLY_WINDOW`` reviews) and 1-year window (reviews within a year of the
+first) straight from review histories. A batch is sorted once by
+``(product, time)`` and reduced segment by segment with ``np.bincount``, so
+there is no per-product Python loop. The per-product state is a handful of
+sums, so later batches of newer reviews are folded in without rereading the
+corpus. A product that receives a review older than its early window can no
+longer be updated in place; it is marked stale and needs a full rebuild.
+
+Review files need not be in time order. ``update_files`` (from ``ProductState``) spills them
+into per-product partition files and applies one partition at a time, so
+memory is bounded by a partition rather than by the corpus.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .ingest import EARLY_WINDOW, ONE_YEAR_SECONDS
+from .state import DEFAULT_PARTITIONS, ProductState
+
+SUCCESS_THRESHOLD = 4.0
+STABLE_TOLERANCE = 0.1
+TRAJECTORIES = ['Stable High', 'Stable Low', 'Recovered', 'Declined']
+
+
+def trajectory_codes(early, oneyear, threshold=SUCCESS_THRESHOLD):
+    """Index into ``TRAJECTORIES`` by which side of ``threshold`` each product starts and ends on."""
+    early_ok = np.asarray(early) >= threshold
+    oneyear_ok = np.asarray(oneyear) >= threshold
+    return np.where(early_ok, np.where(oneyear_ok, 0, 3), np.where(oneyear_ok, 2, 1)).astype(np.int8)
+
+
+def label_trajectories(early, oneyear, threshold=SUCCESS_THRESHOLD):
+    """Label each product by which side of ``threshold`` it starts and ends on."""
+    return np.asarray(TRAJECTORIES, dtype=object)[trajectory_codes(early, oneyear, threshold)]
+
+
+def stable_share(early, oneyear, tolerance=STABLE_TOLERANCE):
+    """Percentage of products whose 1-year rating is within ``tolerance`` stars of the early rating."""
+    change = np.abs(np.asarray(oneyear, dtype=np.float64) - np.asarray(early, dtype=np.float64))
+    return 100.0 * float(np.mean(change <= tolerance + 1e-6)) if len(change) else 0.0
+
+
+class TrajectoryEngine(ProductState):
+
+    STATE = ('reviews', 'first_review', 'last_review', 'early_last',
+             'early_n', 'early_sum', 'oneyear_n', 'oneyear_sum', 'stale')
+    SETTINGS = ('window', 'horizon')
+
+    def __init__(self, window=EARLY_WINDOW, horizon=ONE_YEAR_SECONDS, capacity=1024):
+        super().__init__()
+        self.window = window
+        self.horizon = horizon
+        self.reviews = np.zeros(capacity, dtype=np.int64)
+        self.first_review = np.zeros(capacity, dtype=np.int64)
+        self.last_review = np.zeros(capacity, dtype=np.int64)
+        self.early_last = np.zeros(capacity, dtype=np.int64)
+        self.early_n = np.zeros(capacity, dtype=np.int32)
+        self.early_sum = np.zeros(capacity, dtype=np.float64)
+        self.oneyear_n = np.zeros(capacity, dtype=np.int32)
+        self.oneyear_sum = np.zeros(capacity, dtype=np.float64)
+        self.stale = np.zeros(capacity, dtype=bool)
+
+    def update(self, product_ids, timestamps, ratings):
+        """Fold a batch of reviews, in any order, into the state."""
+        self.apply(self.codes(product_ids), timestamps, ratings)
+
+    def apply(self, codes, timestamps, ratings):
+        """``update`` for reviews already mapped to state indices with ``codes``."""
+        codes = np.asarray(codes, dtype=np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=np.float64)
+        order = np.lexsort((timestamps, codes))
+        codes, timestamps, ratings = codes[order], timestamps[order], ratings[order]
+        unique, starts, sizes = np.unique(codes, return_index=True, return_counts=True)
+
+        # A batch may only append: its oldest review must not precede the
+        # reviews that decided the product's early window
+        seen = self.reviews[unique] > 0
+        cutoff = np.where(self.early_n[unique] >= self.window, self.early_last[unique], self.last_review[unique])
+        late = self.stale[unique] | (seen & (timestamps[starts] < cutoff))
+        if late.any():
+            self.stale[unique[late]] = True
+            keep = ~np.repeat(late, sizes)
+            codes, timestamps, ratings = codes[keep], timestamps[keep], ratings[keep]
+            unique, starts, sizes = unique[~late], starts[~late], sizes[~late]
+            starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+            seen = seen[~late]
+        if not len(codes):
+            return
+
+        segment = np.repeat(np.arange(len(unique)), sizes)
+        first = np.where(seen, self.first_review[unique], timestamps[starts])
+        rank = np.arange(len(codes)) - starts[segment] + self.reviews[unique][segment]
+        early = rank < self.window
+        in_year = timestamps <= first[segment] + self.horizon
+
+        n_early = np.bincount(segment, early, len(unique)).astype(np.int32)
+        has_early = n_early > 0
+        self.early_last[unique[has_early]] = timestamps[(starts + n_early - 1)[has_early]]
+        self.early_n[unique] += n_early
+        self.early_sum[unique] += np.bincount(segment, ratings * early, len(unique))
+        self.oneyear_n[unique] += np.bincount(segment, in_year, len(unique)).astype(np.int32)
+        self.oneyear_sum[unique] += np.bincount(segment, ratings * in_year, len(unique))
+        self.first_review[unique] = first
+        self.last_review[unique] = timestamps[starts + sizes - 1]
+        self.reviews[unique] += sizes
+
+    def features(self, min_reviews=1, threshold=SUCCESS_THRESHOLD):
+        """Early and 1-year average rating and trajectory label per product."""
+        n = len(self.product_ids)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            early = self.early_sum[:n] / self.early_n[:n]
+            oneyear = self.oneyear_sum[:n] / self.oneyear_n[:n]
+        frame = pd.DataFrame({
+            'first_review': self.first_review[:n],
+            'n_reviews': self.reviews[:n],
+            'early_avg_rating': early.astype(np.float32),
+            'oneyear_avg_rating': oneyear.astype(np.float32),
+            'trajectory': pd.Categorical.from_codes(trajectory_codes(early, oneyear, threshold),
+                                                    categories=TRAJECTORIES),
+            'stale': self.stale[:n],
+        }, index=pd.Index(self.product_ids, name='product_id'))
+        return frame[frame['n_reviews'] >= min_reviews]
+
+
+def update_store(store, features):
+    """Write 1-year ratings and trajectories for the products in ``features`` into the products table."""
+    from .feature_store import PRODUCT_PARTITIONING
+
+    products = store.read('products')
+    current = features[~features['stale']].reindex(products['product_id'])
+    found = current['oneyear_avg_rating'].notna().to_numpy()
+    products.loc[found, 'oneyear_avg_rating'] = current['oneyear_avg_rating'].to_numpy()[found]
+    products['trajectory'] = label_trajectories(products['early_avg_rating'], products['oneyear_avg_rating'])
+    store.write('products', products, PRODUCT_PARTITIONING)
+    return int(found.sum())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compute rating trajectories from review histories.')
+    parser.add_argument('state', help='engine state (.npz); new reviews are folded into it if it exists')
+    parser.add_argument('paths', nargs='+', help='review files (.jsonl, .csv, optionally .gz)')
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--partitions', type=int, default=DEFAULT_PARTITIONS,
+                        help='spill files the new reviews are split into by product; memory is about 1/partitions '
+                             'of the new reviews')
+    parser.add_argument('--spill-dir', help='directory for the spill files (default: system temp)')
+    parser.add_argument('--min-reviews', type=int, default=EARLY_WINDOW)
+    parser.add_argument('--output', help='write per-product trajectories (.parquet or .csv)')
+    parser.add_argument('--store', help='update the products table of this feature store')
+    args = parser.parse_args(argv)
+
+    engine = TrajectoryEngine.load(args.state) if Path(args.state).exists() else TrajectoryEngine()
+    engine.update_files(args.paths, args.chunk_size, args.partitions, args.spill_dir)
+    engine.save(args.state)
+
+    features = engine.features(args.min_reviews)
+    if args.output:
+        from .ingest import write_frame
+        write_frame(features, args.output)
+    if args.store:
+        from .feature_store import FeatureStore
+        print(f"{update_store(FeatureStore(args.store), features):,} products updated in {args.store}")
+
+    fresh = features[~features['stale']]
+    print(f"{len(features):,} products in {args.state} ({int(features['stale'].sum()):,} stale)")
+    print(fresh['trajectory'].value_counts().reindex(TRAJECTORIES).to_string())
+    print(f"stable within ±{STABLE_TOLERANCE} stars: "
+          f"{stable_share(fresh['early_avg_rating'], fresh['oneyear_avg_rating']):.1f}%")
+    if features['stale'].any():
+        print("stale products received reviews older than their early window; rebuild the state to refresh them",
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
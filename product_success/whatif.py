@@ -0,0 +1,158 @@
+"""Precomputed counts behind the what-if threshold explorer.
+
+The warning rule only compares each product's early rating and volatility
+with two thresholds, so every threshold pair the sliders offer can be counted
+in advance. Each product falls into one cell of a grid whose edges are the
+slider steps. A cumulative sum over that grid gives, for every step pair,
+the number of products (and of failed products) with rating below the first
+step and volatility above the second. The RED/YELLOW/GREEN counts then follow
+by inclusion-exclusion.
+
+The cells are kept per category and as prefix sums over first-review years,
+like ``product_success.cube``. Any threshold pair, category cutoffs and
+(categories, year range) slice therefore costs O(categories) lookups,
+however many products there are. Memory grows with
+categories x years x slider steps, not with the catalog.
+"""
+import numpy as np
+
+from . import scoring
+
+RATING_STEPS = (3.0, 4.5, 0.01)
+VOLATILITY_STEPS = (0.25, 2.0, 0.05)
+
+
+def steps(first, last, step):
+    """Slider values from ``first`` to ``last``, as float32 like the product table."""
+    count = int(round((last - first) / step)) + 1
+    return np.round(first + step * np.arange(count), 6).astype(np.float32)
+
+
+def _step_index(grid, value):
+    first, last, step = grid
+    i = int(round((value - first) / step))
+    if not 0 <= i <= round((last - first) / step) or abs(first + i * step - value) > 1e-6:
+        raise ValueError(f"threshold {value} is not a step of the {first}-{last} grid (step {step})")
+    return i
+
+
+class ThresholdIndex:
+
+    def __init__(self, categories, first_year, last_year, both, low, volatile, total):
+        self.categories = list(categories)
+        self.first_year = first_year
+        self.last_year = last_year
+        # Leading axis: (products, failed); then category (+ one for missing), year prefix, steps
+        self.both = both
+        self.low = low
+        self.volatile = volatile
+        self.total = total
+
+    @classmethod
+    def from_arrays(cls, rating, volatility, is_failed, category_codes=None, categories=(), years=None):
+        """Index products given early rating, volatility, failure flag and optional category codes and years."""
+        rating_edges, volatility_edges = steps(*RATING_STEPS), steps(*VOLATILITY_STEPS)
+        n_rating, n_volatility = len(rating_edges), len(volatility_edges)
+        rating = np.asarray(rating, dtype=np.float32)
+        volatility = np.asarray(volatility, dtype=np.float32)
+
+        # Cell a: rating < edge i for every i >= a; cell b: volatility > edge j for every j < b
+        a = np.searchsorted(rating_edges, rating, side='right')
+        b = np.where(np.isnan(volatility), 0, np.searchsorted(volatility_edges, volatility, side='left'))
+
+        n_categories = len(categories) + 1
+        if category_codes is None:
+            category = np.full(len(rating), len(categories))
+        else:
+            category = np.where(np.asarray(category_codes) < 0, len(categories), category_codes)
+        if years is None or not len(years):
+            first_year = last_year = None
+            year = np.zeros(len(rating), dtype=np.int64)
+        else:
+            years = np.asarray(years, dtype=np.int64)
+            first_year, last_year = int(years.min()), int(years.max())
+            year = years - first_year
+        n_years = 1 if first_year is None else last_year - first_year + 1
+
+        shape = (n_categories, n_years, n_rating + 1, n_volatility + 1)
+        cell = np.ravel_multi_index((category, year, a, b), shape)
+        size = int(np.prod(shape))
+        counts = np.stack([
+            np.bincount(cell, minlength=size),
+            np.bincount(cell[np.asarray(is_failed, dtype=bool)], minlength=size),
+        ]).reshape((2,) + shape)
+
+        dtype = np.int32 if len(rating) < 2 ** 31 else np.int64
+        low_cells = counts.cumsum(axis=3)[:, :, :, :n_rating]
+        tail = lambda x: x[..., ::-1].cumsum(axis=-1)[..., ::-1][..., 1:]
+        grids = {
+            'both': tail(low_cells),
+            'low': low_cells.sum(axis=-1),
+            'volatile': tail(counts.sum(axis=3)),
+            'total': counts.sum(axis=(3, 4)),
+        }
+        for name, grid in grids.items():
+            # Prefix sums along the year axis, with a leading zero slot
+            prefix = np.zeros(grid.shape[:2] + (n_years + 1,) + grid.shape[3:], dtype=dtype)
+            prefix[:, :, 1:] = grid.cumsum(axis=2)
+            grids[name] = prefix
+        return cls(categories, first_year, last_year, **grids)
+
+    @classmethod
+    def from_table(cls, table):
+        """Index a :class:`product_success.products.ProductTable`."""
+        arrays = table.arrays
+        return cls.from_arrays(
+            arrays['early_avg_rating'], arrays['early_rating_std'], scoring.failed(arrays['oneyear_avg_rating']),
+            arrays.get('category'), table.labels.get('category', ()), arrays.get('year'),
+        )
+
+    @property
+    def years(self):
+        return (self.first_year, self.last_year)
+
+    @property
+    def nbytes(self):
+        return sum(grid.nbytes for grid in (self.both, self.low, self.volatile, self.total))
+
+    def _year_slots(self, years):
+        if years is None or self.first_year is None:
+            return 0, self.total.shape[2] - 1
+        first = min(max(years[0], self.first_year), self.last_year + 1)
+        last = max(min(years[1], self.last_year), first - 1)
+        return first - self.first_year, last - self.first_year + 1
+
+    def counts(self, rating=scoring.RATING_THRESHOLD, volatility=scoring.VOLATILITY_THRESHOLD,
+               category_thresholds=None, categories=None, years=None):
+        """Products and failed products per alert tier, as two length-3 arrays.
+
+        Thresholds must be slider steps; ``category_thresholds`` overrides the
+        rating threshold per category as in :func:`scoring.rating_thresholds`.
+        """
+        category_thresholds = category_thresholds or {}
+        j = _step_index(VOLATILITY_STEPS, volatility)
+        rating_steps = np.array([_step_index(RATING_STEPS, category_thresholds.get(c, rating))
+                                 for c in self.categories] + [_step_index(RATING_STEPS, rating)])
+        if categories is None:
+            selected = np.arange(len(self.categories) + 1)
+        else:
+            selected = np.array([i for i, c in enumerate(self.categories) if c in set(categories)], dtype=np.int64)
+        start, stop = self._year_slots(years)
+
+        def span(grid, *steps):
+            return (grid[(slice(None), selected, stop) + steps].astype(np.int64)
+                    - grid[(slice(None), selected, start) + steps]).sum(axis=-1)
+
+        i = rating_steps[selected]
+        both = span(self.both, i, j)
+        low = span(self.low, i)
+        volatile = span(self.volatile, j)
+        total = span(self.total)
+        per_tier = np.stack([both, low + volatile - 2 * both, total - low - volatile + both], axis=1)
+        return per_tier[0], per_tier[1]
+
+    def rule_metrics(self, *args, **kwargs):
+        return scoring.tier_metrics(*self.counts(*args, **kwargs))
+
+    def alert_distribution(self, *args, **kwargs):
+        return scoring.tier_distribution(self.counts(*args, **kwargs)[0])
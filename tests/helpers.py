@@ -0,0 +1,27 @@
+"""Small random inputs shared by the engine tests."""
+import numpy as np
+import pandas as pd
+
+
+def random_reviews(rng, n_reviews=3_000, n_products=40, continuous=False):
+    """Reviews with unique timestamps; ratings are float32-exact so float32 state stores them exactly."""
+    products = np.array([f"p{i:03d}" for i in range(n_products)])
+    if continuous:
+        ratings = rng.uniform(1, 5, n_reviews).astype(np.float32).astype(np.float64)
+    else:
+        ratings = rng.integers(1, 6, n_reviews).astype(np.float64)
+    return pd.DataFrame({
+        'product_id': products[rng.integers(0, n_products, n_reviews)],
+        'timestamp': 1_500_000_000 + rng.permutation(n_reviews * 50)[:n_reviews].astype(np.int64) * 3_600,
+        'rating': ratings,
+    })
+
+
+def random_products(rng, n=2_000):
+    return pd.DataFrame({
+        'category': rng.choice(['Beauty', 'Electronics', 'Pet Supplies'], n),
+        'year': rng.integers(2015, 2021, n),
+        'early_avg_rating': np.round(rng.uniform(3.0, 5.0, n), 2).astype(np.float32),
+        'early_rating_std': np.round(rng.uniform(0.2, 1.8, n), 2).astype(np.float32),
+        'oneyear_avg_rating': np.round(rng.uniform(3.0, 5.0, n), 2).astype(np.float32),
+    })
@@ -0,0 +1,83 @@
+import threading
+import time
+
+from product_success.cache import LRUCache, make_key
+
+
+def test_concurrent_misses_build_once():
+    cache = LRUCache()
+    started, release = threading.Event(), threading.Event()
+    builds = []
+
+    def build():
+        builds.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_build('k', build))) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == ['value'] * 8
+    assert len(builds) == 1
+    assert (cache.misses, cache.hits) == (1, 7)
+
+
+def test_failed_build_reaches_waiters_and_is_not_cached():
+    cache = LRUCache()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('boom')
+
+    def get(build):
+        try:
+            cache.get_or_build('k', build)
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    owner = threading.Thread(target=get, args=(fail,))
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=get, args=(lambda: 'unused',))
+    waiter.start()
+    while cache.hits < 1:  # the waiter has joined the pending build
+        time.sleep(0.001)
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+    assert errors == ['boom', 'boom']
+    assert 'k' not in cache
+    assert cache.get_or_build('k', lambda: 2) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(maxsize=2)
+    cache.get_or_build('a', lambda: 1)
+    cache.get_or_build('b', lambda: 2)
+    cache.get_or_build('a', lambda: None)  # touch a, so b is the oldest
+    cache.get_or_build('c', lambda: 3)
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.stats()['evictions'] == 1
+
+
+def test_retain_version_drops_other_versions():
+    cache = LRUCache()
+    for version in ('v1', 'v2'):
+        cache.get_or_build(make_key('table', version, {'x': 1}), lambda: version)
+    cache.retain_version('v2')
+    assert make_key('table', 'v2', {'x': 1}) in cache
+    assert make_key('table', 'v1', {'x': 1}) not in cache
+
+
+def test_key_ignores_parameter_order():
+    assert make_key('t', 'v', {'a': 1, 'b': 2}) == make_key('t', 'v', {'b': 2, 'a': 1})
@@ -0,0 +1,69 @@
+from collections import Counter
+
+import numpy as np
+
+from product_success.complaints import SpaceSaving, bigrams
+
+
+def zipf_stream(rng, n=20_000, vocabulary=500):
+    weights = 1.0 / np.arange(1, vocabulary + 1) ** 1.2
+    return [f"w{i}" for i in rng.choice(vocabulary, n, p=weights / weights.sum())]
+
+
+def summarize(items, capacity):
+    sketch = SpaceSaving(capacity)
+    for item in items:
+        sketch.update(item)
+    return sketch
+
+
+def assert_space_saving_bounds(sketch, exact):
+    bound = sketch.total / sketch.capacity
+    assert sketch.total == sum(exact.values())
+    assert len(sketch) <= sketch.capacity
+    for item, count in sketch.counts.items():
+        # Never under-counts, over-counts by at most its error, and the error by at most N / capacity
+        assert exact[item] <= count <= exact[item] + sketch.errors[item]
+        assert sketch.errors[item] <= bound
+    for item, count in exact.items():
+        if count > bound:
+            assert item in sketch.counts
+        elif item not in sketch.counts:
+            assert count <= sketch.floor()
+
+
+def test_exact_when_capacity_covers_the_vocabulary(rng):
+    items = zipf_stream(rng, vocabulary=100)
+    sketch = summarize(items, 100)
+    assert sketch.counts == dict(Counter(items))
+    assert set(sketch.errors.values()) == {0}
+
+
+def test_bounds_against_exact_counts(rng):
+    items = zipf_stream(rng)
+    exact = Counter(items)
+    sketch = summarize(items, 60)
+    assert_space_saving_bounds(sketch, exact)
+    # The heavy hitters come out on top
+    assert [item for item, _ in sketch.top(5)] == [item for item, _ in exact.most_common(5)]
+
+
+def test_merged_summaries_keep_the_bounds(rng):
+    items = zipf_stream(rng)
+    parts = [items[i::4] for i in range(4)]
+    merged = summarize(parts[0], 60)
+    for part in parts[1:]:
+        merged = merged.merge(summarize(part, 60))
+    assert_space_saving_bounds(merged, Counter(items))
+
+
+def test_update_counts_matches_item_updates(rng):
+    items = zipf_stream(rng, n=3_000, vocabulary=80)
+    sketch = SpaceSaving(200)
+    sketch.update_counts(Counter(items))
+    assert sketch.counts == dict(Counter(items))
+
+
+def test_bigrams_skip_stopwords_and_clause_breaks():
+    assert bigrams("It broke after two days. Total waste of money!") == [
+        'broke two', 'two days', 'total waste', 'waste money']
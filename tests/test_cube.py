@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.helpers import random_products
+from product_success import scoring
+from product_success.cube import Cube, build, load_cube, read_cube, save_cube
+from product_success.feature_store import FeatureStore
+
+SLICES = [
+    {},
+    {'categories': ['Beauty', 'Pet Supplies']},
+    {'years': (2016, 2018)},
+    {'years': (2019, 2030)},
+    {'tiers': ['RED', 'YELLOW']},
+    {'categories': ['Electronics'], 'years': (2015, 2017), 'tiers': ['GREEN']},
+]
+
+
+def select(products, categories=None, years=None, tiers=None):
+    keep = np.ones(len(products), dtype=bool)
+    if categories is not None:
+        keep &= products['category'].isin(categories).to_numpy()
+    if years is not None:
+        keep &= products['year'].between(*years).to_numpy()
+    if tiers is not None:
+        tier = scoring.score_products(products)
+        keep &= np.isin(tier, [getattr(scoring, t) for t in tiers])
+    return products[keep]
+
+
+def brute_force_failure(products, **selection):
+    chosen = select(products, **selection).assign(
+        failed=lambda df: scoring.failed(df['oneyear_avg_rating']),
+        early=lambda df: df['early_avg_rating'].astype(np.float64),
+        oneyear=lambda df: df['oneyear_avg_rating'].astype(np.float64))
+    return chosen.groupby('category').agg(
+        rate=('failed', lambda x: round(100 * x.mean(), 1)), products=('failed', 'size'),
+        early_avg_rating=('early', 'mean'), oneyear_avg_rating=('oneyear', 'mean'))
+
+
+def assert_failure_matches(cube, products, **selection):
+    result = cube.category_failure(**selection).set_index('category')
+    expected = brute_force_failure(products, **selection)
+    result = result[result['products'] > 0]
+    assert sorted(result.index) == sorted(expected.index)
+    expected = expected.reindex(result.index)
+    np.testing.assert_array_equal(result['products'], expected['products'])
+    np.testing.assert_allclose(result['rate'], expected['rate'])
+    for column in ('early_avg_rating', 'oneyear_avg_rating'):
+        np.testing.assert_allclose(result[column], expected[column], rtol=1e-9, err_msg=column)
+
+
+def brute_force_distribution(products, **selection):
+    tiers = scoring.score_products(select(products, **selection))
+    return np.bincount(tiers, minlength=3)
+
+
+@pytest.mark.parametrize('selection', SLICES)
+def test_slices_match_brute_force(rng, selection):
+    products = random_products(rng)
+    cube = Cube().add(products)
+    assert_failure_matches(cube, products, **selection)
+    np.testing.assert_array_equal(cube.alert_distribution(**selection)['value'],
+                                  brute_force_distribution(products, **selection))
+
+
+def test_remove_undoes_add(rng):
+    products = random_products(rng)
+    kept, dropped = products.iloc[:1_500], products.iloc[1_500:]
+    cube = Cube().add(products).add(dropped, sign=-1)
+    np.testing.assert_allclose(cube.sums, Cube().add(kept).sums, atol=1e-9)
+    assert_failure_matches(cube, kept)
+
+
+def test_merge_equals_adding_both(rng):
+    products = random_products(rng)
+    # The second part brings a category and years the first part does not have
+    first = products[(products['category'] != 'Beauty') & (products['year'] < 2018)]
+    second = products.drop(first.index)
+    merged = Cube().add(first).merge(Cube().add(second))
+    for selection in SLICES:
+        assert_failure_matches(merged, products, **selection)
+        np.testing.assert_array_equal(merged.alert_distribution(**selection)['value'],
+                                      brute_force_distribution(products, **selection))
+
+
+def test_bytes_round_trip(rng):
+    cube = Cube(source='v1').add(random_products(rng))
+    loaded = Cube.from_bytes(cube.to_bytes())
+    assert (loaded.categories, loaded.years, loaded.source) == (cube.categories, cube.years, 'v1')
+    np.testing.assert_array_equal(loaded.sums, cube.sums)
+    pd.testing.assert_frame_equal(loaded.category_failure(years=(2016, 2019)),
+                                  cube.category_failure(years=(2016, 2019)))
+
+    empty = Cube.from_bytes(Cube().to_bytes())
+    assert empty.years == (None, None) and empty.source is None
+
+
+def test_empty_cube_gives_zero_counts():
+    cube = Cube()
+    assert cube.category_failure().empty
+    assert cube.category_failure(categories=['Beauty'], years=(2016, 2018), tiers=['RED']).empty
+    np.testing.assert_array_equal(cube.alert_distribution(years=(2016, 2018))['value'], [0, 0, 0])
+
+
+def test_stale_cube_is_rebuilt_and_saved(rng, tmp_path):
+    store = FeatureStore(tmp_path)
+    products = random_products(rng)
+    store.write('products', products)
+    save_cube(store, build(store))
+
+    store.write('products', products.iloc[:500])
+    version = store.version
+    rebuilt = load_cube(store)
+    assert rebuilt.alert_distribution()['value'].sum() == 500
+    # Saved back for the next cold start, without bumping the store version
+    assert read_cube(store).source == store.table_version('products')
+    assert FeatureStore(tmp_path).version == version
+
+
+def test_empty_products_table(rng, tmp_path):
+    store = FeatureStore(tmp_path)
+    store.write('products', random_products(rng).iloc[:0], ['category', 'year'])
+    assert len(FeatureStore(tmp_path).read('products')) == 0
+    np.testing.assert_array_equal(build(store).alert_distribution()['value'], [0, 0, 0])
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.helpers import random_reviews
+from product_success.drift import FEED_COLUMNS, DriftMonitor, append_feed, main, read_feed
+from product_success.scoring import RATING_THRESHOLD, VOLATILITY_THRESHOLD
+
+WINDOW = 8
+MIN_REVIEWS = 4
+
+
+def brute_force(reviews):
+    """Replay each product's reviews in time order over an explicit rolling window."""
+    alerts = []
+    for product_id, group in reviews.sort_values('timestamp').groupby('product_id'):
+        ratings = group['rating'].to_numpy()
+        volatile = low = False
+        for i, time in enumerate(group['timestamp']):
+            window = ratings[max(0, i + 1 - WINDOW):i + 1]
+            mean = window.mean()
+            std = window.std(ddof=1) if len(window) > 1 else 0.0
+            ready = i + 1 >= MIN_REVIEWS
+            now_volatile, now_low = ready and std > VOLATILITY_THRESHOLD, ready and mean < RATING_THRESHOLD
+            for alert, was, now in (('volatility', volatile, now_volatile), ('rating', low, now_low)):
+                if now and not was:
+                    alerts.append((time, product_id, alert, round(mean, 3), round(std, 3), i + 1))
+            volatile, low = now_volatile, now_low
+    return pd.DataFrame(alerts, columns=FEED_COLUMNS)
+
+
+def canonical(alerts):
+    return (alerts.astype({'time': np.int64, 'product_id': str, 'alert': str, 'rolling_mean': np.float64,
+                           'rolling_std': np.float64, 'reviews': np.int64})
+            .sort_values(['time', 'alert']).reset_index(drop=True))
+
+
+def run(reviews, batches):
+    monitor = DriftMonitor(WINDOW, MIN_REVIEWS, capacity=4)
+    ordered = reviews.sort_values('timestamp')
+    alerts = []
+    for rows in np.array_split(np.arange(len(ordered)), batches):
+        batch = ordered.iloc[rows].sample(frac=1, random_state=2)
+        alerts.append(monitor.update(batch['product_id'], batch['timestamp'], batch['rating']))
+    return monitor, pd.concat(alerts, ignore_index=True)
+
+
+def test_alerts_match_brute_force(rng):
+    reviews = random_reviews(rng, n_reviews=2_000, n_products=25, continuous=True)
+    expected = brute_force(reviews)
+    assert len(expected) > 20
+    for batches in (1, 6, 40):
+        _, alerts = run(reviews, batches)
+        pd.testing.assert_frame_equal(canonical(alerts), canonical(expected), check_exact=False, atol=2e-3)
+
+
+def test_flagged_matches_last_window(rng):
+    reviews = random_reviews(rng, n_reviews=2_000, n_products=25, continuous=True)
+    monitor, _ = run(reviews, 5)
+    flagged = monitor.flagged()
+    tail = reviews.sort_values('timestamp').groupby('product_id').tail(WINDOW).groupby('product_id')['rating']
+    mean, std = tail.mean(), tail.std()
+    expected = mean.index[(mean < RATING_THRESHOLD) | (std > VOLATILITY_THRESHOLD)]
+    assert sorted(flagged.index) == sorted(expected)
+    np.testing.assert_allclose(flagged['rolling_mean'], mean[flagged.index], rtol=1e-5)
+    np.testing.assert_allclose(flagged['rolling_std'], std[flagged.index], rtol=1e-4)
+
+
+def test_save_and_load_continue_identically(rng, tmp_path):
+    reviews = random_reviews(rng, n_reviews=2_000, n_products=25, continuous=True).sort_values('timestamp')
+    first, rest = reviews.iloc[:1_200], reviews.iloc[1_200:]
+    monitor = DriftMonitor(WINDOW, MIN_REVIEWS)
+    monitor.update(first['product_id'], first['timestamp'], first['rating'])
+    monitor.save(tmp_path / 'drift.npz')
+    loaded = DriftMonitor.load(tmp_path / 'drift.npz')
+    assert (loaded.window, loaded.min_reviews) == (WINDOW, MIN_REVIEWS)
+    pd.testing.assert_frame_equal(
+        loaded.update(rest['product_id'], rest['timestamp'], rest['rating']),
+        monitor.update(rest['product_id'], rest['timestamp'], rest['rating']))
+
+
+def test_late_reviews_are_skipped_and_counted(rng):
+    reviews = random_reviews(rng, n_reviews=2_000, n_products=25, continuous=True).sort_values('timestamp')
+    first, rest = reviews.iloc[:1_000], reviews.iloc[1_000:]
+    # Reviews that predate each product's newest review in the first batch
+    newest = first.groupby('product_id')['timestamp'].max()
+    late = first.groupby('product_id').head(2).assign(timestamp=lambda df: df['timestamp'] - 1)
+    late = late[late['timestamp'] < late['product_id'].map(newest)]
+
+    monitor = DriftMonitor(WINDOW, MIN_REVIEWS)
+    alerts = [monitor.update(first['product_id'], first['timestamp'], first['rating'])]
+    batch = pd.concat([late, rest]).sample(frac=1, random_state=9)
+    alerts.append(monitor.update(batch['product_id'], batch['timestamp'], batch['rating']))
+    assert monitor.late_reviews == len(late) > 0
+    pd.testing.assert_frame_equal(canonical(pd.concat(alerts, ignore_index=True)), canonical(brute_force(reviews)),
+                                  check_exact=False, atol=2e-3)
+
+
+def test_cli_rejects_a_window_that_conflicts_with_the_state(rng, tmp_path):
+    path = tmp_path / 'reviews.csv'
+    random_reviews(rng, n_reviews=300, n_products=5).to_csv(path, index=False)
+    state, feed = tmp_path / 'drift.npz', tmp_path / 'feed.jsonl'
+    main([str(state), str(path), '--feed', str(feed), '--window', '12'])
+    main([str(state), str(path), '--feed', str(feed), '--window', '12'])
+    main([str(state), str(path), '--feed', str(feed)])
+    assert DriftMonitor.load(state).window == 12
+    with pytest.raises(SystemExit):
+        main([str(state), str(path), '--feed', str(feed), '--window', '8'])
+
+
+def test_feed_tail_read(tmp_path):
+    path = tmp_path / 'feed.jsonl'
+    for start in range(0, 300, 100):
+        append_feed(path, pd.DataFrame({
+            'time': np.arange(start, start + 100), 'product_id': 'p', 'alert': 'rating',
+            'rolling_mean': 3.5, 'rolling_std': 0.5, 'reviews': 10,
+        }))
+    feed = read_feed(path, limit=25, block_size=256)
+    assert feed['time'].tolist() == list(range(299, 274, -1))
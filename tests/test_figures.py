@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from product_success.figures import product_scatter
+
+COLORS = {'a': 'red', 'b': 'blue', 'c': 'green'}
+
+
+def binned(frame, bins):
+    fig = product_scatter(frame, 'x', 'y', 'group', COLORS, binned_threshold=0, bins=bins)
+    return {trace.name: trace for trace in fig.data}
+
+
+def random_points(rng, n=5_000):
+    return pd.DataFrame({
+        'x': rng.normal(3.5, 0.6, n),
+        'y': rng.uniform(1, 5, n),
+        'group': rng.choice(['a', 'b', 'c'], n, p=[0.6, 0.3, 0.1]),
+    })
+
+
+def test_bins_match_histogram2d(rng):
+    frame = random_points(rng)
+    frame.loc[::97, 'y'] = np.nan
+    bins = 12
+    traces = binned(frame, bins)
+    valid = frame.dropna()
+    x_edges = np.linspace(valid['x'].min(), valid['x'].max(), bins + 1)
+    y_edges = np.linspace(valid['y'].min(), valid['y'].max(), bins + 1)
+    x_centers, y_centers = (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
+    assert set(traces) == set(valid['group'])
+    for group, points in valid.groupby('group'):
+        expected, _, _ = np.histogram2d(points['x'], points['y'], bins=[x_edges, y_edges])
+        got = np.zeros((bins, bins))
+        trace = traces[group]
+        got[np.searchsorted(x_centers, trace.x), np.searchsorted(y_centers, trace.y)] = trace.customdata
+        np.testing.assert_array_equal(got, expected, err_msg=group)
+        assert (np.asarray(trace.customdata) > 0).all()
+    assert sum(np.sum(t.customdata) for t in traces.values()) == len(valid)
+
+
+def test_payload_is_bounded_by_the_grid(rng):
+    traces = binned(random_points(rng, 50_000), 10)
+    assert all(len(trace.x) <= 100 for trace in traces.values())
+
+
+def test_no_plottable_points_keeps_the_groups():
+    frame = pd.DataFrame({'x': [np.nan, 1.0], 'y': [2.0, np.nan], 'group': ['a', 'b']})
+    traces = binned(frame, 5)
+    assert set(traces) == {'a', 'b'}
+    assert all(len(trace.x) == 0 for trace in traces.values())
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+from tests.helpers import random_reviews
+from product_success.incremental import EarlyStatsAggregator
+
+
+def brute_force(reviews, window):
+    early = reviews.sort_values('timestamp').groupby('product_id').head(window)
+    grouped = early.groupby('product_id')['rating']
+    stars = np.clip(np.rint(early['rating']), 1, 5)
+    return pd.DataFrame({
+        'early_reviews': grouped.size(),
+        'n_reviews': reviews.groupby('product_id').size(),
+        'early_avg_rating': grouped.mean(),
+        'early_rating_std': grouped.std().fillna(0.0),
+        'early_1star_rate': (stars == 1).groupby(early['product_id']).mean(),
+        'early_5star_rate': (stars == 5).groupby(early['product_id']).mean(),
+    })
+
+
+def fold(reviews, batches, window):
+    agg = EarlyStatsAggregator(window, capacity=4)
+    ordered = reviews.sort_values('timestamp')
+    for rows in np.array_split(np.arange(len(ordered)), batches):
+        batch = ordered.iloc[rows].sample(frac=1, random_state=4)
+        agg.update(batch['product_id'].to_numpy(), batch['timestamp'].to_numpy(), batch['rating'].to_numpy())
+    return agg
+
+
+def assert_matches(features, expected):
+    features = features.sort_index()
+    expected = expected.reindex(features.index)
+    for column in expected:
+        np.testing.assert_allclose(features[column].to_numpy(np.float64), expected[column].to_numpy(np.float64),
+                                   rtol=1e-5, atol=1e-6, err_msg=column)
+
+
+def test_matches_brute_force_in_one_batch(rng):
+    reviews = random_reviews(rng)
+    assert_matches(fold(reviews, 1, 30).features(), brute_force(reviews, 30))
+
+
+def test_welford_merge_across_batches(rng):
+    reviews = random_reviews(rng)
+    # Batches split product windows at arbitrary points, including mid-window
+    for batches in (2, 7, 50):
+        assert_matches(fold(reviews, batches, 30).features(), brute_force(reviews, 30))
+
+
+def test_min_reviews_filter(rng):
+    reviews = random_reviews(rng, n_reviews=200, n_products=60)
+    features = fold(reviews, 3, 30).features(min_reviews=4)
+    counts = reviews.groupby('product_id').size()
+    assert set(features.index) == set(counts[counts >= 4].index)
+
+
+def test_save_and_load_round_trip(rng, tmp_path):
+    reviews = random_reviews(rng)
+    agg = fold(reviews, 5, 30)
+    agg.save(tmp_path / 'state.npz')
+    loaded = EarlyStatsAggregator.load(tmp_path / 'state.npz')
+    pd.testing.assert_frame_equal(loaded.features(), agg.features())
+
+    # The loaded state keeps folding correctly
+    more = random_reviews(np.random.default_rng(1), n_reviews=500)
+    more['timestamp'] += reviews['timestamp'].max()
+    for state in (agg, loaded):
+        state.update(more['product_id'].to_numpy(), more['timestamp'].to_numpy(), more['rating'].to_numpy())
+    assert_matches(loaded.features(), brute_force(pd.concat([reviews, more]), 30))
+
+
+def test_shuffled_files_match_brute_force(rng, tmp_path):
+    reviews = random_reviews(rng)
+    path = tmp_path / 'reviews.csv'
+    reviews.sample(frac=1, random_state=6).to_csv(path, index=False)
+    agg = EarlyStatsAggregator(30)
+    agg.update_files([path], chunk_size=256, partitions=3, spill_dir=tmp_path)
+    features = agg.features()
+    assert not features['stale'].any()
+    assert_matches(features, brute_force(reviews, 30))
+
+
+def test_review_older_than_early_window_marks_product_stale(rng):
+    reviews = random_reviews(rng, n_reviews=400, n_products=4)
+    agg = fold(reviews, 1, 30)
+    before = agg.features()
+
+    first = reviews.sort_values('timestamp').iloc[:1]
+    agg.update(first['product_id'].to_numpy(), first['timestamp'].to_numpy() - 1, first['rating'].to_numpy())
+    after = agg.features()
+    product = first['product_id'].iloc[0]
+    assert after['stale'].tolist() == (after.index == product).tolist()
+    # A stale product's state is left as it was and it drops out of the alert counts
+    pd.testing.assert_series_equal(after.loc[product].drop('stale'), before.loc[product].drop('stale'))
+    assert agg.alert_distribution()['value'].sum() == len(after) - 1
+
+
+def test_newer_reviews_after_a_full_window_are_not_stale(rng):
+    reviews = random_reviews(rng, n_reviews=400, n_products=4).sort_values('timestamp')
+    early = reviews.groupby('product_id').head(30)
+    rest = reviews.drop(early.index).sample(frac=1, random_state=8)
+    agg = EarlyStatsAggregator(30)
+    agg.update(early['product_id'], early['timestamp'], early['rating'])
+    # Later reviews may come in any order once the window is full
+    agg.update(rest['product_id'], rest['timestamp'], rest['rating'])
+    assert not agg.features()['stale'].any()
+    assert_matches(agg.features(), brute_force(reviews, 30))
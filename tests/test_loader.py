@@ -0,0 +1,60 @@
+import threading
+
+from product_success.loader import Loader, parse_timeouts
+
+
+def test_groups_are_yielded_as_their_sources_finish():
+    gates = {'slow': threading.Event(), 'fast': threading.Event()}
+    calls = []
+
+    def load(source, **params):
+        calls.append((source, params))
+        gates[source].wait(5)
+        return source
+
+    loader = Loader(max_workers=4, timeout=10)
+    batch = loader.fetch({
+        'Overview': [('fast', {})],
+        'Trends': [('fast', {}), ('slow', {})],
+    }, load)
+    gates['fast'].set()
+    ready = batch.ready()
+    assert next(ready) == ('Overview', [])
+    gates['slow'].set()
+    assert list(ready) == [('Trends', [])]
+    # A source shared by two groups is loaded once
+    assert sorted(calls) == [('fast', {}), ('slow', {})]
+    assert batch.futures[('slow', ())].result() == 'slow'
+
+
+def test_source_past_its_deadline_is_reported_and_keeps_loading():
+    release = threading.Event()
+
+    def load(source, **params):
+        if source == 'slow':
+            release.wait(5)
+        return source
+
+    loader = Loader(max_workers=2, timeout=10, timeouts={'slow': 0.05})
+    batch = loader.fetch({'Overview': [('fast', {})], 'Trends': [('slow', {'n': 1})]}, load)
+    assert dict(batch.ready()) == {'Overview': [], 'Trends': ['slow']}
+    release.set()
+    assert batch.futures[('slow', (('n', 1),))].result(5) == 'slow'
+
+
+def test_ready_waits_only_for_the_requested_groups():
+    release = threading.Event()
+
+    def load(source, **params):
+        if source == 'slow':
+            release.wait(5)
+        return source
+
+    batch = Loader(max_workers=2).fetch({'Overview': [('fast', {})], 'Trends': [('slow', {})]}, load)
+    assert list(batch.ready(['Overview'])) == [('Overview', [])]
+    release.set()
+
+
+def test_parse_timeouts():
+    assert parse_timeouts('kmeans_data=30, trajectory_data=2.5,') == {'kmeans_data': 30.0, 'trajectory_data': 2.5}
+    assert parse_timeouts(None) == {}
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.helpers import random_products
+from product_success import products as product_table, scoring
+from product_success.feature_store import FeatureStore, PRODUCT_PARTITIONING
+from product_success.products import ProductTable
+from product_success.trajectories import TRAJECTORIES, label_trajectories
+
+
+@pytest.fixture
+def frame(rng):
+    frame = random_products(rng)
+    frame['trajectory'] = label_trajectories(frame['early_avg_rating'], frame['oneyear_avg_rating'])
+    frame['n_reviews'] = rng.integers(1, 5_000, len(frame))
+    return frame
+
+
+def test_compact_encoding(frame):
+    table = ProductTable.from_frame(frame.astype({'early_avg_rating': np.float64}))
+    assert table.arrays['category'].dtype == np.int8
+    assert table.arrays['early_avg_rating'].dtype == np.float32
+    assert table.arrays['n_reviews'].dtype == frame['n_reviews'].dtype
+    # Known label sets keep their canonical order even when some labels are unused
+    assert table.labels['trajectory'] == TRAJECTORIES
+    assert table.labels['category'] == sorted(frame['category'].unique())
+    with pytest.raises(ValueError):
+        table.arrays['early_avg_rating'][0] = 1.0
+
+
+def test_frame_round_trip(frame):
+    table = ProductTable.from_frame(frame)
+    view = table.frame()
+    assert len(table) == len(frame)
+    assert isinstance(view['category'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(view.astype({'category': str, 'trajectory': str}), frame, check_dtype=False)
+
+
+@pytest.mark.parametrize('categories, years', [
+    (['Beauty'], None), (None, (2016, 2018)), (['Electronics', 'Pet Supplies'], (2019, 2019)), ([], None),
+    (['Garden'], None),
+])
+def test_filters_match_pandas(frame, categories, years):
+    table = ProductTable.from_frame(frame)
+    expected = frame
+    if categories is not None:
+        expected = expected[expected['category'].isin(categories)]
+    if years is not None:
+        expected = expected[expected['year'].between(*years)]
+    view = table.frame(['category', 'year', 'oneyear_avg_rating'], categories, years)
+    assert view['category'].astype(str).tolist() == expected['category'].tolist()
+    np.testing.assert_array_equal(view['year'], expected['year'])
+    np.testing.assert_array_equal(view['oneyear_avg_rating'], expected['oneyear_avg_rating'])
+
+
+def test_build_from_store(frame, tmp_path):
+    store = FeatureStore(tmp_path)
+    store.write('products', frame.drop(columns='trajectory'), PRODUCT_PARTITIONING)
+    table = product_table.build(store)
+    # The store returns rows grouped by partition
+    order = ['category', 'year', 'early_avg_rating', 'early_rating_std', 'oneyear_avg_rating']
+    view = table.frame().astype({'category': str}).sort_values(order, ignore_index=True)
+    expected = frame.sort_values(order, ignore_index=True)
+    assert view['trajectory'].astype(str).tolist() == expected['trajectory'].tolist()
+    tiers = np.asarray(scoring.ALERT_TIERS)[scoring.score_products(expected)]
+    assert view['alert_tier'].astype(str).tolist() == tiers.tolist()
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from tests.helpers import random_products
+from product_success import scoring
+
+
+def brute_force_tiers(products, category_thresholds=None):
+    rating_threshold = products['category'].map(category_thresholds or {}).fillna(scoring.RATING_THRESHOLD)
+    low = products['early_avg_rating'] < rating_threshold.astype(np.float32)
+    volatile = products['early_rating_std'] > scoring.VOLATILITY_THRESHOLD
+    return np.where(low & volatile, 'RED', np.where(low | volatile, 'YELLOW', 'GREEN'))
+
+
+def test_tiers_match_the_rule(rng):
+    products = random_products(rng)
+    names = np.array(['RED', 'YELLOW', 'GREEN'])
+    np.testing.assert_array_equal(names[scoring.score_products(products)], brute_force_tiers(products))
+    np.testing.assert_array_equal(names[scoring.score_products(products, scoring.CATEGORY_THRESHOLDS)],
+                                  brute_force_tiers(products, scoring.CATEGORY_THRESHOLDS))
+
+
+def test_rule_metrics_match_pandas(rng):
+    products = random_products(rng)
+    frame = pd.DataFrame({
+        'tier': brute_force_tiers(products),
+        'failed': products['oneyear_avg_rating'] < 4.0,
+    })
+    red = frame[frame['tier'] == 'RED']
+    expected = {
+        'products': len(frame),
+        'flagged': len(red),
+        'flagged_share': 100 * len(red) / len(frame),
+        'precision': 100 * red['failed'].mean(),
+        'recall': 100 * red['failed'].sum() / frame['failed'].sum(),
+        'yellow_fail': 100 * frame.loc[frame['tier'] == 'YELLOW', 'failed'].mean(),
+        'green_fail': 100 * frame.loc[frame['tier'] == 'GREEN', 'failed'].mean(),
+    }
+    metrics = scoring.rule_metrics(scoring.score_products(products), scoring.failed(products['oneyear_avg_rating']))
+    assert metrics.keys() == expected.keys()
+    for name, value in expected.items():
+        assert np.isclose(metrics[name], value), name
+
+
+def test_rule_metrics_without_products_or_failures():
+    empty = scoring.rule_metrics(np.array([], dtype=np.int8), np.array([], dtype=bool))
+    assert empty == {'products': 0, 'flagged': 0, 'flagged_share': 0.0, 'precision': 0.0, 'recall': 0.0,
+                     'yellow_fail': 0.0, 'green_fail': 0.0}
+    assert scoring.rule_metrics(np.array([scoring.RED, scoring.GREEN]), np.array([False, False]))['recall'] == 0.0
+
+
+def test_alert_distribution_counts_every_tier():
+    tiers = np.array([scoring.GREEN, scoring.GREEN, scoring.RED])
+    assert scoring.alert_distribution(tiers)['value'].tolist() == [1, 0, 2]
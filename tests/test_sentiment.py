@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from tests.helpers import random_reviews
+from product_success import sentiment
+from product_success.sentiment import SentimentCache, SentimentStats, early_sentiment, score_batch, score_texts
+
+PHRASES = ['great product, works perfectly', 'broke after two days', 'not good at all', 'it is fine',
+           'love it, highly recommend', 'terrible quality, do not buy', 'arrived on time', 'never works']
+
+
+def test_scores_are_bounded_and_negation_flips_the_sign():
+    scores = score_batch(['good', 'not good', 'excellent excellent excellent', ''])
+    assert scores[0] > 0 > scores[1]
+    assert np.all(np.abs(scores) < 1)
+    assert scores[3] == 0
+
+
+def test_cache_serves_repeat_texts(tmp_path):
+    texts = PHRASES * 3
+    cache = SentimentCache(tmp_path / 'cache.sqlite')
+    first = SentimentStats()
+    scores = score_texts(texts, cache, stats=first)
+    np.testing.assert_allclose(scores, score_batch(texts))
+    # Duplicates are scored once
+    assert (first.reviews, first.cached, first.scored) == (len(texts), 0, len(PHRASES))
+    assert len(cache) == len(PHRASES)
+
+    again = SentimentStats()
+    np.testing.assert_array_equal(score_texts(texts, cache, stats=again), scores)
+    assert (again.cached, again.scored) == (len(texts), 0)
+    cache.close()
+
+
+def test_cache_lookups_beyond_the_sqlite_parameter_limit(tmp_path):
+    cache = SentimentCache(tmp_path / 'cache.sqlite')
+    texts = [f"review {i} was good" for i in range(2_000)]
+    keys = sentiment.text_keys(texts)
+    cache.put(keys[::2], np.arange(1_000, dtype=np.float64))
+    found = cache.get(keys)
+    np.testing.assert_array_equal(found[::2], np.arange(1_000))
+    assert np.isnan(found[1::2]).all()
+    cache.close()
+
+
+def test_cache_is_cleared_when_the_lexicon_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'cache.sqlite'
+    cache = SentimentCache(path)
+    score_texts(PHRASES, cache)
+    cache.close()
+    for version, expected in ((sentiment.LEXICON_VERSION, len(PHRASES)), (sentiment.LEXICON_VERSION + 1, 0)):
+        monkeypatch.setattr(sentiment, 'LEXICON_VERSION', version)
+        cache = SentimentCache(path)
+        assert len(cache) == expected
+        cache.close()
+
+
+def test_early_sentiment_matches_pandas(rng, tmp_path):
+    reviews = random_reviews(rng, n_reviews=600, n_products=12)
+    reviews['text'] = rng.choice(PHRASES, len(reviews))
+    path = tmp_path / 'reviews.csv'
+    reviews.sample(frac=1, random_state=2).to_csv(path, index=False)
+
+    result, stats = early_sentiment([path], tmp_path / 'cache.sqlite', window=10, chunk_size=97, max_workers=1)
+    early = reviews.sort_values('timestamp').groupby('product_id').head(10)
+    expected = pd.Series(score_batch(early['text'].tolist()), index=early['product_id']).groupby(level=0).mean()
+    np.testing.assert_allclose(result.sort_index(), expected.sort_index(), rtol=1e-6)
+    assert stats.scored == len(PHRASES)
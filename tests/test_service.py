@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from product_success import service
+
+FEATURES = ['early_avg_rating', 'early_rating_std']
+
+
+class ConstantModel:
+
+    def predict_proba(self, X):
+        return np.tile([0.25, 0.75], (len(X), 1))
+
+
+@pytest.fixture(autouse=True)
+def predictor(monkeypatch):
+    monkeypatch.setattr(service, 'load_predictor', lambda *args: (ConstantModel(), FEATURES, 'Constant'))
+
+
+def post(body, content_type=b'application/json'):
+    messages = iter([{'type': 'http.request', 'body': body}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'path': '/score', 'method': 'POST', 'headers': [(b'content-type', content_type)]}
+    asyncio.run(service.app(scope, receive, send))
+    return sent[0]['status'], json.loads(sent[1]['body'])
+
+
+def test_scores_json_rows():
+    status, payload = post(json.dumps({'products': [
+        {'product_id': 'a', 'early_avg_rating': 3.5, 'early_rating_std': 1.2},
+        {'product_id': 'b', 'early_avg_rating': 4.5, 'early_rating_std': 0.5},
+    ]}).encode())
+    assert status == 200
+    assert [(r['product_id'], r['alert_tier']) for r in payload['results']] == [('a', 'RED'), ('b', 'GREEN')]
+
+
+def test_scores_csv():
+    status, payload = post(b'early_avg_rating,early_rating_std\n3.9,0.4\n', b'text/csv')
+    assert status == 200
+    assert payload['results'] == [{'success_probability': 0.75, 'alert_tier': 'YELLOW'}]
+
+
+@pytest.mark.parametrize('body', [b'[]', b'{"products": []}'])
+def test_empty_batch(body):
+    status, payload = post(body)
+    assert status == 200
+    assert (payload['products'], payload['results']) == (0, [])
+
+
+@pytest.mark.parametrize('body', [
+    b'[1, 2]', b'{"products": [1, 2]}', b'[{"early_avg_rating": 4.0, "early_rating_std": 0.5}, "x"]',
+    b'{"products": 3}', b'[{"early_avg_rating": 4.0}]', b'[{"early_avg_rating": "high", "early_rating_std": 0.5}]',
+    b'not json',
+])
+def test_malformed_bodies_are_rejected(body):
+    status, payload = post(body)
+    assert status == 422
+    assert payload['error']
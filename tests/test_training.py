@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from product_success.training import TrainingError, check_labels, evaluate
+
+
+@pytest.mark.parametrize('y, message', [
+    (np.array([], dtype=int), 'no products'),
+    (np.ones(50, dtype=int), 'all 50 products succeeded'),
+    (np.zeros(50, dtype=int), 'all 50 products failed'),
+    (np.array([1] * 40 + [0] * 3), 'only 3 failures'),
+])
+def test_unusable_labels_raise_a_clear_error(y, message):
+    with pytest.raises(TrainingError, match=message):
+        check_labels(y, n_folds=5)
+    with pytest.raises(TrainingError, match=message):
+        evaluate(np.zeros((len(y), 2)), y, n_folds=5, max_workers=1)
+
+
+def test_enough_of_both_classes():
+    check_labels(np.array([1] * 40 + [0] * 5), n_folds=5)
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+from tests.helpers import random_reviews
+from product_success.trajectories import TRAJECTORIES, TrajectoryEngine, stable_share
+
+WINDOW = 20
+HORIZON = 90 * 24 * 3600
+
+
+def brute_force(reviews):
+    reviews = reviews.sort_values('timestamp')
+    early = reviews.groupby('product_id').head(WINDOW)
+    first = reviews.groupby('product_id')['timestamp'].min()
+    in_year = reviews[reviews['timestamp'] <= reviews['product_id'].map(first) + HORIZON]
+    early_avg = early.groupby('product_id')['rating'].mean()
+    oneyear_avg = in_year.groupby('product_id')['rating'].mean()
+    trajectory = np.select(
+        [(early_avg >= 4) & (oneyear_avg >= 4), (early_avg < 4) & (oneyear_avg < 4), early_avg < 4],
+        ['Stable High', 'Stable Low', 'Recovered'], 'Declined')
+    return pd.DataFrame({
+        'first_review': first,
+        'n_reviews': reviews.groupby('product_id').size(),
+        'early_avg_rating': early_avg,
+        'oneyear_avg_rating': oneyear_avg,
+        'trajectory': trajectory,
+    })
+
+
+def assert_matches(features, expected):
+    features = features.sort_index()
+    expected = expected.reindex(features.index)
+    np.testing.assert_array_equal(features['first_review'], expected['first_review'])
+    np.testing.assert_array_equal(features['n_reviews'], expected['n_reviews'])
+    for column in ('early_avg_rating', 'oneyear_avg_rating'):
+        np.testing.assert_allclose(features[column], expected[column], rtol=1e-6, err_msg=column)
+    np.testing.assert_array_equal(features['trajectory'].astype(str), expected['trajectory'])
+
+
+def test_one_shuffled_batch_matches_brute_force(rng):
+    reviews = random_reviews(rng)
+    engine = TrajectoryEngine(WINDOW, HORIZON, capacity=4)
+    shuffled = reviews.sample(frac=1, random_state=3)
+    engine.update(shuffled['product_id'], shuffled['timestamp'], shuffled['rating'])
+    features = engine.features()
+    assert not features['stale'].any()
+    assert_matches(features, brute_force(reviews))
+
+
+def test_batches_in_time_order_match_one_batch(rng):
+    reviews = random_reviews(rng).sort_values('timestamp')
+    engine = TrajectoryEngine(WINDOW, HORIZON, capacity=4)
+    for rows in np.array_split(np.arange(len(reviews)), 9):
+        batch = reviews.iloc[rows].sample(frac=1, random_state=1)
+        engine.update(batch['product_id'], batch['timestamp'], batch['rating'])
+    features = engine.features()
+    assert not features['stale'].any()
+    assert_matches(features, brute_force(reviews))
+
+
+def test_review_older_than_early_window_marks_product_stale(rng):
+    reviews = random_reviews(rng, n_reviews=400, n_products=4).sort_values('timestamp')
+    engine = TrajectoryEngine(WINDOW, HORIZON)
+    engine.update(reviews['product_id'], reviews['timestamp'], reviews['rating'])
+    before = engine.features()
+
+    late = reviews.groupby('product_id').head(1).iloc[:1]
+    engine.update(late['product_id'], late['timestamp'] - 1, late['rating'])
+    after = engine.features()
+    product = late['product_id'].iloc[0]
+    assert after.loc[product, 'stale']
+    assert after['stale'].sum() == 1
+    # A stale product's state is left as it was
+    pd.testing.assert_series_equal(after.loc[product].drop('stale'), before.loc[product].drop('stale'))
+
+
+def test_update_files_matches_update(rng, tmp_path):
+    reviews = random_reviews(rng)
+    path = tmp_path / 'reviews.csv'
+    reviews.sample(frac=1, random_state=5).to_csv(path, index=False)
+
+    in_memory = TrajectoryEngine(WINDOW, HORIZON)
+    in_memory.update(reviews['product_id'], reviews['timestamp'], reviews['rating'])
+    spilled = TrajectoryEngine(WINDOW, HORIZON)
+    spilled.update_files([path], chunk_size=256, partitions=5, spill_dir=tmp_path)
+    pd.testing.assert_frame_equal(spilled.features().sort_index(), in_memory.features().sort_index())
+
+
+def test_save_and_load_round_trip(rng, tmp_path):
+    reviews = random_reviews(rng)
+    engine = TrajectoryEngine(WINDOW, HORIZON)
+    engine.update(reviews['product_id'], reviews['timestamp'], reviews['rating'])
+    engine.save(tmp_path / 'state.npz')
+    loaded = TrajectoryEngine.load(tmp_path / 'state.npz')
+    assert (loaded.window, loaded.horizon) == (WINDOW, HORIZON)
+    pd.testing.assert_frame_equal(loaded.features(), engine.features())
+
+
+def test_stable_share():
+    early = np.array([4.0, 4.5, 3.0, 2.0])
+    oneyear = np.array([4.1, 4.0, 3.05, 2.5])
+    assert stable_share(early, oneyear) == 50.0
+    assert set(TRAJECTORIES) == {'Stable High', 'Stable Low', 'Recovered', 'Declined'}
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from tests.helpers import random_products
+from product_success import scoring
+from product_success.products import ProductTable
+from product_success.whatif import RATING_STEPS, VOLATILITY_STEPS, ThresholdIndex, steps
+
+
+def brute_force(products, rating, volatility, category_thresholds=None, categories=None, years=None):
+    if categories is not None:
+        products = products[products['category'].isin(categories)]
+    if years is not None:
+        products = products[products['year'].between(*years)]
+    threshold = scoring.rating_thresholds(products['category'], category_thresholds or {}, rating)
+    tiers = scoring.classify_alerts(products['early_avg_rating'].to_numpy(), products['early_rating_std'].to_numpy(),
+                                    threshold, np.float32(volatility))
+    is_failed = scoring.failed(products['oneyear_avg_rating'])
+    return np.bincount(tiers, minlength=3), np.bincount(tiers[is_failed], minlength=3)
+
+
+@pytest.fixture
+def products(rng):
+    products = random_products(rng)
+    # Ratings and volatilities sitting exactly on slider steps, plus a missing volatility
+    rating_grid, volatility_grid = steps(*RATING_STEPS), steps(*VOLATILITY_STEPS)
+    products.iloc[:len(rating_grid), products.columns.get_loc('early_avg_rating')] = rating_grid
+    products.iloc[-len(volatility_grid):, products.columns.get_loc('early_rating_std')] = volatility_grid
+    products.iloc[-len(volatility_grid) - 1, products.columns.get_loc('early_rating_std')] = np.nan
+    return products
+
+
+def test_counts_match_brute_force(rng, products):
+    index = ThresholdIndex.from_table(ProductTable.from_frame(products))
+    rating_grid, volatility_grid = steps(*RATING_STEPS), steps(*VOLATILITY_STEPS)
+    cases = [(4.0, 1.0, None, None, None)]
+    for _ in range(25):
+        rating, volatility = float(rng.choice(rating_grid)), float(rng.choice(volatility_grid))
+        cutoffs = {'Beauty': float(rng.choice(rating_grid))} if rng.random() < 0.5 else None
+        categories = ['Electronics', 'Pet Supplies'] if rng.random() < 0.5 else None
+        years = tuple(sorted(rng.integers(2014, 2022, 2).tolist())) if rng.random() < 0.5 else None
+        cases.append((rating, volatility, cutoffs, categories, years))
+
+    for rating, volatility, cutoffs, categories, years in cases:
+        per_tier, failed_per_tier = index.counts(rating, volatility, cutoffs, categories, years)
+        expected = brute_force(products, rating, volatility, cutoffs, categories, years)
+        np.testing.assert_array_equal(per_tier, expected[0])
+        np.testing.assert_array_equal(failed_per_tier, expected[1])
+        assert index.rule_metrics(rating, volatility, cutoffs, categories, years) == scoring.tier_metrics(*expected)
+
+
+def test_default_category_cutoffs(products):
+    index = ThresholdIndex.from_table(ProductTable.from_frame(products))
+    expected = scoring.alert_distribution(scoring.score_products(products, scoring.CATEGORY_THRESHOLDS))
+    result = index.alert_distribution(category_thresholds=scoring.CATEGORY_THRESHOLDS)
+    np.testing.assert_array_equal(result['value'], expected['value'])
+
+
+def test_without_categories_or_years(products):
+    index = ThresholdIndex.from_arrays(products['early_avg_rating'], products['early_rating_std'],
+                                       scoring.failed(products['oneyear_avg_rating']))
+    per_tier, failed_per_tier = index.counts(3.5, 0.75)
+    expected = brute_force(products, 3.5, 0.75)
+    np.testing.assert_array_equal(per_tier, expected[0])
+    np.testing.assert_array_equal(failed_per_tier, expected[1])
+
+
+@pytest.mark.parametrize('rating, volatility', [(4.005, 1.0), (4.0, 1.02), (2.99, 1.0), (4.0, 2.05)])
+def test_thresholds_off_the_grid_are_rejected(products, rating, volatility):
+    index = ThresholdIndex.from_table(ProductTable.from_frame(products))
+    with pytest.raises(ValueError):
+        index.counts(rating, volatility)